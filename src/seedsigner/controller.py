@@ -7,10 +7,12 @@ from embit.psbt import PSBT
 from PIL.Image import Image
 
 from seedsigner.gui.toast import BaseToastOverlayManagerThread
+from seedsigner.helpers import qr_detectors
+from seedsigner.models.partial_scan_cache import PartialScanCache
 from seedsigner.models.psbt_parser import PSBTParser
 from seedsigner.models.seed import Seed
 from seedsigner.models.seed_storage import SeedStorage
-from seedsigner.models.settings import Settings
+from seedsigner.models.settings import Settings, SettingsConstants
 from seedsigner.models.singleton import Singleton
 from seedsigner.models.threads import BaseThread
 from seedsigner.views.screensaver import ScreensaverScreen
@@ -122,6 +124,9 @@ class Controller(Singleton):
     address_explorer_data: dict = None
 
     sign_message_data: dict = None
+
+    # Interrupted animated QR scans that can be resumed
+    partial_scans: PartialScanCache = None
     # TODO: end refactor section
 
     # Destination placeholder for when we need to jump out to a side flow but intend to
@@ -163,17 +168,30 @@ class Controller(Singleton):
     def configure_instance(cls):
         from seedsigner.gui.renderer import Renderer
         from seedsigner.hardware.microsd import MicroSD
+        from seedsigner.models.qr_decode_pool import QRDecodePool
 
         # Must be called before the first get_instance() call
         if cls._instance:
             raise Exception("Instance already configured")
 
+        # Launch the QR decoding workers' forkserver before anything sensitive is in
+        # memory.
+        QRDecodePool.get_instance().start_server()
+
         # Instantiate the one and only Controller instance
         controller = cls.__new__(cls)
         cls._instance = controller
 
         # models
         controller.settings = Settings.get_instance()
+
+        # Use the QR detector engine picked by tools/qr_detector_benchmark.py, if any.
+        # Only check the saved engine; importing every backend would slow down boot.
+        qr_detector = controller.settings.get_value(SettingsConstants.SETTING__QR_DETECTOR)
+        if qr_detectors.is_detector_available(qr_detector):
+            qr_detectors.select_detector(qr_detector)
+        else:
+            logger.warning(f"QR detector {qr_detector} is not available; using the default")
         
         controller.microsd = MicroSD.get_instance()
         controller.microsd.start_detection()
@@ -182,6 +200,8 @@ class Controller(Singleton):
         controller.psbt = None
         controller.psbt_parser = None
 
+        controller.partial_scans = PartialScanCache()
+
         # Configure the Renderer
         Renderer.configure_instance()
 
@@ -12,6 +12,7 @@ from PIL import Image, ImageDraw, ImageFont, ImageFilter
 from typing import Any, List, Tuple
 
 from seedsigner.gui.renderer import Renderer
+from seedsigner.models.animation import Animation
 from seedsigner.models.settings import Settings
 from seedsigner.models.settings_definition import SettingsConstants
 from seedsigner.models.singleton import Singleton
@@ -592,9 +593,9 @@ class TextArea(BaseComponent):
             # At this point we need the visible_width to be the "actual" (yet still incorrect) width
             self.visible_width = int(self.visible_width * 0.95)
 
-        self.horizontal_text_scroll_thread: TextArea.HorizontalTextScrollThread = None
+        self.horizontal_text_scroll_animation: TextArea.HorizontalTextScrollAnimation = None
         if self.is_horizontal_scrolling_enabled:
-            self.horizontal_text_scroll_thread = TextArea.HorizontalTextScrollThread(
+            self.horizontal_text_scroll_animation = TextArea.HorizontalTextScrollAnimation(
                 rendered_text_img=self.rendered_text_img,
                 screen_x=self.screen_x + self.min_text_x,
                 screen_y=self.screen_y + self.text_y - self.text_height_above_baseline,
@@ -605,13 +606,18 @@ class TextArea(BaseComponent):
             )
 
 
-    class HorizontalTextScrollThread(BaseThread):
+    class HorizontalTextScrollAnimation(Animation):
         """
         Note that Components in general should not try to manage the Renderer.lock; we
-        leave that up to the calling Screen to manage. HOWEVER, since this renders in its
-        own thread, we lose all normal timing guarantees and therefore this thread must
-        manage the lock itself.
+        leave that up to the calling Screen to manage. The `AnimationScheduler` holds
+        the lock while it steps this animation.
+
+        Subjective opinion: on a Pi Zero, scrolling at 40px/sec looks smooth but
+        50px/sec creates a slight ghosting / doubling effect that impedes
+        readability. 45px/sec is better but still perceptually a bit stuttery.
         """
+        fps = 30
+
         def __init__(self, rendered_text_img: Image, screen_x: int, screen_y: int, visible_width: int, horizontal_scroll_speed:int, begin_hold_secs: float, end_hold_secs: float):
             super().__init__()
             self.rendered_text_img = rendered_text_img
@@ -621,13 +627,15 @@ class TextArea(BaseComponent):
             self.horizontal_scroll_speed = horizontal_scroll_speed
             self.begin_hold_secs = begin_hold_secs
             self.end_hold_secs = end_hold_secs
+            self.max_scroll = self.rendered_text_img.width - self.visible_width
 
             self.scroll_y = 0
             self.scrolling_active = True
             self.horizontal_scroll_position = 0
             self.scroll_increment_sign = 1  # flip to negative to scroll text to the right
+            self.last_render_time = None
 
-            self.renderer = Renderer.get_instance()        
+            self.renderer = Renderer.get_instance()
 
 
         def stop_scrolling(self):
@@ -638,72 +646,56 @@ class TextArea(BaseComponent):
             # Reset scroll position to left edge
             self.horizontal_scroll_position = 0
             self.scroll_increment_sign = 1
+            self.last_render_time = None
             self.scrolling_active = True
 
 
-        def run(self):
-            """
-            Subjective opinion: on a Pi Zero, scrolling at 40px/sec looks smooth but
-            50px/sec creates a slight ghosting / doubling effect that impedes
-            readability. 45px/sec is better but still perceptually a bit stuttery.
-            """
-            max_scroll = self.rendered_text_img.width - self.visible_width
-
-            while self.keep_running:
-                if not self.scrolling_active:
-                    time.sleep(0.1)
-                    continue
+        def step(self) -> list[tuple[int, int, int, int]]:
+            if not self.scrolling_active:
+                return []
 
-                with self.renderer.lock:
-                    if not self.scrolling_active:
-                        # We were stopped while waiting for the lock
-                        continue
+            if self.last_render_time is None:
+                # First frame since scrolling (re)started
+                self._hold_at_end()
+                return self._paste()
 
-                    img = self.rendered_text_img.crop((self.horizontal_scroll_position, 0, self.horizontal_scroll_position + self.visible_width, self.rendered_text_img.height))
-                    self.renderer.canvas.paste(img, (self.screen_x, self.screen_y - self.scroll_y))
-                    self.renderer.show_image()
+            next_render_time = time.time()
+            scroll_position_increment = int(self.horizontal_scroll_speed * (next_render_time - self.last_render_time))
+            if scroll_position_increment == 0:
+                # Wait to accumulate more time before scrolling
+                return []
 
-                if self.horizontal_scroll_position == 0:
-                    # Pause on initial (left-justified) position...                
-                    time.sleep(self.begin_hold_secs)
+            # Carry over the time for any fraction of a pixel so the speed stays accurate
+            self.last_render_time += scroll_position_increment / self.horizontal_scroll_speed
 
-                    # Don't count those pause seconds
-                    last_render_time = None
+            self.horizontal_scroll_position += scroll_position_increment * self.scroll_increment_sign
+            self.horizontal_scroll_position = max(0, min(self.horizontal_scroll_position, self.max_scroll))
+            if self.horizontal_scroll_position in (0, self.max_scroll):
+                self._hold_at_end()
 
-                    # Scroll the text left
-                    self.scroll_increment_sign = 1
+            return self._paste()
 
-                elif self.horizontal_scroll_position == max_scroll:
-                    # ...and slight pause at end of scroll
-                    time.sleep(self.end_hold_secs)
 
-                    # Don't count those pause seconds
-                    last_render_time = None
-
-                    # Scroll the text right
-                    self.scroll_increment_sign = -1
-                
-                else:
-                    # No need to CPU limit when running in its own thread?
-                    time.sleep(0.02)
-                
-                next_render_time = time.time()
+        def _hold_at_end(self):
+            if self.horizontal_scroll_position == 0:
+                # Pause on initial (left-justified) position, then scroll the text left
+                self.scroll_increment_sign = 1
+                hold_secs = self.begin_hold_secs
+            else:
+                # ...and slight pause at end of scroll, then scroll the text right
+                self.scroll_increment_sign = -1
+                hold_secs = self.end_hold_secs
+            self.hold(hold_secs)
 
-                if not last_render_time:
-                    # First frame when pulling off either end will move 1 pixel; have to
-                    # "get off zero" for the real increment calc logic to kick in.
-                    scroll_position_increment = 1 * self.scroll_increment_sign
-                else:
-                    scroll_position_increment = int(self.horizontal_scroll_speed * (next_render_time - last_render_time) * self.scroll_increment_sign)
+            # Don't count those pause seconds
+            self.last_render_time = time.time() + hold_secs
 
-                if abs(scroll_position_increment) > 0:
-                    self.horizontal_scroll_position += scroll_position_increment
-                    self.horizontal_scroll_position = max(0, min(self.horizontal_scroll_position, max_scroll))
 
-                    last_render_time = next_render_time
-                else:
-                    # Wait to accumulate more time before scrolling
-                    pass
+        def _paste(self) -> list[tuple[int, int, int, int]]:
+            img = self.rendered_text_img.crop((self.horizontal_scroll_position, 0, self.horizontal_scroll_position + self.visible_width, self.rendered_text_img.height))
+            screen_y = self.screen_y - self.scroll_y
+            self.renderer.canvas.paste(img, (self.screen_x, screen_y))
+            return [(self.screen_x, screen_y, self.screen_x + img.width, screen_y + img.height)]
 
 
     def render(self):
@@ -729,8 +721,8 @@ class TextArea(BaseComponent):
     def set_scroll_y(self, scroll_y: int):
         """ Used by ButtonListScreen """
         self.scroll_y = scroll_y
-        if self.horizontal_text_scroll_thread:
-            self.horizontal_text_scroll_thread.scroll_y = scroll_y
+        if self.horizontal_text_scroll_animation:
+            self.horizontal_text_scroll_animation.scroll_y = scroll_y
 
 
 
@@ -751,12 +743,12 @@ class ScrollableTextLine(TextArea):
 
     @property
     def needs_scroll(self) -> bool:
-        return self.horizontal_text_scroll_thread is not None
+        return self.horizontal_text_scroll_animation is not None
 
 
     @property
-    def scroll_thread(self) -> TextArea.HorizontalTextScrollThread:
-        return self.horizontal_text_scroll_thread
+    def scroll_animation(self) -> TextArea.HorizontalTextScrollAnimation:
+        return self.horizontal_text_scroll_animation
 
 
 
@@ -1567,19 +1559,19 @@ class Button(BaseComponent):
                         self.active_button_label = ScrollableTextLine(**self.active_button_label_kwargs)
 
                         if self.active_button_label.needs_scroll:
-                            self.threads.append(self.active_button_label.scroll_thread)
-                            self.active_button_label.scroll_thread.start()
+                            self.threads.append(self.active_button_label.scroll_animation)
+                            self.active_button_label.scroll_animation.start()
 
                     self.active_button_label.set_scroll_y(self.scroll_y)
                     self.active_button_label.render()
 
                     if self.active_button_label.needs_scroll:
                         # Activate the scrollable text line
-                        self.active_button_label.scroll_thread.start_scrolling()
+                        self.active_button_label.scroll_animation.start_scrolling()
                 
                 else:
                     if self.active_button_label and self.active_button_label.needs_scroll:
-                        self.active_button_label.scroll_thread.stop_scrolling()
+                        self.active_button_label.scroll_animation.stop_scrolling()
 
                     if not self.inactive_button_label:
                         # Just-in-time create the inactive button label
@@ -1746,9 +1738,9 @@ class TopNav(BaseComponent):
                 height_ignores_below_baseline=True,  # Consistently vertically center text, ignoring chars that render below baseline (e.g. "pqyj")
             )
             if self.title.needs_scroll:
-                # Add the scroll thread to TopNav's self.threads so it automatically runs
-                # for the life of the Component.
-                self.threads.append(self.title.scroll_thread)
+                # Add the scroll animation to TopNav's self.threads so it automatically
+                # runs for the life of the Component.
+                self.threads.append(self.title.scroll_animation)
 
 
     @property
@@ -2,6 +2,7 @@ from PIL import Image, ImageDraw
 from threading import Lock
 
 from seedsigner.hardware.ST7789 import ST7789
+from seedsigner.helpers.framebuffer import DisplayFlushThread, RGB565Framebuffer
 from seedsigner.models.singleton import ConfigurableSingleton
 
 
@@ -15,6 +16,13 @@ class Renderer(ConfigurableSingleton):
     disp = None
     lock = Lock()
 
+    # Mirrors what's currently on the display so that only the regions of the canvas
+    # that changed need to be sent.
+    framebuffer: RGB565Framebuffer = None
+
+    # Does the display transfers so that callers don't wait on them
+    flush_thread: DisplayFlushThread = None
+
 
     @classmethod
     def configure_instance(cls):
@@ -29,12 +37,28 @@ class Renderer(ConfigurableSingleton):
 
         renderer.canvas = Image.new('RGB', (renderer.canvas_width, renderer.canvas_height))
         renderer.draw = ImageDraw.Draw(renderer.canvas)
+        renderer.framebuffer = RGB565Framebuffer(renderer.canvas_width, renderer.canvas_height)
+
+        renderer.flush_thread = DisplayFlushThread(push=renderer._push)
+        renderer.flush_thread.start()
+
 
+    def show_image(self, image=None, alpha_overlay=None, show_direct=False, full_frame=False, dirty_rects=None):
+        """
+        Renders the canvas (after pasting in `image`, if specified) to the display.
 
-    def show_image(self, image=None, alpha_overlay=None, show_direct=False):
+        The display is updated in the background; use `wait_for_flush` when the
+        caller needs the update to be visible before it continues.
+
+        Only the regions that changed since the last update are sent unless
+        `full_frame` is set; `show_direct` skips the canvas entirely for video-like
+        content (e.g. the camera preview) that changes every pixel on every frame.
+        Callers that know exactly which canvas rects they changed can pass them as
+        `dirty_rects` to skip the search for changes.
+        """
         if show_direct:
             # Use the incoming image as the canvas and immediately render
-            self.disp.ShowImage(image, 0, 0)
+            self.flush_thread.submit(image.copy(), full_frame=True)
             return
 
         if alpha_overlay:
@@ -46,7 +70,28 @@ class Renderer(ConfigurableSingleton):
             # Always write to the current canvas, rather than trying to replace it
             self.canvas.paste(image)
 
-        self.disp.ShowImage(self.canvas, 0, 0)
+        self.flush(full_frame=full_frame, dirty_rects=dirty_rects)
+
+
+    def flush(self, full_frame=False, dirty_rects=None):
+        """ Queues a snapshot of the canvas to be sent to the display """
+        self.flush_thread.submit(self.canvas.copy(), full_frame=full_frame, dirty_rects=dirty_rects)
+
+
+    def wait_for_flush(self, timeout: float = None) -> bool:
+        """ Blocks until all queued updates are visible on the display """
+        return self.flush_thread.wait_until_idle(timeout)
+
+
+    def flush_cpu_time(self) -> float:
+        """ Total CPU time spent sending updates to the display """
+        return self.flush_thread.push_cpu_time
+
+
+    def _push(self, image: Image.Image, full_frame: bool, dirty_rects: list):
+        """ Sends the regions of `image` that differ from what's on the display """
+        for rect in self.framebuffer.update_from_image(image, full_frame=full_frame, dirty_rects=dirty_rects):
+            self.disp.ShowBuffer(self.framebuffer.window(rect), *rect)
 
 
     def show_image_pan(self, image, start_x, start_y, end_x, end_y, rate, alpha_overlay=None):
@@ -80,10 +125,16 @@ class Renderer(ConfigurableSingleton):
             # Always keep a copy of the current display in the canvas
             self.canvas.paste(crop)
 
-            self.disp.ShowImage(crop, 0, 0)
+            # Every pixel moves on each step of the pan; the display's transfer rate
+            # sets the pace.
+            self.flush(full_frame=True)
+            self.wait_for_flush()
 
 
 
     def display_blank_screen(self):
         self.draw.rectangle((0, 0, self.canvas_width, self.canvas_height), outline=0, fill=0)
         self.show_image()
+
+        # Usually called on exit; don't let the process end before the screen clears
+        self.wait_for_flush()
@@ -1,5 +1,4 @@
 import math
-import time
 
 from dataclasses import dataclass
 from gettext import gettext as _
@@ -9,7 +8,7 @@ from PIL import Image, ImageDraw, ImageFilter
 from seedsigner.gui.components import (BtcAmount, Icon, FontAwesomeIconConstants, IconTextLine, FormattedAddress, GUIConstants, Fonts, SeedSignerIconConstants, TextArea,
     calc_bezier_curve, linear_interp)
 from seedsigner.gui.renderer import Renderer
-from seedsigner.models.threads import BaseThread
+from seedsigner.models.animation import Animation
 
 from .screen import ButtonListScreen, ButtonOption
 
@@ -367,9 +366,9 @@ class PSBTOverviewScreen(ButtonListScreen):
         image = image.resize((self.canvas_width, chart_height), Image.Resampling.LANCZOS)
         self.paste_images.append((image.filter(ImageFilter.SHARPEN), (self.chart_x, self.chart_y)))
 
-        # Pass input and output curves to the animation thread
+        # Pass input and output curves to the animation
         self.threads.append(
-            PSBTOverviewScreen.TxExplorerAnimationThread(
+            PSBTOverviewScreen.TxExplorerAnimation(
                 inputs=input_curves,
                 outputs=output_curves,
                 supersampling_factor=ssf,
@@ -380,7 +379,9 @@ class PSBTOverviewScreen(ButtonListScreen):
 
 
 
-    class TxExplorerAnimationThread(BaseThread):
+    class TxExplorerAnimation(Animation):
+        fps = 30
+
         def __init__(self, inputs, outputs, supersampling_factor, offset_y, renderer: Renderer):
             super().__init__()
 
@@ -390,13 +391,12 @@ class PSBTOverviewScreen(ButtonListScreen):
             self.outputs = [[(int(i[0]/ssf), int(i[1]/ssf + offset_y)) for i in curve] for curve in outputs]
             self.renderer = renderer
 
+            self.pulse_color = GUIConstants.ACCENT_COLOR
+            self.reset_color = "#666"
+            self.line_width = 3
 
-        def run(self):
-            pulse_color = GUIConstants.ACCENT_COLOR
-            reset_color = "#666"
-            line_width = 3
-
-            pulses = []
+            self.pulses = []
+            self.prev_color = self.reset_color
 
             # The center bar needs to be segmented to support animation across it
             start_pt = self.inputs[0][-1]
@@ -404,9 +404,9 @@ class PSBTOverviewScreen(ButtonListScreen):
             if start_pt == end_pt:
                 # In single input the center bar width can be zeroed out.
                 # Ugly hack: Insert this line segment that will be skipped otherwise.
-                center_bar_pts = [end_pt, self.outputs[0][1]]
+                self.center_bar_pts = [end_pt, self.outputs[0][1]]
             else:
-                center_bar_pts = [
+                self.center_bar_pts = [
                     start_pt,
                     linear_interp(start_pt, end_pt, 0.25),
                     linear_interp(start_pt, end_pt, 0.50),
@@ -414,55 +414,64 @@ class PSBTOverviewScreen(ButtonListScreen):
                     end_pt,
                 ]
 
-            def draw_line_segment(curves, i, j, color):
-                # print(f"draw: {curves[0][i]} to {curves[0][j]}")
-                for points in curves:
-                    pt1 = points[i]
-                    pt2 = points[j]
-                    self.renderer.draw.line(
-                        (pt1[0], pt1[1], pt2[0], pt2[1]),
-                        fill=color,
-                        width=line_width
-                    )
-
-            prev_color = reset_color
-            while self.keep_running:
-                with self.renderer.lock:
-                    # Only generate one new pulse at a time; trailing "reset_color" pulse
-                    # erases the most recent pulse.
-                    if not pulses or (
-                        prev_color == pulse_color and pulses[-1][0] == 10):
-                        # Create a new pulse
-                        if prev_color == pulse_color:
-                            pulses.append([0, reset_color])
-                        else:
-                            pulses.append([0, pulse_color])
-                        prev_color = pulses[-1][1]
-
-                    for pulse_num, pulse in enumerate(pulses):
-                        i = pulse[0]
-                        color = pulse[1]
-                        if i < len(self.inputs[0]) - 1:
-                            # We're in the input curves
-                            draw_line_segment(self.inputs, i, i+1, color)
-                        elif i < len(self.inputs[0]) + len(center_bar_pts) - 2:
-                            # We're in the center bar
-                            index = i - len(self.inputs[0]) + 1
-                            draw_line_segment([center_bar_pts], index, index+1, color)
-                        elif i < len(self.inputs[0]) + len(center_bar_pts) - 2 + len(self.outputs[0]) - 1:
-                            index = i - (len(self.inputs[0]) + len(center_bar_pts) - 2)
-                            draw_line_segment(self.outputs, index, index+1, color)
-                        else:
-                            # This pulse is done
-                            del pulses[pulse_num]
-                            continue
-
-                        pulse[0] += 1
-
-                    self.renderer.show_image()
-
-                # No need to CPU limit when running in its own thread?
-                time.sleep(0.02)
+            # The pulses never leave the curves
+            all_pts = [pt for curve in self.inputs + self.outputs + [self.center_bar_pts] for pt in curve]
+            self.dirty_rect = (
+                int(min(pt[0] for pt in all_pts)) - self.line_width,
+                int(min(pt[1] for pt in all_pts)) - self.line_width,
+                int(max(pt[0] for pt in all_pts)) + self.line_width + 1,
+                int(max(pt[1] for pt in all_pts)) + self.line_width + 1,
+            )
+
+
+        def draw_line_segment(self, curves, i, j, color):
+            # print(f"draw: {curves[0][i]} to {curves[0][j]}")
+            for points in curves:
+                pt1 = points[i]
+                pt2 = points[j]
+                self.renderer.draw.line(
+                    (pt1[0], pt1[1], pt2[0], pt2[1]),
+                    fill=color,
+                    width=self.line_width
+                )
+
+
+        def step(self) -> list[tuple[int, int, int, int]]:
+            pulses = self.pulses
+            center_bar_pts = self.center_bar_pts
+
+            # Only generate one new pulse at a time; trailing "reset_color" pulse
+            # erases the most recent pulse.
+            if not pulses or (
+                self.prev_color == self.pulse_color and pulses[-1][0] == 10):
+                # Create a new pulse
+                if self.prev_color == self.pulse_color:
+                    pulses.append([0, self.reset_color])
+                else:
+                    pulses.append([0, self.pulse_color])
+                self.prev_color = pulses[-1][1]
+
+            for pulse_num, pulse in enumerate(pulses):
+                i = pulse[0]
+                color = pulse[1]
+                if i < len(self.inputs[0]) - 1:
+                    # We're in the input curves
+                    self.draw_line_segment(self.inputs, i, i+1, color)
+                elif i < len(self.inputs[0]) + len(center_bar_pts) - 2:
+                    # We're in the center bar
+                    index = i - len(self.inputs[0]) + 1
+                    self.draw_line_segment([center_bar_pts], index, index+1, color)
+                elif i < len(self.inputs[0]) + len(center_bar_pts) - 2 + len(self.outputs[0]) - 1:
+                    index = i - (len(self.inputs[0]) + len(center_bar_pts) - 2)
+                    self.draw_line_segment(self.outputs, index, index+1, color)
+                else:
+                    # This pulse is done
+                    del pulses[pulse_num]
+                    continue
+
+                pulse[0] += 1
+
+            return [self.dirty_rect]
 
 
 
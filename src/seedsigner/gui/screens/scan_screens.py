@@ -59,7 +59,8 @@ class ScanScreen(BaseScreen):
         self.instructions_text = "< " + _("back") + "  |  " + _(self.instructions_text)
 
         self.camera = Camera.get_instance()
-        self.camera.start_video_stream_mode(resolution=self.resolution, framerate=self.framerate, format="rgb")
+        # The decoder only needs grayscale, so capture just the luma plane
+        self.camera.start_video_stream_mode(resolution=self.resolution, framerate=self.framerate, format="yuv")
 
         self.frames_decode_status = ThreadsafeCounter()
         self.frames_decoded_counter = ThreadsafeCounter()
@@ -107,10 +108,12 @@ class ScanScreen(BaseScreen):
 
             start_time = time.time()
             num_frames = 0
+            frame_seq = 0
             debug = False
             show_framerate = False  # enable for debugging / testing
             while self.keep_running:
-                frame = self.camera.read_video_stream(as_image=True)
+                # Only render each captured frame once
+                frame_seq, frame = self.camera.read_next_video_frame(after_seq=frame_seq, timeout=0.1, as_image=True, image_size=(self.render_width, self.render_height))
                 if frame is not None:
                     num_frames += 1
                     cur_time = time.time()
@@ -254,38 +257,57 @@ class ScanScreen(BaseScreen):
         """
         from seedsigner.hardware.buttons import HardwareButtonsConstants
         from seedsigner.models.decode_qr import DecodeQRStatus
+        from seedsigner.models.qr_decode_pool import QRDecodePool
+
+        # On multi-core boards zbar runs in worker processes for the duration of the
+        # scan; single core decodes inline in this thread.
+        decode_pool = QRDecodePool.get_instance()
+        decode_pool.start()
 
         num_frames = 0
+        frame_seq = 0
         start_time = time.time()
-        while True:
-            frame = self.camera.read_video_stream()
-            if frame is not None:
-                status = self.decoder.add_image(frame)
+        try:
+            while True:
+                # Blocks until the camera has captured a frame we haven't decoded yet
+                frame_seq, frame = self.camera.read_next_video_frame(after_seq=frame_seq, timeout=0.1)
+                if decode_pool.is_enabled:
+                    if frame is not None:
+                        # Dropped if the workers are still busy with earlier frames
+                        decode_pool.submit(frame_seq, frame, self.decoder.search_ladder.plan(frame, qr_type=self.decoder.qr_type))
+                    statuses = [self.decoder.add_search_result(result) for result_seq, result in decode_pool.get_results()]
+                elif frame is not None:
+                    statuses = [self.decoder.add_image(frame)]
+                else:
+                    statuses = []
 
-                num_frames += 1
-                decoder_fps = f"{num_frames / (time.time() - start_time):0.2f}"
-                self.threads[0].decoder_fps = decoder_fps
+                for status in statuses:
+                    num_frames += 1
+                    decoder_fps = f"{num_frames / (time.time() - start_time):0.2f}"
+                    self.threads[0].decoder_fps = decoder_fps
 
-                if status in (DecodeQRStatus.COMPLETE, DecodeQRStatus.INVALID):
-                    self.camera.stop_video_stream_mode()
-                    break
+                    if status in (DecodeQRStatus.COMPLETE, DecodeQRStatus.INVALID):
+                        self.camera.stop_video_stream_mode()
+                        return
 
-                self.frames_decoded_counter.increment()
-                # Notify the live preview thread how our most recent decode went
-                if status == DecodeQRStatus.FALSE:
-                    # Did not find anything to decode in the current frame
-                    self.frames_decode_status.set_value(self.FRAME__MISS)
+                    self.frames_decoded_counter.increment()
+                    # Notify the live preview thread how our most recent decode went
+                    if status == DecodeQRStatus.FALSE:
+                        # Did not find anything to decode in the current frame
+                        self.frames_decode_status.set_value(self.FRAME__MISS)
 
-                else:
-                    if status == DecodeQRStatus.PART_COMPLETE:
-                        # We received a valid frame that added new data
-                        self.frames_decode_status.set_value(self.FRAME__ADDED_PART)
-
-                    elif status == DecodeQRStatus.PART_EXISTING:
-                        # We received a valid frame, but we've already seen in
-                        self.frames_decode_status.set_value(self.FRAME__REPEATED_PART)
-                
-                if self.hw_inputs.check_for_low(HardwareButtonsConstants.KEY_RIGHT) or self.hw_inputs.check_for_low(HardwareButtonsConstants.KEY_LEFT):
-                    self.camera.stop_video_stream_mode()
-                    break
+                    else:
+                        if status == DecodeQRStatus.PART_COMPLETE:
+                            # We received a valid frame that added new data
+                            self.frames_decode_status.set_value(self.FRAME__ADDED_PART)
 
+                        elif status == DecodeQRStatus.PART_EXISTING:
+                            # We received a valid frame, but we've already seen in
+                            self.frames_decode_status.set_value(self.FRAME__REPEATED_PART)
+
+                if frame is not None:
+                    if self.hw_inputs.check_for_low(HardwareButtonsConstants.KEY_RIGHT) or self.hw_inputs.check_for_low(HardwareButtonsConstants.KEY_LEFT):
+                        self.camera.stop_video_stream_mode()
+                        return
+        finally:
+            decode_pool.stop()
@@ -12,9 +12,11 @@ from seedsigner.gui.components import (GUIConstants,
     SeedSignerIconConstants, TopNav, TextArea, load_image)
 from seedsigner.gui.keyboard import Keyboard, TextEntryDisplay
 from seedsigner.hardware.buttons import HardwareButtonsConstants, HardwareButtons
+from seedsigner.models.animation import Animation
 from seedsigner.models.encode_qr import BaseQrEncoder
+from seedsigner.models.qr_frame_cache import QRFrameCache
 from seedsigner.models.settings import SettingsConstants
-from seedsigner.models.threads import BaseThread, ThreadsafeCounter
+from seedsigner.models.threads import BaseThread, FramePacer, ThreadsafeCounter
 
 logger = logging.getLogger(__name__)
 
@@ -134,33 +136,44 @@ class BaseScreen(BaseComponent):
 
 
 
-class LoadingScreenThread(BaseThread):
+class LoadingScreenAnimation(Animation):
+    """ Full screen spinner shown while a View does slow work (e.g. parsing a PSBT) """
+    fps = 10
+    report_cpu_usage = True
+
     def __init__(self, text: str = None):
         super().__init__()
-        self.text =text
-
+        self.text = text
 
-    def run(self):
         from seedsigner.gui.renderer import Renderer
-        renderer: Renderer = Renderer.get_instance()
-
-        center_image = load_image("btc_logo_60x60.png")
-        orbit_gap = 2*GUIConstants.COMPONENT_PADDING
-        bounding_box = (
-            int((renderer.canvas_width - center_image.width)/2 - orbit_gap),
-            int((renderer.canvas_height - center_image.height)/2 - orbit_gap),
-            int((renderer.canvas_width + center_image.width)/2 + orbit_gap),
-            int((renderer.canvas_height + center_image.height)/2 + orbit_gap),
+        self.renderer: Renderer = Renderer.get_instance()
+
+        self.center_image = load_image("btc_logo_60x60.png")
+        self.orbit_gap = 2*GUIConstants.COMPONENT_PADDING
+        self.bounding_box = (
+            int((self.renderer.canvas_width - self.center_image.width)/2 - self.orbit_gap),
+            int((self.renderer.canvas_height - self.center_image.height)/2 - self.orbit_gap),
+            int((self.renderer.canvas_width + self.center_image.width)/2 + self.orbit_gap),
+            int((self.renderer.canvas_height + self.center_image.height)/2 + self.orbit_gap),
         )
-        position = 0
-        arc_sweep = 45
-        arc_color = "#ff9416"
-        arc_trailing_color = "#80490b"
+        self.position = 0
+        self.arc_sweep = 45
+        self.arc_color = "#ff9416"
+        self.arc_trailing_color = "#80490b"
+        self.is_screen_drawn = False
+
+
+    def step(self) -> List[Tuple[int, int, int, int]]:
+        renderer = self.renderer
+        bounding_box = self.bounding_box
 
-        # Need to flush the screen
-        with renderer.lock:
+        # Normally only the spinner changes
+        dirty_rects = [(bounding_box[0], bounding_box[1], bounding_box[2] + 1, bounding_box[3] + 1)]
+
+        if not self.is_screen_drawn:
+            # Need to flush the screen
             renderer.draw.rectangle((0, 0, renderer.canvas_width, renderer.canvas_height), fill=GUIConstants.BACKGROUND_COLOR)
-            renderer.canvas.paste(center_image, (bounding_box[0] + orbit_gap, bounding_box[1] + orbit_gap))
+            renderer.canvas.paste(self.center_image, (bounding_box[0] + self.orbit_gap, bounding_box[1] + self.orbit_gap))
 
             if self.text:
                 TextArea(
@@ -168,38 +181,38 @@ class LoadingScreenThread(BaseThread):
                     font_size=GUIConstants.get_top_nav_title_font_size(),
                     screen_y=int((renderer.canvas_height - bounding_box[3])/2),
                 ).render()
+            self.is_screen_drawn = True
+            dirty_rects = [(0, 0, renderer.canvas_width, renderer.canvas_height)]
+
+        # Render leading arc
+        renderer.draw.arc(
+            bounding_box,
+            start=self.position,
+            end=self.position + self.arc_sweep,
+            fill=self.arc_color,
+            width=GUIConstants.COMPONENT_PADDING
+        )
 
-        while self.keep_running:
-            with renderer.lock:
-                # Render leading arc
-                renderer.draw.arc(
-                    bounding_box,
-                    start=position,
-                    end=position + arc_sweep,
-                    fill=arc_color,
-                    width=GUIConstants.COMPONENT_PADDING
-                )
-
-                # Render trailing arc
-                renderer.draw.arc(
-                    bounding_box,
-                    start=position - arc_sweep,
-                    end=position,
-                    fill=arc_trailing_color,
-                    width=GUIConstants.COMPONENT_PADDING
-                )
-
-                # Erase previous trailing arc leading arc
-                renderer.draw.arc(
-                    bounding_box,
-                    start=position - 2*arc_sweep,
-                    end=position - arc_sweep,
-                    fill=GUIConstants.BACKGROUND_COLOR,
-                    width=GUIConstants.COMPONENT_PADDING
-                )
-
-                renderer.show_image()
-            position += arc_sweep
+        # Render trailing arc
+        renderer.draw.arc(
+            bounding_box,
+            start=self.position - self.arc_sweep,
+            end=self.position,
+            fill=self.arc_trailing_color,
+            width=GUIConstants.COMPONENT_PADDING
+        )
+
+        # Erase previous trailing arc leading arc
+        renderer.draw.arc(
+            bounding_box,
+            start=self.position - 2*self.arc_sweep,
+            end=self.position - self.arc_sweep,
+            fill=GUIConstants.BACKGROUND_COLOR,
+            width=GUIConstants.COMPONENT_PADDING
+        )
+        self.position += self.arc_sweep
+
+        return dirty_rects
 
 
 
@@ -713,16 +726,21 @@ class LargeButtonScreen(BaseTopNavScreen):
 @dataclass
 class QRDisplayScreen(BaseScreen):
     qr_encoder: BaseQrEncoder = None
+    target_fps: float = 6.0
 
     class QRDisplayThread(BaseThread):
-        def __init__(self, qr_encoder: BaseQrEncoder, qr_brightness: ThreadsafeCounter, tips_start_time: ThreadsafeCounter):
+        def __init__(self, qr_encoder: BaseQrEncoder, qr_brightness: ThreadsafeCounter, tips_start_time: ThreadsafeCounter, frame_cache: QRFrameCache, target_fps: float):
             from seedsigner.gui.renderer import Renderer
             super().__init__()
             self.qr_encoder = qr_encoder
+            self.frame_cache = frame_cache
             self.qr_brightness = qr_brightness
             self.renderer = Renderer.get_instance()
             self.tips_start_time = tips_start_time
 
+            # Animated QR frames are presented on a fixed schedule; see `FramePacer`
+            self.pacer = FramePacer(target_fps)
+
 
         def render_brightness_tip(self, image: Image.Image) -> None:
             # TODO: Refactor ToastOverlay to support two lines of icon + text and use
@@ -805,6 +823,7 @@ class QRDisplayScreen(BaseScreen):
             cur_brightness_setting = settings.get_value(SettingsConstants.SETTING__QR_BRIGHTNESS_TIPS)
             is_brightness_tip_enabled = cur_brightness_setting == SettingsConstants.OPTION__ENABLED
             pending_encoder_restart = False
+            frame_num = 0
 
             # Loop whether the QR is a single frame or animated; each loop might adjust
             # brightness setting.
@@ -812,26 +831,35 @@ class QRDisplayScreen(BaseScreen):
                 # convert the self.qr_brightness integer (31-255) into hex triplets
                 hex_color = (hex(self.qr_brightness.cur_count).split('x')[1]) * 3
 
-                # Display the brightness tips toast
+                # Prepare the next frame ahead of its deadline; it's usually already
+                # rendered by the `QRFrameCache.FillThread`.
                 duration = 10 ** 9 * 1.2  # 1.2 seconds
-                if is_brightness_tip_enabled and time.time_ns() - self.tips_start_time.cur_count < duration:
-                    image = self.qr_encoder.part_to_image(self.qr_encoder.cur_part(), 240, 240, border=2, background_color=hex_color)
+                is_showing_tip = is_brightness_tip_enabled and time.time_ns() - self.tips_start_time.cur_count < duration
+                if is_showing_tip:
+                    # Hold the current frame; the tip is alpha-blended so needs full color
+                    image = self.frame_cache.get_frame(frame_num, hex_color).convert("RGBA")
                     self.render_brightness_tip(image)
                     pending_encoder_restart = True
                 else:
-                    # Only advance the QR animation when the brightness tip is not displayed
                     if pending_encoder_restart:
                         # Animated QRs should restart their frame sequence after the
                         # brightness tip is stowed.
-                        self.qr_encoder.restart()
+                        frame_num = 0
                         pending_encoder_restart = False
-                    image = self.qr_encoder.next_part_image(240, 240, border=2, background_color=hex_color)
+                    image = self.frame_cache.get_frame(frame_num, hex_color)
+
+                num_frames_elapsed = self.pacer.wait()
 
                 with self.renderer.lock:
-                    self.renderer.show_image(image)
+                    # Animated QR frames change nearly every pixel; skip the search
+                    # for the regions that changed.
+                    self.renderer.show_image(image, full_frame=self.frame_cache.num_frames > 1)
 
-                # Target n held frames per second before rendering next QR image
-                time.sleep(5 / 30.0)
+                if not is_showing_tip:
+                    # Only advance the QR animation when the brightness tip is not
+                    # displayed. If we fell behind, skip the frames that are already
+                    # overdue rather than slowing the animation down.
+                    frame_num = (frame_num + num_frames_elapsed) % self.frame_cache.num_frames
 
 
     def __post_init__(self):
@@ -844,11 +872,19 @@ class QRDisplayScreen(BaseScreen):
             initial_value=settings.get_value(SettingsConstants.SETTING__QR_BRIGHTNESS))
         self.tips_start_time = ThreadsafeCounter(initial_value=time.time_ns())
 
-        self.threads.append(QRDisplayScreen.QRDisplayThread(
+        # Renders upcoming frames in the background so animated QRs can be replayed at
+        # full speed.
+        frame_cache = QRFrameCache(self.qr_encoder, width=240, height=240, border=2)
+        self.threads.append(frame_cache.fill_thread)
+
+        self.display_thread = QRDisplayScreen.QRDisplayThread(
             qr_encoder=self.qr_encoder,
             qr_brightness=self.qr_brightness,
-            tips_start_time=self.tips_start_time
-        ))
+            tips_start_time=self.tips_start_time,
+            frame_cache=frame_cache,
+            target_fps=self.target_fps,
+        )
+        self.threads.append(self.display_thread)
 
 
     def _run(self):
@@ -875,14 +911,20 @@ class QRDisplayScreen(BaseScreen):
 
             else:
                 # Any other input exits the screen
-                self.threads[-1].stop()
-                while self.threads[-1].is_alive():
+                self.display_thread.stop()
+                while self.display_thread.is_alive():
                     time.sleep(0.01)
                 break
 
         Settings.get_instance().set_value(SettingsConstants.SETTING__QR_BRIGHTNESS, self.qr_brightness.cur_count)
 
 
+    @property
+    def achieved_fps(self) -> float:
+        """ The QR animation's actual frame rate, measured over recent frames """
+        return self.display_thread.pacer.achieved_fps
+
+
 
 @dataclass
 class LargeIconStatusScreen(ButtonListScreen):
@@ -935,67 +977,70 @@ class LargeIconStatusScreen(ButtonListScreen):
 
 
 
-class WarningEdgesThread(BaseThread):
-    def __init__(self, args):
+class WarningEdgesAnimation(Animation):
+    """ Pulses the screen's edges in its `status_color` """
+    # Target ~10fps
+    fps = 10
+
+    def __init__(self, screen: "WarningEdgesMixin"):
         super().__init__()
-        self.args = args
-
-
-    def run(self):
-        screen = self.args[0]
-        inhale_step = 1
-        inhale_max = 10
-        inhale_hold = 8
-        cur_inhale_hold = 0
-        inhale_factor = 0
-        rgb = ImageColor.getrgb(screen.status_color)
-
-        def render_border(color, width):
-            screen.image_draw.rectangle(
-                (0, 0, screen.canvas_width, screen.canvas_height),
-                fill=None,
-                outline=color,
-                width=width,
-                # radius=5
-            )
+        self.screen = screen
+        self.inhale_step = 1
+        self.inhale_max = 10
+        self.inhale_hold = 8
+        self.cur_inhale_hold = 0
+        self.inhale_factor = 0
+        self.rgb = ImageColor.getrgb(screen.status_color)
+
+
+    def render_border(self, color, width):
+        self.screen.image_draw.rectangle(
+            (0, 0, self.screen.canvas_width, self.screen.canvas_height),
+            fill=None,
+            outline=color,
+            width=width,
+            # radius=5
+        )
 
-        try:
-            while self.keep_running:
-                with screen.renderer.lock:
-                    # Ramp the edges from a darker version out to full color
-                    inhale_scalar = inhale_factor * int(255/inhale_max)
-                    for index, n in enumerate(range(4, -1, -1)):
-                        # Reverse range steadily increases rgb in brightness until reaching full.
-                        # 34 == 0x22; just eyeballed a good step size
-
-                        r = max(0, rgb[0] - 34*n - inhale_scalar)
-                        g = max(0, rgb[1] - 34*n - inhale_scalar)
-                        b = max(0, rgb[2] - 34*n - inhale_scalar)
-
-                        # `index` shrinks the border at each step
-                        render_border((r, g, b), GUIConstants.EDGE_PADDING - 2 - index)
-
-                    # Write the screen updates
-                    screen.renderer.show_image()
-                
-                if inhale_factor == inhale_max:
-                    inhale_step = -1
-                elif inhale_factor == 0 and inhale_step == -1:
-                    cur_inhale_hold += 1
-                    if cur_inhale_hold > inhale_hold:
-                        inhale_step = 1
-                        cur_inhale_hold = 0
-                    else:
-                        # It's about to be decremented below zero
-                        inhale_factor = 1
-                inhale_factor += inhale_step
 
-                # Target ~10fps
-                time.sleep(0.05)
+    def step(self) -> List[Tuple[int, int, int, int]]:
+        rgb = self.rgb
 
-        except KeyboardInterrupt as e:
-            self.stop()
-            raise e
+        # Ramp the edges from a darker version out to full color
+        inhale_scalar = self.inhale_factor * int(255/self.inhale_max)
+        for index, n in enumerate(range(4, -1, -1)):
+            # Reverse range steadily increases rgb in brightness until reaching full.
+            # 34 == 0x22; just eyeballed a good step size
+
+            r = max(0, rgb[0] - 34*n - inhale_scalar)
+            g = max(0, rgb[1] - 34*n - inhale_scalar)
+            b = max(0, rgb[2] - 34*n - inhale_scalar)
+
+            # `index` shrinks the border at each step
+            self.render_border((r, g, b), GUIConstants.EDGE_PADDING - 2 - index)
+
+        if self.inhale_factor == self.inhale_max:
+            self.inhale_step = -1
+        elif self.inhale_factor == 0 and self.inhale_step == -1:
+            self.cur_inhale_hold += 1
+            if self.cur_inhale_hold > self.inhale_hold:
+                self.inhale_step = 1
+                self.cur_inhale_hold = 0
+            else:
+                # It's about to be decremented below zero
+                self.inhale_factor = 1
+        self.inhale_factor += self.inhale_step
+
+        # Just the four edges changed
+        width = self.screen.canvas_width
+        height = self.screen.canvas_height
+        edge = GUIConstants.EDGE_PADDING
+        return [
+            (0, 0, width, edge),
+            (0, edge, edge, height - edge),
+            (width - edge, edge, width, height - edge),
+            (0, height - edge, width, height),
+        ]
 
 
 
@@ -1007,7 +1052,7 @@ class WarningEdgesMixin:
     def __post_init__(self):
         super().__post_init__()
 
-        self.threads.append(WarningEdgesThread(args=(self,)))
+        self.threads.append(WarningEdgesAnimation(self))
 
 
 
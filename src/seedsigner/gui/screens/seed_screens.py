@@ -13,6 +13,8 @@ from seedsigner.gui.components import (Button, FontAwesomeIconConstants, Fonts,
     IconTextLine, SeedSignerIconConstants, TextArea, GUIConstants, reflow_text_into_pages)
 from seedsigner.gui.keyboard import Keyboard, TextEntryDisplay
 from seedsigner.gui.renderer import Renderer
+from seedsigner.models.seed import Seed
+from seedsigner.models.settings import SettingsConstants
 from seedsigner.models.threads import BaseThread, ThreadsafeCounter
 
 from .screen import RET_CODE__BACK_BUTTON, BaseScreen, BaseTopNavScreen, ButtonListScreen, ButtonOption, KeyboardScreen, LargeIconStatusScreen, WarningEdgesMixin
@@ -24,12 +26,13 @@ logger = logging.getLogger(__name__)
 @dataclass
 class SeedMnemonicEntryScreen(BaseTopNavScreen):
     initial_letters: list = None
-    wordlist: list = None
+    wordlist_language_code: str = SettingsConstants.WORDLIST_LANGUAGE__ENGLISH
 
     def __post_init__(self):
         super().__post_init__()
 
         self.possible_alphabet = "abcdefghijklmnopqrstuvwxyz"
+        self.wordlist_index = Seed.get_wordlist_index(self.wordlist_language_code)
 
         # Set up the keyboard params
         self.keyboard_width = 128
@@ -141,7 +144,7 @@ class SeedMnemonicEntryScreen(BaseTopNavScreen):
 
 
     def calc_possible_words(self):
-        self.possible_words = [i for i in self.wordlist if i.startswith("".join(self.letters).strip())]
+        self.possible_words = self.wordlist_index.words_starting_with("".join(self.letters).strip())
         self.selected_possible_words_index = 0        
 
 
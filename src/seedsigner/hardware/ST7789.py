@@ -132,16 +132,16 @@ class ST7789(object):
     def SetWindows(self, Xstart, Ystart, Xend, Yend):
         #set the X coordinates
         self.command(0x2A)
-        self.data(0x00)               #Set the horizontal starting point to the high octet
+        self.data(Xstart >> 8)        #Set the horizontal starting point to the high octet
         self.data(Xstart & 0xff)      #Set the horizontal starting point to the low octet
-        self.data(0x00)               #Set the horizontal end to the high octet
+        self.data((Xend - 1) >> 8)    #Set the horizontal end to the high octet
         self.data((Xend - 1) & 0xff) #Set the horizontal end to the low octet 
         
         #set the Y coordinates
         self.command(0x2B)
-        self.data(0x00)
+        self.data(Ystart >> 8)
         self.data((Ystart & 0xff))
-        self.data(0x00)
+        self.data((Yend - 1) >> 8)
         self.data((Yend - 1) & 0xff )
 
         self.command(0x2C)    
@@ -149,15 +149,20 @@ class ST7789(object):
     def ShowImage(self,Image,Xstart,Ystart):
         """Set buffer to value of Python Imaging Library image."""
         """Write display buffer to physical display"""
+        """Image may be smaller than the display to only update the window it covers"""
         imwidth, imheight = Image.size
-        if imwidth != self.width or imheight != self.height:
-            raise ValueError('Image must be same dimensions as display \
+        if Xstart < 0 or Ystart < 0 or Xstart + imwidth > self.width or Ystart + imheight > self.height:
+            raise ValueError('Image must fit within the display \
                 ({0}x{1}).' .format(self.width, self.height))
         # convert 24-bit RGB-8:8:8 to gBRG-3:5:5:3; then per-pixel byteswap to 16-bit RGB-5:6:5
         arr = array.array("H", Image.convert("BGR;16").tobytes())
         arr.byteswap()
         pix = arr.tobytes()
-        self.SetWindows ( 0, 0, self.width, self.height)
+        self.ShowBuffer(pix, Xstart, Ystart, Xstart + imwidth, Ystart + imheight)
+
+    def ShowBuffer(self, pix, Xstart, Ystart, Xend, Yend):
+        """Write 16-bit RGB-5:6:5 (big-endian) pixel data to a window of the display"""
+        self.SetWindows ( Xstart, Ystart, Xend, Yend)
         GPIO.output(self._dc,GPIO.HIGH)
         self._spi.writebytes2(pix)	
         
@@ -37,9 +37,40 @@ class Camera(Singleton):
         if not as_image:
             return frame
         else:
-            if frame is not None:
-                return Image.fromarray(frame.astype('uint8'), 'RGB').convert('RGBA').rotate(90 + self._camera_rotation)
-        return None
+            return self._frame_to_image(frame)
+
+
+    def read_next_video_frame(self, after_seq: int = 0, timeout: float = None, as_image=False, image_size: tuple[int, int] = None):
+        """
+        Blocks until there's a frame newer than `after_seq` and returns
+        (frame_seq, frame). Pass the returned frame_seq back in on the next call to
+        process each captured frame exactly once. On timeout returns (after_seq, None).
+
+        `image_size` lets luma-only ("yuv") frames be scaled down before they're
+        expanded to RGBA for display.
+        """
+        video_stream = self._video_stream
+        if not video_stream:
+            raise Exception("Must call start_video_stream first.")
+        frame_seq, frame_timestamp, frame = video_stream.read_next(after_seq=after_seq, timeout=timeout)
+        if as_image:
+            frame = self._frame_to_image(frame, image_size=image_size)
+        return (frame_seq, frame)
+
+
+    def _frame_to_image(self, frame, image_size: tuple[int, int] = None):
+        if frame is None:
+            return None
+
+        if frame.ndim == 2:
+            # Luma plane from the "yuv" capture format; only convert to RGBA once it's
+            # been scaled to display resolution.
+            image = Image.fromarray(frame, 'L')
+            if image_size and image.size != image_size:
+                image = image.resize(image_size, resample=Image.NEAREST)
+            return image.rotate(90 + self._camera_rotation).convert('RGBA')
+
+        return Image.fromarray(frame.astype('uint8'), 'RGB').convert('RGBA').rotate(90 + self._camera_rotation)
 
 
     def stop_video_stream_mode(self):
@@ -1,21 +1,40 @@
 # import the necessary packages
 import logging
-from picamera.array import PiRGBArray
+import numpy as np
+from picamera.array import PiArrayOutput, PiRGBArray, raw_resolution
 from picamera import PiCamera
-from threading import Thread
+from threading import Condition, Thread
 import time
 
 logger = logging.getLogger(__name__)
 
 
+
+class PiLumaArray(PiArrayOutput):
+	"""
+	Captures unencoded YUV420 frames but only exposes the Y (luma) plane as a 2D
+	uint8 array: grayscale for free, no RGB conversion and a third of the bytes.
+	"""
+	def flush(self):
+		super().flush()
+		width, height = self.size or self.camera.resolution
+		# The camera pads the raw frame dimensions
+		fwidth, fheight = raw_resolution((width, height))
+		y_plane = np.frombuffer(self.getvalue(), dtype=np.uint8, count=fwidth * fheight)
+		self.array = y_plane.reshape((fheight, fwidth))[:height, :width]
+
+
 # Modified from: https://github.com/jrosebr1/imutils
 class PiVideoStream:
 	def __init__(self, resolution=(320, 240), framerate=32, format="bgr", **kwargs):
 		# initialize the camera
 		self.camera = PiCamera(resolution=resolution, framerate=framerate, **kwargs)
 
-		# initialize the stream
-		self.rawCapture = PiRGBArray(self.camera, size=resolution)
+		# initialize the stream; "yuv" captures just the luma plane (see PiLumaArray)
+		if format == "yuv":
+			self.rawCapture = PiLumaArray(self.camera, size=resolution)
+		else:
+			self.rawCapture = PiRGBArray(self.camera, size=resolution)
 		self.stream = self.camera.capture_continuous(self.rawCapture,
 			format=format, use_video_port=True)
 
@@ -25,6 +44,12 @@ class PiVideoStream:
 		self.should_stop = False
 		self.is_stopped = True
 
+		# Each captured frame gets the next sequence id (starting at 1) and the time
+		# it was captured so consumers can tell new frames from ones they've seen.
+		self.frame_seq = 0
+		self.frame_timestamp = None
+		self._new_frame = Condition()
+
 	def start(self):
 		# start the thread to read frames from the video stream
 		t = Thread(target=self.update, args=())
@@ -38,7 +63,11 @@ class PiVideoStream:
 		for f in self.stream:
 			# grab the frame from the stream and clear the stream in
 			# preparation for the next frame
-			self.frame = f.array
+			with self._new_frame:
+				self.frame = f.array
+				self.frame_seq += 1
+				self.frame_timestamp = time.time()
+				self._new_frame.notify_all()
 			self.rawCapture.truncate(0)
 
 			# if the thread indicator variable is set, stop the thread
@@ -50,12 +79,28 @@ class PiVideoStream:
 				self.camera.close()
 				self.should_stop = False
 				self.is_stopped = True
+
+				# wake up anyone still waiting in `read_next`
+				with self._new_frame:
+					self._new_frame.notify_all()
 				return
 
 	def read(self):
 		# return the frame most recently read
 		return self.frame
 
+	def read_next(self, after_seq: int = 0, timeout: float = None):
+		"""
+		Blocks until a frame newer than `after_seq` is available (or `timeout`
+		seconds pass, or the stream stops) and returns (frame_seq, frame_timestamp,
+		frame). On timeout returns (after_seq, None, None).
+		"""
+		with self._new_frame:
+			self._new_frame.wait_for(lambda: self.frame_seq > after_seq or self.is_stopped or self.should_stop, timeout=timeout)
+			if self.frame_seq > after_seq:
+				return (self.frame_seq, self.frame_timestamp, self.frame)
+		return (after_seq, None, None)
+
 	def stop(self):
 		# indicate that the thread should be stopped
 		self.should_stop = True
@@ -0,0 +1,130 @@
+from typing import List, Tuple, Union
+from PIL import Image, ImageChops
+
+"""
+Finds the regions of a display image that changed since it was last pushed, so that
+only those windows need to be sent to the display.
+
+Rects are (left, top, right, bottom) with exclusive right/bottom, like PIL's boxes.
+"""
+
+Rect = Tuple[int, int, int, int]
+
+# Dirty pixels are first located on a coarse grid of tiles; each group of dirty tiles
+# is then tightened down to the exact changed pixels.
+TILE_SIZE = 16
+
+# Each window costs a few extra display commands; past this many it's cheaper to send
+# the bounding box of all the changes.
+MAX_DIRTY_RECTS = 6
+
+# When most tiles changed there's nothing to gain from finding the exact pixels
+MOSTLY_DIRTY_FRACTION = 0.5
+
+
+# Maps any nonzero channel difference to fully dirty before tiles are averaged
+_DIRTY_LUT = [0] + [255] * 255
+
+
+def find_dirty_rects(previous: Image.Image, current: Image.Image, tile_size: Union[int, Tuple[int, int]] = TILE_SIZE, max_rects: int = MAX_DIRTY_RECTS) -> List[Rect]:
+    """
+    Returns the rects that differ between two same-sized images (RGB or single
+    channel); an empty list if they're identical.
+
+    `tile_size` may be a (width, height) tuple, e.g. for a single channel view of
+    2-byte pixels.
+    """
+    diff = ImageChops.difference(previous, current)
+
+    # Single channel mask of every pixel that changed in any channel, then averaged
+    # down to one value per tile: any nonzero tile has at least one dirty pixel. Each
+    # axis is reduced separately so that a lone dirty pixel can't round down to zero.
+    mask = diff.point(_DIRTY_LUT * len(diff.getbands()))
+    if mask.mode == "RGB":
+        r, g, b = mask.split()
+        mask = ImageChops.lighter(ImageChops.lighter(r, g), b)
+    if isinstance(tile_size, int):
+        tile_size = (tile_size, tile_size)
+    tile_width, tile_height = tile_size
+    tiles = mask.reduce((tile_width, 1)).point(_DIRTY_LUT).reduce((1, tile_height))
+    tiles_bbox = tiles.getbbox()
+    if not tiles_bbox:
+        return []
+
+    tiles_width, tiles_height = tiles.size
+    tile_data = tiles.tobytes()
+    if len(tile_data) - tile_data.count(0) >= MOSTLY_DIRTY_FRACTION * len(tile_data):
+        left, top, right, bottom = tiles_bbox
+        return [(left * tile_width, top * tile_height, min(right * tile_width, diff.width), min(bottom * tile_height, diff.height))]
+
+    # Find the runs of dirty tiles in each row of tiles; a run that lines up with one
+    # in the row above extends that rect downwards.
+    rects = []
+    open_rects = {}
+    for tile_y in range(tiles_height):
+        row = tile_data[tile_y * tiles_width:(tile_y + 1) * tiles_width]
+        spans = []
+        tile_x = 0
+        while tile_x < tiles_width:
+            if row[tile_x]:
+                start = tile_x
+                while tile_x < tiles_width and row[tile_x]:
+                    tile_x += 1
+                spans.append((start, tile_x))
+            tile_x += 1
+
+        next_open_rects = {}
+        for span in spans:
+            if span in open_rects:
+                rect = open_rects.pop(span)
+                rect[3] = tile_y + 1
+            else:
+                rect = [span[0], tile_y, span[1], tile_y + 1]
+            next_open_rects[span] = rect
+        rects += open_rects.values()
+        open_rects = next_open_rects
+    rects += open_rects.values()
+
+    if len(rects) > max_rects:
+        return [diff.getbbox()]
+
+    dirty_rects = []
+    for left, top, right, bottom in rects:
+        left *= tile_width
+        top *= tile_height
+        tile_box = (left, top, min(right * tile_width, diff.width), min(bottom * tile_height, diff.height))
+        x0, y0, x1, y1 = diff.crop(tile_box).getbbox()
+        dirty_rects.append((left + x0, top + y0, left + x1, top + y1))
+    return sorted(dirty_rects, key=lambda rect: (rect[1], rect[0]))
+
+
+
+def merge_rects(rects: List[Rect], max_rects: int = MAX_DIRTY_RECTS) -> List[Rect]:
+    """
+    Combines overlapping rects (e.g. the changes from several animations in the same
+    display update). Falls back to their bounding box if there are still too many.
+    """
+    merged = []
+    for rect in rects:
+        if rect[0] >= rect[2] or rect[1] >= rect[3]:
+            continue
+        i = 0
+        while i < len(merged):
+            other = merged[i]
+            if rect[0] < other[2] and other[0] < rect[2] and rect[1] < other[3] and other[1] < rect[3]:
+                # Absorb it and recheck the rest against the grown rect
+                merged.pop(i)
+                rect = (min(rect[0], other[0]), min(rect[1], other[1]), max(rect[2], other[2]), max(rect[3], other[3]))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+
+    if len(merged) > max_rects:
+        return [(
+            min(rect[0] for rect in merged),
+            min(rect[1] for rect in merged),
+            max(rect[2] for rect in merged),
+            max(rect[3] for rect in merged),
+        )]
+    return sorted(merged, key=lambda rect: (rect[1], rect[0]))
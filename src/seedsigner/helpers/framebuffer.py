@@ -0,0 +1,225 @@
+import array
+import logging
+import time
+from threading import Condition
+from typing import Callable, List
+from PIL import Image
+
+from seedsigner.helpers.dirty_rects import Rect, TILE_SIZE, find_dirty_rects, merge_rects
+from seedsigner.models.threads import BaseThread
+
+logger = logging.getLogger(__name__)
+
+
+
+def to_rgb565(image: Image.Image) -> array.array:
+    """ Converts an RGB image to the display's native big-endian 16-bit RGB-5:6:5 """
+    # convert 24-bit RGB-8:8:8 to gBRG-3:5:5:3; then per-pixel byteswap to 16-bit RGB-5:6:5
+    pixels = array.array("H", image.convert("BGR;16").tobytes())
+    pixels.byteswap()
+    return pixels
+
+
+
+class RGB565Framebuffer:
+    """
+    Mirror of the display's contents in its native pixel format.
+
+    Each update converts the incoming frame once, finds the windows that differ from
+    what the display is already showing and copies just those into the framebuffer.
+    The windows can then be written to the display straight out of the framebuffer.
+    """
+    BYTES_PER_PIXEL = 2
+
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.stride = width * self.BYTES_PER_PIXEL
+        self.buffer = bytearray(self.stride * height)
+        self.view = memoryview(self.buffer)
+
+        # Nothing is known about the display's contents until the first full frame
+        self.is_current = False
+
+        # Single channel view that shares the buffer's memory, two "pixels" per real
+        # pixel, so that changes can be found with PIL's C-level image ops.
+        self._byte_image = self._as_byte_image(self.buffer)
+
+
+    def _as_byte_image(self, data) -> Image.Image:
+        return Image.frombuffer("L", (self.stride, self.height), data, "raw", "L", 0, 1)
+
+
+    def update(self, rgb565, full_frame: bool = False, dirty_rects: List[Rect] = None) -> List[Rect]:
+        """
+        Brings the framebuffer up to date with a full frame of RGB-5:6:5 pixel data
+        and returns the (pixel) rects that changed.
+
+        If the caller already knows which rects changed, pass them as `dirty_rects` to
+        skip searching the whole frame for changes.
+        """
+        if full_frame or not self.is_current:
+            self.view[:] = memoryview(rgb565).cast("B")
+            self.is_current = True
+            return [(0, 0, self.width, self.height)]
+
+        if dirty_rects is not None:
+            rects = self._clip_rects(dirty_rects)
+
+        else:
+            if self.buffer == rgb565:
+                return []
+
+            rects = []
+            byte_rects = find_dirty_rects(
+                self._byte_image,
+                self._as_byte_image(rgb565),
+                tile_size=(TILE_SIZE * self.BYTES_PER_PIXEL, TILE_SIZE),
+            )
+            for left, top, right, bottom in byte_rects:
+                # Snap to whole pixels
+                rects.append((left // self.BYTES_PER_PIXEL, top, -(-right // self.BYTES_PER_PIXEL), bottom))
+
+        source = memoryview(rgb565).cast("B")
+        for left, top, right, bottom in rects:
+            left *= self.BYTES_PER_PIXEL
+            right *= self.BYTES_PER_PIXEL
+            for y in range(top, bottom):
+                start = y * self.stride
+                self.view[start + left:start + right] = source[start + left:start + right]
+        return rects
+
+
+    def update_from_image(self, image: Image.Image, full_frame: bool = False, dirty_rects: List[Rect] = None) -> List[Rect]:
+        """
+        Same as `update` but takes the frame as an RGB image. With `dirty_rects`, only
+        those regions of the image are converted to RGB-5:6:5.
+        """
+        if full_frame or not self.is_current or dirty_rects is None:
+            return self.update(to_rgb565(image), full_frame=full_frame)
+
+        rects = self._clip_rects(dirty_rects)
+        for left, top, right, bottom in rects:
+            source = memoryview(to_rgb565(image.crop((left, top, right, bottom)))).cast("B")
+            row_len = (right - left) * self.BYTES_PER_PIXEL
+            for y in range(top, bottom):
+                start = y * self.stride + left * self.BYTES_PER_PIXEL
+                offset = (y - top) * row_len
+                self.view[start:start + row_len] = source[offset:offset + row_len]
+        return rects
+
+
+    def _clip_rects(self, dirty_rects: List[Rect]) -> List[Rect]:
+        """ Merges overlapping rects and clips them to the screen """
+        rects = []
+        for left, top, right, bottom in merge_rects(dirty_rects):
+            rect = (max(left, 0), max(top, 0), min(right, self.width), min(bottom, self.height))
+            if rect[0] < rect[2] and rect[1] < rect[3]:
+                rects.append(rect)
+        return rects
+
+
+    def window(self, rect: Rect) -> memoryview:
+        """
+        Returns the pixel data for the rect in display write order: a slice of the
+        framebuffer itself if the rect spans full rows, otherwise a copy.
+        """
+        left, top, right, bottom = rect
+        if left == 0 and right == self.width:
+            return self.view[top * self.stride:bottom * self.stride]
+
+        return memoryview(b"".join(
+            self.view[y * self.stride + left * self.BYTES_PER_PIXEL:y * self.stride + right * self.BYTES_PER_PIXEL]
+            for y in range(top, bottom)
+        ))
+
+
+
+class DisplayFlushThread(BaseThread):
+    """
+    Sends frames to the display in the background so that callers neither wait on
+    the display transfer nor hold the `Renderer.lock` during it.
+
+    Callers composite into the back buffer (the canvas) and `submit` a snapshot of
+    it; the thread pushes the newest snapshot. Frames submitted while a push is in
+    progress are coalesced so that only the latest is sent; the ones it replaced
+    are counted as dropped.
+    """
+    def __init__(self, push: Callable[[Image.Image, bool, List[Rect]], None]):
+        super().__init__()
+        self.push = push
+        self._condition = Condition()
+
+        # (image, full_frame, dirty_rects, time of the oldest request it supersedes)
+        self._pending = None
+        self._is_pushing = False
+
+        self.frames_submitted = 0
+        self.frames_pushed = 0
+        self.frames_dropped = 0
+
+        # CPU time spent in `push`
+        self.push_cpu_time = 0.0
+
+        # Seconds from when a frame was submitted until it was on the display
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self.total_latency = 0.0
+
+
+    @property
+    def average_latency(self) -> float:
+        return self.total_latency / self.frames_pushed if self.frames_pushed else 0.0
+
+
+    def submit(self, image: Image.Image, full_frame: bool = False, dirty_rects: List[Rect] = None):
+        """
+        Queues `image` (which must not be modified afterwards) for display. See
+        `RGB565Framebuffer.update` for `dirty_rects`.
+        """
+        with self._condition:
+            requested_at = time.perf_counter()
+            if self._pending is not None:
+                # Superseded before it was sent; the replacement inherits its wait and
+                # must also cover whatever it changed.
+                _, pending_full_frame, pending_dirty_rects, requested_at = self._pending
+                full_frame = full_frame or pending_full_frame
+                if dirty_rects is not None and pending_dirty_rects is not None:
+                    dirty_rects = pending_dirty_rects + dirty_rects
+                else:
+                    dirty_rects = None
+                self.frames_dropped += 1
+            self._pending = (image, full_frame, dirty_rects, requested_at)
+            self.frames_submitted += 1
+            self._condition.notify_all()
+
+
+    def wait_until_idle(self, timeout: float = None) -> bool:
+        """ Blocks until every submitted frame is on the display """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending is None and not self._is_pushing, timeout)
+
+
+    def run(self):
+        while self.keep_running:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None)
+                image, full_frame, dirty_rects, requested_at = self._pending
+                self._pending = None
+                self._is_pushing = True
+
+            cpu_start = time.thread_time()
+            try:
+                self.push(image, full_frame, dirty_rects)
+            except Exception as e:
+                logger.exception(e)
+
+            with self._condition:
+                self._is_pushing = False
+                self.push_cpu_time += time.thread_time() - cpu_start
+                self.frames_pushed += 1
+                self.last_latency = time.perf_counter() - requested_at
+                self.max_latency = max(self.max_latency, self.last_latency)
+                self.total_latency += self.last_latency
+                self._condition.notify_all()
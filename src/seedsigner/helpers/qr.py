@@ -1,8 +1,481 @@
+import logging
+import re
 import qrcode
+from bisect import bisect_left
+from operator import itemgetter
 from qrcode.image.styledpil import StyledPilImage
 from qrcode.image.styles.moduledrawers import CircleModuleDrawer, GappedSquareModuleDrawer
 from PIL import Image, ImageDraw
-import subprocess
+
+logger = logging.getLogger(__name__)
+
+
+
+class QRSymbolLayout:
+    """
+    Precomputed module layout for one QR version / error correction level.
+
+    Everything that doesn't depend on the payload is built once per version and then
+    reused for every frame: the Reed-Solomon generators, the function patterns, the
+    format info for each of the eight masks, the module placement order and the mask
+    patterns themselves. A frame is then assembled with a handful of C-level
+    bytes/big-int operations instead of walking the matrix in python.
+
+    Segmentation (see `segments`), version fitting and mask selection all follow
+    libqrencode, the `qrencode` CLI that the display screens used to shell out to, so
+    that frames come out module for module the same as `qrencode -l L`'s;
+    `tools/qr_render_benchmark.py --verify` checks that where the CLI is installed.
+    """
+    _cache = {}
+
+    # libqrencode penalty weights (see libqrencode's mask.c)
+    N1 = 3
+    N2 = 3
+    N3 = 40
+    N4 = 10
+
+    def __init__(self, version: int, error_correction: int):
+        self.version = version
+        self.error_correction = error_correction
+        self.width = width = version * 4 + 17
+        self.num_modules = width * width
+
+        # Error correction blocks; each distinct EC length gets a lookup table of the
+        # generator polynomial pre-multiplied by every possible feedback byte.
+        self.rs_blocks = [(block.data_count, block.total_count - block.data_count) for block in qrcode.base.rs_blocks(version, error_correction)]
+        self.bit_limit = sum(data_count for data_count, _ in self.rs_blocks) * 8
+        self._ec_tables = {}
+        for _, ec_count in self.rs_blocks:
+            if ec_count not in self._ec_tables:
+                self._ec_tables[ec_count] = self._generator_table(ec_count)
+
+        # Let `qrcode` lay out the function patterns; modules left as None are
+        # available for data.
+        qr = qrcode.QRCode(version=version, error_correction=error_correction)
+        qr.modules_count = width
+        qr.modules = [[None] * width for _ in range(width)]
+        qr.setup_position_probe_pattern(0, 0)
+        qr.setup_position_probe_pattern(width - 7, 0)
+        qr.setup_position_probe_pattern(0, width - 7)
+        qr.setup_position_adjust_pattern()
+        qr.setup_timing_pattern()
+        if version >= 7:
+            qr.setup_type_number(False)
+        blank = [row[:] for row in qr.modules]
+
+        # Per-mask function pattern frames (format info differs per mask)
+        self.base_frames = []
+        for mask_pattern in range(8):
+            qr.modules = [row[:] for row in blank]
+            qr.setup_type_info(False, mask_pattern)
+            self.base_frames.append(int.from_bytes(
+                bytes(1 if module else 0 for row in qr.modules for module in row), "big"))
+        modules = qr.modules
+
+        # Data module placement order; mirrors `QRCode.map_data`
+        self.data_positions = []
+        row = width - 1
+        inc = -1
+        for col in range(width - 1, 0, -2):
+            if col <= 6:
+                col -= 1
+            while True:
+                for c in (col, col - 1):
+                    if modules[row][c] is None:
+                        self.data_positions.append(row * width + c)
+                row += inc
+                if row < 0 or width <= row:
+                    row -= inc
+                    inc = -inc
+                    break
+        num_data_modules = len(self.data_positions)
+
+        # Scatter map from placement order into the flat frame; non-data modules
+        # pull a zero from just past the end of the bit string.
+        gather = [num_data_modules] * self.num_modules
+        for i, position in enumerate(self.data_positions):
+            gather[position] = i
+        self._gather = itemgetter(*gather)
+
+        self.mask_frames = []
+        for mask_pattern in range(8):
+            mask_func = qrcode.util.mask_func(mask_pattern)
+            flips = bytearray(self.num_modules)
+            for position in self.data_positions:
+                if mask_func(position // width, position % width):
+                    flips[position] = 1
+            self.mask_frames.append(int.from_bytes(flips, "big"))
+
+        # 0x01 markers for every module that has a neighbor above and to its left;
+        # used to score 2x2 blocks across the whole frame at once.
+        self._n2_blocks = int.from_bytes(
+            bytes(1 if i >= width and i % width else 0 for i in range(self.num_modules)), "big")
+
+        # 1:1:3:1:1 finder-like patterns at each module scale that fits in a line
+        self._n3_patterns = [
+            (f, b"\x01" * f + b"\x00" * f + b"\x01" * (3*f) + b"\x00" * f + b"\x01" * f, b"\x00" * (4*f))
+            for f in range(1, width // 7 + 1)
+        ]
+
+
+    @classmethod
+    def get(cls, version: int, error_correction: int) -> "QRSymbolLayout":
+        key = (version, error_correction)
+        if key not in cls._cache:
+            cls._cache[key] = cls(version, error_correction)
+        return cls._cache[key]
+
+
+    @staticmethod
+    def segments(data) -> list:
+        """
+        Splits `data` into numeric, alphanumeric and 8-bit segments the way
+        libqrencode's `Split_splitString` does for the `qrencode` CLI (case-sensitive,
+        no Kanji). Unlike `qrcode`'s `optimal_data_chunks`, it only switches modes
+        where its bit cost estimate says that's shorter.
+        """
+        data = qrcode.util.to_bytestring(data)
+        data_list = []
+        start = 0
+        while start < len(data):
+            mode = _split_mode(data, start)
+            if mode == qrcode.util.MODE_NUMBER:
+                mode, length = _split_number(data, start)
+            elif mode == qrcode.util.MODE_ALPHA_NUM:
+                mode, length = _split_alpha_num(data, start)
+            else:
+                mode, length = _split_8bit(data, start)
+            data_list.append(qrcode.util.QRData(data[start:start + length], mode=mode, check_data=False))
+            start += length
+        return data_list
+
+
+    @staticmethod
+    def split_for_version(data_list: list, version: int) -> list:
+        """
+        Splits any segment that's too long for `version`'s length indicator into
+        maximum-length segments, like libqrencode's `QRinput_encodeBitStream`.
+        """
+        mode_sizes = qrcode.util.mode_sizes_for_version(version)
+        split = []
+        for data in data_list:
+            max_length = (1 << mode_sizes[data.mode]) - 1
+            if len(data) <= max_length:
+                split.append(data)
+            else:
+                for i in range(0, len(data), max_length):
+                    split.append(qrcode.util.QRData(data.data[i:i + max_length], mode=data.mode, check_data=False))
+        return split
+
+
+    @staticmethod
+    def fit_version(data_list: list, error_correction: int) -> int:
+        """
+        Smallest version that holds `data_list`; equivalent to `QRCode.best_fit` when
+        no segment needs `split_for_version`.
+        """
+        version = 1
+        while True:
+            mode_sizes = qrcode.util.mode_sizes_for_version(version)
+            num_bits = 0
+            for data in QRSymbolLayout.split_for_version(data_list, version):
+                num_bits += 4 + mode_sizes[data.mode] + _segment_bits(data.mode, len(data))
+
+            fitted = bisect_left(qrcode.util.BIT_LIMIT_TABLE[error_correction], num_bits, version)
+            if fitted == 41:
+                raise qrcode.exceptions.DataOverflowError()
+            if qrcode.util.mode_sizes_for_version(fitted) is mode_sizes:
+                return fitted
+            version = fitted
+
+
+    @staticmethod
+    def capacity(version: int, mode: int, error_correction: int) -> int:
+        """ Max length of a single `mode` data segment that fits in `version` """
+        num_bits = qrcode.util.BIT_LIMIT_TABLE[error_correction][version] - 4 - qrcode.util.mode_sizes_for_version(version)[mode]
+        if mode == qrcode.util.MODE_NUMBER:
+            return (num_bits // 10) * 3 + (0, 0, 0, 0, 1, 1, 1, 2, 2, 2)[num_bits % 10]
+        elif mode == qrcode.util.MODE_ALPHA_NUM:
+            return (num_bits // 11) * 2 + (1 if num_bits % 11 >= 6 else 0)
+        else:
+            return num_bits // 8
+
+
+    @staticmethod
+    def _generator_table(ec_count: int) -> list[int]:
+        exp = qrcode.base.EXP_TABLE
+        log = qrcode.base.LOG_TABLE
+        generator = [1]
+        for i in range(ec_count):
+            # multiply by (x - a^i)
+            generator = [
+                (generator[j] if j < len(generator) else 0) ^ (exp[(log[generator[j - 1]] + i) % 255] if 0 < j and generator[j - 1] else 0)
+                for j in range(len(generator) + 1)
+            ]
+
+        table = [0]
+        for factor in range(1, 256):
+            table.append(int.from_bytes(bytes(
+                exp[(log[factor] + log[coefficient]) % 255] if coefficient else 0
+                for coefficient in generator[1:]
+            ), "big"))
+        return table
+
+
+    def codewords(self, data_list: list) -> bytes:
+        """ Equivalent to `qrcode.util.create_data`, after `split_for_version` """
+        mode_sizes = qrcode.util.mode_sizes_for_version(self.version)
+        bits = 0
+        num_bits = 0
+        for data in self.split_for_version(data_list, self.version):
+            bits = (bits << 4 | data.mode) << mode_sizes[data.mode] | len(data)
+            num_bits += 4 + mode_sizes[data.mode]
+            chars = data.data
+            if data.mode == qrcode.util.MODE_NUMBER:
+                for i in range(0, len(chars), 3):
+                    chunk = chars[i:i + 3]
+                    bit_length = qrcode.util.NUMBER_LENGTH[len(chunk)]
+                    bits = bits << bit_length | int(chunk)
+                    num_bits += bit_length
+            elif data.mode == qrcode.util.MODE_ALPHA_NUM:
+                values = chars.translate(_ALPHA_NUM_VALUES)
+                for i in range(0, len(values) - 1, 2):
+                    bits = bits << 11 | values[i] * 45 + values[i + 1]
+                num_bits += (len(values) // 2) * 11
+                if len(values) % 2:
+                    bits = bits << 6 | values[-1]
+                    num_bits += 6
+            else:
+                bits = bits << 8 * len(chars) | int.from_bytes(chars, "big")
+                num_bits += 8 * len(chars)
+
+        if num_bits > self.bit_limit:
+            raise qrcode.exceptions.DataOverflowError(
+                f"Code length overflow. Data size ({num_bits}) > size available ({self.bit_limit})")
+
+        # Terminator and byte alignment
+        padding = min(self.bit_limit - num_bits, 4)
+        padding += (8 - (num_bits + padding) % 8) % 8
+        data_bytes = (bits << padding).to_bytes((num_bits + padding) // 8, "big")
+        data_bytes += _PAD_BYTES * ((self.bit_limit // 8 - len(data_bytes)) // 2 + 1)
+        data_bytes = data_bytes[:self.bit_limit // 8]
+
+        # Reed-Solomon per block, then interleave
+        data_blocks = []
+        ec_blocks = []
+        offset = 0
+        for data_count, ec_count in self.rs_blocks:
+            block = data_bytes[offset:offset + data_count]
+            offset += data_count
+            table = self._ec_tables[ec_count]
+            shift = 8 * (ec_count - 1)
+            register_mask = (1 << 8 * ec_count) - 1
+            register = 0
+            for byte in block:
+                register = ((register << 8) & register_mask) ^ table[byte ^ (register >> shift)]
+            data_blocks.append(block)
+            ec_blocks.append(register.to_bytes(ec_count, "big"))
+
+        return _interleave(data_blocks) + _interleave(ec_blocks)
+
+
+    def data_frame(self, codewords: bytes) -> int:
+        """ Place the codewords' bits into an unmasked, data-only frame """
+        num_bits = len(codewords) * 8
+        bits = bin(int.from_bytes(codewords, "big") | (1 << num_bits))[3:].encode()
+        bits = bits.translate(_BITS_TO_MODULES).ljust(len(self.data_positions) + 1, b"\x00")
+        return int.from_bytes(bytes(self._gather(bits)), "big")
+
+
+    def frame(self, data_frame: int, mask_pattern: int) -> bytes:
+        """ Returns the final symbol as one byte per module (1 = dark) """
+        return ((data_frame ^ self.mask_frames[mask_pattern]) | self.base_frames[mask_pattern]).to_bytes(self.num_modules, "big")
+
+
+    def penalty(self, frame: bytes) -> int:
+        """ libqrencode's `Mask_mask` / `Mask_evaluateSymbol` demerit score """
+        width = self.width
+
+        # N4: proportion of dark modules
+        bratio = (200 * frame.count(1) + self.num_modules) // self.num_modules // 2
+        demerit = (abs(bratio - 50) // 5) * self.N4
+
+        # N2: 2x2 blocks of the same color. Shifting by one byte compares each module
+        # with its left neighbor; by one row, with the module above it.
+        modules = int.from_bytes(frame, "big")
+        same_as_left = ~(modules ^ (modules >> 8))
+        same_as_above = ~(modules ^ (modules >> 8 * width))
+        blocks = same_as_left & (same_as_left >> 8 * width) & same_as_above & self._n2_blocks
+        demerit += blocks.bit_count() * self.N2
+
+        rows = b"\x02".join(frame[y * width:(y + 1) * width] for y in range(width))
+        cols = b"\x02".join(frame[x::width] for x in range(width))
+        for lines in (rows, cols):
+            # N1: runs of five or more same-color modules score (run length - 2)
+            for runs in (_N1_LIGHT_RUNS, _N1_DARK_RUNS):
+                for run in runs.findall(lines):
+                    demerit += self.N1 + len(run) - 5
+
+            # N3: dark:light:dark:light:dark 1:1:3:1:1 runs bordered by >=4 light modules
+            # on either side. Like libqrencode, the symbol edge counts as light.
+            for f, pattern, quiet in self._n3_patterns:
+                start = lines.find(pattern)
+                while start != -1:
+                    end = start + len(pattern)
+                    if lines[start - 1:start] != b"\x01" and lines[end:end + 1] != b"\x01":
+                        line_start = lines.rfind(b"\x02", 0, start) + 1
+                        line_end = lines.find(b"\x02", end)
+                        if line_end == -1:
+                            line_end = len(lines)
+                        before = lines[line_start:start]
+                        after = lines[end:line_end]
+                        if 1 not in before or before.endswith(quiet) or 1 not in after or after.startswith(quiet):
+                            demerit += self.N3
+                    start = lines.find(pattern, start + 1)
+
+        return demerit
+
+
+    def best_frame(self, codewords: bytes) -> bytes:
+        data_frame = self.data_frame(codewords)
+        best = None
+        min_demerit = None
+        for mask_pattern in range(8):
+            frame = self.frame(data_frame, mask_pattern)
+            demerit = self.penalty(frame)
+            if min_demerit is None or demerit < min_demerit:
+                min_demerit = demerit
+                best = frame
+        return best
+
+
+
+def _segment_bits(mode: int, length: int) -> int:
+    """ Size of a segment's data, without its mode and length indicators """
+    if mode == qrcode.util.MODE_NUMBER:
+        return (length // 3) * 10 + (0, 4, 7)[length % 3]
+    elif mode == qrcode.util.MODE_ALPHA_NUM:
+        return (length // 2) * 11 + (length % 2) * 6
+    return length * 8
+
+
+# Port of libqrencode's split.c, which picks the segments for `QRSymbolLayout.segments`.
+# Each `_split_*` takes the segment starting at `start` and returns its (mode, length).
+# libqrencode splits before it knows the version, so the mode switch costs always use
+# the version 1-9 length indicators.
+_NUMBER_LENGTH_BITS, _ALPHA_NUM_LENGTH_BITS, _8BIT_LENGTH_BITS = (
+    qrcode.util.MODE_SIZE_SMALL[mode] for mode in (qrcode.util.MODE_NUMBER, qrcode.util.MODE_ALPHA_NUM, qrcode.util.MODE_8BIT_BYTE)
+)
+_DIGITS = frozenset(b"0123456789")
+_ALPHA_NUM = frozenset(qrcode.util.ALPHA_NUM)
+
+
+def _split_mode(data: bytes, i: int) -> int:
+    # `Split_identifyMode`; None past the end of the data
+    if i >= len(data):
+        return None
+    elif data[i] in _DIGITS:
+        return qrcode.util.MODE_NUMBER
+    elif data[i] in _ALPHA_NUM:
+        return qrcode.util.MODE_ALPHA_NUM
+    return qrcode.util.MODE_8BIT_BYTE
+
+
+def _run_end(data: bytes, i: int, chars: frozenset) -> int:
+    while i < len(data) and data[i] in chars:
+        i += 1
+    return i
+
+
+def _split_number(data: bytes, start: int) -> tuple[int, int]:
+    # `Split_eatNum`
+    end = _run_end(data, start, _DIGITS)
+    run = end - start
+    mode = _split_mode(data, end)
+    if mode == qrcode.util.MODE_8BIT_BYTE:
+        dif = (_segment_bits(qrcode.util.MODE_NUMBER, run) + 4 + _NUMBER_LENGTH_BITS
+            + _segment_bits(mode, 1) - _segment_bits(mode, run + 1))
+        if dif > 0:
+            return _split_8bit(data, start)
+    if mode == qrcode.util.MODE_ALPHA_NUM:
+        dif = (_segment_bits(qrcode.util.MODE_NUMBER, run) + 4 + _NUMBER_LENGTH_BITS
+            + _segment_bits(mode, 1) - _segment_bits(mode, run + 1))
+        if dif > 0:
+            return _split_alpha_num(data, start)
+    return qrcode.util.MODE_NUMBER, run
+
+
+def _split_alpha_num(data: bytes, start: int) -> tuple[int, int]:
+    # `Split_eatAn`
+    end = start
+    while end < len(data) and data[end] in _ALPHA_NUM:
+        if data[end] in _DIGITS:
+            digits_end = _run_end(data, end, _DIGITS)
+            dif = (_segment_bits(qrcode.util.MODE_ALPHA_NUM, end - start)
+                + _segment_bits(qrcode.util.MODE_NUMBER, digits_end - end) + 4 + _NUMBER_LENGTH_BITS
+                # libqrencode costs switching back with the numeric length indicator too
+                + (4 + _NUMBER_LENGTH_BITS if _split_mode(data, digits_end) == qrcode.util.MODE_ALPHA_NUM else 0)
+                - _segment_bits(qrcode.util.MODE_ALPHA_NUM, digits_end - start))
+            if dif < 0:
+                break
+            end = digits_end
+        else:
+            end += 1
+
+    run = end - start
+    if _split_mode(data, end) == qrcode.util.MODE_8BIT_BYTE:
+        dif = (_segment_bits(qrcode.util.MODE_ALPHA_NUM, run) + 4 + _ALPHA_NUM_LENGTH_BITS
+            + _segment_bits(qrcode.util.MODE_8BIT_BYTE, 1) - _segment_bits(qrcode.util.MODE_8BIT_BYTE, run + 1))
+        if dif > 0:
+            return _split_8bit(data, start)
+    return qrcode.util.MODE_ALPHA_NUM, run
+
+
+def _split_8bit(data: bytes, start: int) -> tuple[int, int]:
+    # `Split_eat8`
+    end = start + 1
+    while end < len(data):
+        mode = _split_mode(data, end)
+        if mode == qrcode.util.MODE_8BIT_BYTE:
+            end += 1
+            continue
+
+        if mode == qrcode.util.MODE_NUMBER:
+            run_end = _run_end(data, end, _DIGITS)
+            length_bits = _NUMBER_LENGTH_BITS
+        else:
+            run_end = _run_end(data, end, _ALPHA_NUM)
+            length_bits = _ALPHA_NUM_LENGTH_BITS
+        switch_back = 4 + _8BIT_LENGTH_BITS if _split_mode(data, run_end) == qrcode.util.MODE_8BIT_BYTE else 0
+        dif = (_segment_bits(qrcode.util.MODE_8BIT_BYTE, end - start)
+            + _segment_bits(mode, run_end - end) + 4 + length_bits + switch_back
+            - _segment_bits(qrcode.util.MODE_8BIT_BYTE, run_end - start))
+        if dif < 0:
+            break
+        end = run_end
+    return qrcode.util.MODE_8BIT_BYTE, end - start
+
+
+
+def _interleave(blocks: list[bytes]) -> bytes:
+    result = bytearray()
+    for i in range(max(len(block) for block in blocks)):
+        for block in blocks:
+            if i < len(block):
+                result.append(block[i])
+    return bytes(result)
+
+
+
+_BITS_TO_MODULES = bytes.maketrans(b"01", b"\x00\x01")
+_N1_LIGHT_RUNS = re.compile(b"\x00\x00\x00\x00\x00+")
+_N1_DARK_RUNS = re.compile(b"\x01\x01\x01\x01\x01+")
+_PAD_BYTES = bytes([qrcode.util.PAD0, qrcode.util.PAD1])
+_ALPHA_NUM_VALUES = bytes.maketrans(qrcode.util.ALPHA_NUM, bytes(range(len(qrcode.util.ALPHA_NUM))))
+# Palette indexes for `QR.qrimage_paletted`: dark modules are 0, light modules are 1
+_MODULES_TO_PALETTE = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+
+
 
 class QR:
     STYLE__DEFAULT = 1
@@ -90,18 +563,58 @@ class QR:
                 ).resize((width,height)).convert('RGBA')
 
 
-    def qrimage_io(self, data, width=240, height=240, border=3, background_color="808080"):
-        if 1 <= border <= 10:
-            border_str = str(border)
-        else:
-            border_str = "3"
+    def qrmatrix(self, data, error_correction=qrcode.constants.ERROR_CORRECT_L) -> tuple[int, bytes]:
+        """
+        Encodes `data` entirely in-process and returns the symbol's module width along
+        with its modules as one byte per module (1 = dark), row-major, no border. The
+        symbol is the same as `qrencode -l L`'s (see `QRSymbolLayout`).
+        """
+        try:
+            data_list = QRSymbolLayout.segments(data)
+            version = QRSymbolLayout.fit_version(data_list, error_correction)
+            layout = QRSymbolLayout.get(version, error_correction)
+            return layout.width, layout.best_frame(layout.codewords(data_list))
+        except Exception as e:
+            # if the fast encoder fails, fall back to the qrcode library's own encoder
+            logger.exception(e)
+            qr = qrcode.QRCode(error_correction=error_correction)
+            qr.add_data(data)
+            qr.make(fit=True)
+            return qr.modules_count, bytes(1 if module else 0 for row in qr.modules for module in row)
 
-        cmd = f"""qrencode -m {border_str} -s 3 -l L --foreground=000000 --background={background_color} -t PNG -o "/tmp/qrcode.png" "{str(data)}" """
-        rv = subprocess.call(cmd, shell=True)
 
-        # if qrencode fails, fall back to only encoder
-        if rv != 0:
-            return self.qrimage(data,width,height,border)
-        img = Image.open("/tmp/qrcode.png").resize((width,height), Image.Resampling.NEAREST).convert("RGBA")
+    def qrimage_paletted(self, data, width=240, height=240, border=3, background_color="ffffff") -> Image.Image:
+        """
+        Renders `data` as a display-sized paletted ("P" mode) image with a
+        `border`-module quiet zone. Palette index 0 is the (black) dark modules and 1 is
+        the background; see `set_background_color`.
+        """
+        if not 1 <= border <= 10:
+            border = 3
+        modules_width, frame = self.qrmatrix(data)
 
-        return img
+        symbol = Image.frombytes("P", (modules_width, modules_width), frame.translate(_MODULES_TO_PALETTE))
+        size = modules_width + 2*border
+        image = Image.new("P", (size, size), 1)
+        image.paste(symbol, (border, border))
+        image = image.resize((width, height), Image.Resampling.NEAREST)
+        QR.set_background_color(image, background_color)
+        return image
+
+
+    @staticmethod
+    def set_background_color(image: Image.Image, background_color: str):
+        """
+        Recolors a `qrimage_paletted` image's background in place by swapping its
+        palette; no re-encoding or re-rasterizing needed.
+        """
+        image.putpalette(b"\x00\x00\x00" + bytes.fromhex(background_color))
+
+
+    def qrimage_io(self, data, width=240, height=240, border=3, background_color="808080"):
+        """
+        Fast QR rendering for the QR display screens. Produces the same symbols as
+        the `qrencode -l L` subprocess it replaces, without spawning a process or
+        round-tripping a PNG through /tmp.
+        """
+        return self.qrimage_paletted(data, width, height, border, background_color).convert("RGBA")
@@ -0,0 +1,213 @@
+"""
+Pluggable QR detection/decoding engines for `DecodeQR.extract_qr_data`.
+
+zbar (via pyzbar) is the default. Other engines are only used if they've been
+installed locally and explicitly selected, either directly via `select_detector` or
+by benchmarking the available engines against a reference corpus with
+`select_fastest_detector` (see tools/qr_detector_benchmark.py). The tool can save its
+pick as `SETTING__QR_DETECTOR`, which the `Controller` applies at startup.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+
+
+class BaseQRDetector:
+    # Unique key used to register and select the detector
+    name: str = None
+
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """ Can this engine's dependencies be imported on this system? """
+        raise Exception("Not implemented in child class")
+
+
+    def detect(self, image, is_binary: bool = False) -> List:
+        """
+        Returns the payloads of every QR code found in `image` (a PIL Image or a
+        numpy array from the camera). Payloads are `bytes` if `is_binary` else `str`.
+        """
+        raise Exception("Not implemented in child class")
+
+
+    def locate(self, image, is_binary: bool = False) -> List[Tuple]:
+        """
+        Same as `detect` but returns (payload, rect) pairs, where rect is the QR's
+        (left, top, right, bottom) bounding box in `image` or None if the engine
+        doesn't report where it found the QR.
+        """
+        return [(payload, None) for payload in self.detect(image, is_binary=is_binary)]
+
+
+
+class ZbarQRDetector(BaseQRDetector):
+    name = "zbar"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            # pyzbar raises ImportError if the libzbar shared library is missing
+            from pyzbar import pyzbar
+            return True
+        except ImportError:
+            return False
+
+
+    def detect(self, image, is_binary: bool = False) -> List:
+        return [payload for payload, rect in self.locate(image, is_binary=is_binary)]
+
+
+    def locate(self, image, is_binary: bool = False) -> List[Tuple]:
+        from pyzbar import pyzbar
+        from pyzbar.pyzbar import ZBarSymbol
+        return [
+            (barcode.data, (barcode.rect.left, barcode.rect.top, barcode.rect.left + barcode.rect.width, barcode.rect.top + barcode.rect.height))
+            for barcode in pyzbar.decode(image, symbols=[ZBarSymbol.QRCODE], binary=is_binary)
+        ]
+
+
+
+class OpenCVQRDetector(BaseQRDetector):
+    """
+    OpenCV's built-in QR detector. Note that it returns text, so binary payloads
+    (e.g. CompactSeedQR) that aren't valid UTF-8 can't be recovered.
+    """
+    name = "opencv"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            import cv2
+            return True
+        except ImportError:
+            return False
+
+
+    def __init__(self):
+        import cv2
+        self._detector = cv2.QRCodeDetector()
+
+
+    def detect(self, image, is_binary: bool = False) -> List:
+        return [payload for payload, rect in self.locate(image, is_binary=is_binary)]
+
+
+    def locate(self, image, is_binary: bool = False) -> List[Tuple]:
+        import numpy as np
+        data, points, _ = self._detector.detectAndDecode(np.asarray(image))
+        if not data:
+            return []
+        rect = None
+        if points is not None:
+            xs, ys = points.reshape(-1, 2).T
+            rect = (int(xs.min()), int(ys.min()), int(xs.max()) + 1, int(ys.max()) + 1)
+        return [(data.encode() if is_binary else data, rect)]
+
+
+
+class ZXingCppQRDetector(BaseQRDetector):
+    name = "zxing-cpp"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            import zxingcpp
+            return True
+        except ImportError:
+            return False
+
+
+    def detect(self, image, is_binary: bool = False) -> List:
+        return [payload for payload, rect in self.locate(image, is_binary=is_binary)]
+
+
+    def locate(self, image, is_binary: bool = False) -> List[Tuple]:
+        import numpy as np
+        import zxingcpp
+        located = []
+        for result in zxingcpp.read_barcodes(np.asarray(image), formats=zxingcpp.BarcodeFormat.QRCode):
+            corners = [result.position.top_left, result.position.top_right, result.position.bottom_right, result.position.bottom_left]
+            xs = [corner.x for corner in corners]
+            ys = [corner.y for corner in corners]
+            located.append((result.bytes if is_binary else result.text, (min(xs), min(ys), max(xs) + 1, max(ys) + 1)))
+        return located
+
+
+
+_DETECTORS: Dict[str, Type[BaseQRDetector]] = {}
+_selected_detector: BaseQRDetector = None
+
+
+def register_detector(detector_cls: Type[BaseQRDetector]):
+    _DETECTORS[detector_cls.name] = detector_cls
+
+
+def get_available_detectors() -> List[str]:
+    return [name for name, detector_cls in _DETECTORS.items() if detector_cls.is_available()]
+
+
+def is_detector_available(name: str) -> bool:
+    """ Like `name in get_available_detectors()` but only imports `name`'s engine """
+    detector_cls = _DETECTORS.get(name)
+    return detector_cls is not None and detector_cls.is_available()
+
+
+def select_detector(name: str):
+    global _selected_detector
+    if name not in _DETECTORS:
+        raise Exception(f"Unrecognized QR detector {name}")
+    _selected_detector = _DETECTORS[name]()
+    logger.info(f"Using QR detector: {name}")
+
+
+def get_detector() -> BaseQRDetector:
+    if _selected_detector is None:
+        select_detector(ZbarQRDetector.name)
+    return _selected_detector
+
+
+for detector_cls in [ZbarQRDetector, OpenCVQRDetector, ZXingCppQRDetector]:
+    register_detector(detector_cls)
+
+
+
+@dataclass
+class DetectorBenchmark:
+    name: str
+    frames_per_second: float
+    success_rate: float
+
+
+
+def benchmark_detector(name: str, corpus: List, is_binary: bool = True) -> DetectorBenchmark:
+    """
+    Runs a detector over `corpus`, a list of (image, expected_payload) pairs. Success
+    means the first payload found matches the expected payload exactly.
+    """
+    detector = _DETECTORS[name]()
+    successes = 0
+    start = time.perf_counter()
+    for image, expected in corpus:
+        payloads = detector.detect(image, is_binary=is_binary)
+        if payloads and payloads[0] == expected:
+            successes += 1
+    elapsed = time.perf_counter() - start
+    return DetectorBenchmark(name=name, frames_per_second=len(corpus) / elapsed, success_rate=successes / len(corpus))
+
+
+def select_fastest_detector(corpus: List, is_binary: bool = True) -> List[DetectorBenchmark]:
+    """
+    Benchmarks every available detector on `corpus` and selects the best one: the
+    highest success rate, with frames per second breaking ties. Returns the results,
+    best first.
+    """
+    results = [benchmark_detector(name, corpus, is_binary=is_binary) for name in get_available_detectors()]
+    results.sort(key=lambda result: (round(result.success_rate, 2), result.frames_per_second), reverse=True)
+    if results:
+        select_detector(results[0].name)
+    return results
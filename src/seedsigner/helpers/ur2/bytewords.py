@@ -5,55 +5,30 @@
 # Licensed under the "BSD-2-Clause Plus Patent License"
 #
 
-from .utils import crc32_bytes, partition
+from array import array
+from .utils import crc32_bytes, crc32_int
 
 BYTEWORDS = 'ableacidalsoapexaquaarchatomauntawayaxisbackbaldbarnbeltbetabiasbluebodybragbrewbulbbuzzcalmcashcatschefcityclawcodecolacookcostcruxcurlcuspcyandarkdatadaysdelidicedietdoordowndrawdropdrumdulldutyeacheasyechoedgeepicevenexamexiteyesfactfairfernfigsfilmfishfizzflapflewfluxfoxyfreefrogfuelfundgalagamegeargemsgiftgirlglowgoodgraygrimgurugushgyrohalfhanghardhawkheathelphighhillholyhopehornhutsicedideaidleinchinkyintoirisironitemjadejazzjoinjoltjowljudojugsjumpjunkjurykeepkenokeptkeyskickkilnkingkitekiwiknoblamblavalazyleaflegsliarlimplionlistlogoloudloveluaulucklungmainmanymathmazememomenumeowmildmintmissmonknailnavyneednewsnextnoonnotenumbobeyoboeomitonyxopenovalowlspaidpartpeckplaypluspoempoolposepuffpumapurrquadquizraceramprealredorichroadrockroofrubyruinrunsrustsafesagascarsetssilkskewslotsoapsolosongstubsurfswantacotasktaxitenttiedtimetinytoiltombtoystriptunatwinuglyundouniturgeuservastveryvetovialvibeviewvisavoidvowswallwandwarmwaspwavewaxywebswhatwhenwhizwolfworkyankyawnyellyogayurtzapszerozestzinczonezoom'
-WORD_ARRAY = None
 
-def decode_word(word, word_len):
-    global WORD_ARRAY
-    global BYTEWORDS
+# Lookup tables, so that encoding and decoding are a few `bytes.translate` and
+# `map` passes in C rather than a Python loop per byte.
+#
+# `LETTER_TABLES[i]` maps each byte value to the ASCII code of the i-th letter of its
+# Byteword; a 256-byte table for `bytes.translate`.
+LETTER_TABLES = [bytes(ord(BYTEWORDS[4 * value + i]) for value in range(256)) for i in range(4)]
+
+# The first and last letters of each Byteword are unique, so a minimal (2-letter)
+# word read as a native-endian uint16 indexes straight into this table. Unused
+# entries are 0; `decode` catches those by re-encoding the result.
+MINIMAL_WORD_TABLE = bytearray(0x10000)
+for value in range(256):
+    MINIMAL_WORD_TABLE[array('H', (BYTEWORDS[4 * value] + BYTEWORDS[4 * value + 3]).encode())[0]] = value
+MINIMAL_WORD_TABLE = bytes(MINIMAL_WORD_TABLE)
 
+def decode_word(word, word_len):
     if len(word) != word_len:
         raise ValueError('Invalid Bytewords.')
-
-    dim = 26
-
-    # Since the first and last letters of each Byteword are unique,
-    # we can use them as indexes into a two-dimensional lookup table.
-    # This table is generated lazily.
-    if WORD_ARRAY == None:
-        WORD_ARRAY = [-1] * (dim * dim)  # create empty array
-
-        for i in range(256):
-            byteword_offset = i * 4
-            x = ord(BYTEWORDS[byteword_offset]) - ord('a')
-            y = ord(BYTEWORDS[byteword_offset + 3]) - ord('a')
-            array_offset = y * dim + x
-            WORD_ARRAY[array_offset] = i
-
-    # If the coordinates generated by the first and last letters are out of bounds,
-    # or the lookup table contains -1 at the coordinates, then the word is not valid.
-    x = ord(word[0].lower()) - ord('a')
-    y = ord((word[3 if len(word) == 4 else 1]).lower()) - ord('a')
-    if not (0 <= x and x < dim and 0 <= y and y < dim):
-        raise ValueError('Invalid Bytewords.')
-
-    offset = y * dim + x
-    value = WORD_ARRAY[offset]
-    if value == -1:
-        raise ValueError('Invalid Bytewords.')
-
-    # If we're decoding a full four-letter word, verify that the two middle letters are correct.
-    if len(word) == 4:
-        byteword_offset = value * 4
-        c1 = word[1].lower()
-        c2 = word[2].lower()
-        if c1 != BYTEWORDS[byteword_offset + 1] or c2 != BYTEWORDS[byteword_offset + 2]:
-            raise ValueError('Invalid Bytewords.')
-
-    # Successful decode.
-    return value
+    return decode(word, ' ', word_len, verify_checksum=False)[0]
 
 def get_word(index):
     byteword_offset = index * 4
@@ -63,52 +38,77 @@ def get_minimal_word(index):
     byteword_offset = index * 4
     return BYTEWORDS[byteword_offset] + BYTEWORDS[byteword_offset + 3]
 
-def encode(buf, separator):
-    words = []
-    for i in range(len(buf)):
-        byte = buf[i]
-        words.append(get_word(byte))
+def encode_letters(buf, letters, separator=None):
+    # Fill a preallocated buffer one letter position at a time:
+    # `letters` are the LETTER_TABLES indexes to write for each byte.
+    buf = bytes(buf)
+    count = len(buf)
+    stride = len(letters) + (1 if separator else 0)
+    result = bytearray(stride * count)
+    for position, letter in enumerate(letters):
+        result[position::stride] = buf.translate(LETTER_TABLES[letter])
+    if separator:
+        result[len(letters)::stride] = separator.encode() * count
+        # No trailing separator
+        del result[-1:]
+    return result.decode()
 
-    return separator.join(words)
+def encode(buf, separator):
+    return encode_letters(buf, (0, 1, 2, 3), separator)
 
 def add_crc(buf):
     crc_buf = crc32_bytes(buf)
-    return buf + crc_buf
+    return bytes(buf) + crc_buf
 
 def encode_with_separator(buf, separator):
     crc_buf = add_crc(buf)
     return encode(crc_buf, separator)
 
 def encode_minimal(buf):
-    result = ''
-
     crc_buf = add_crc(buf)
-    for i in range(len(crc_buf)):
-        byte = crc_buf[i]
-        result += get_minimal_word(byte)
+    return encode_letters(crc_buf, (0, 3))
 
-    return result
+def decode(s, separator, word_len, verify_checksum=True):
+    try:
+        letters = s.lower().encode('ascii')
+    except UnicodeEncodeError:
+        raise ValueError('Invalid Bytewords.')
 
-def decode(s, separator, word_len):
-    buf = bytearray()
+    if word_len == 4:
+        # Pull out just the first and last letter of each word
+        stride = 5
+        if len(letters) % stride != 4:
+            raise ValueError('Invalid Bytewords.')
+        minimal = bytearray(2 * ((len(letters) + 1) // stride))
+        minimal[0::2] = letters[0::stride]
+        minimal[1::2] = letters[3::stride]
+    else:
+        if len(letters) % 2 != 0:
+            raise ValueError('Invalid Bytewords.')
+        minimal = letters
+
+    buf = bytes(map(MINIMAL_WORD_TABLE.__getitem__, array('H', minimal)))
 
+    # Anything that wasn't a valid word (including the separators and the middle
+    # letters of full words) won't survive the round trip.
     if word_len == 4:
-        words = s.split(separator)
+        expected = encode_letters(buf, (0, 1, 2, 3), separator).encode()
     else:
-        words = partition(s, 2)
+        expected = encode_letters(buf, (0, 3)).encode()
+    if expected != letters:
+        raise ValueError('Invalid Bytewords.')
 
-    for word in words:
-        buf.append(decode_word(word, word_len))
+    if not verify_checksum:
+        return buf
 
     if len(buf) < 5:
-        raise ValueError('Invalid Bytewords.') 
+        raise ValueError('Invalid Bytewords.')
 
     # Validate checksum
     body = buf[0:-4]
     body_checksum = buf[-4:]
-    checksum = crc32_bytes(body)
-    # if checksum != body_checksum:
-    #     raise ValueError('Invalid Bytewords.')
+    if crc32_int(body) != int.from_bytes(body_checksum, 'big'):
+        raise ValueError('Invalid Bytewords.')
 
     return body
 
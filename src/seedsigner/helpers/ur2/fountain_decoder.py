@@ -4,9 +4,9 @@
 # Copyright © 2020 Foundation Devices, Inc.
 # Licensed under the "BSD-2-Clause Plus Patent License"
 #
-import time
-from .fountain_utils import choose_fragments, contains, is_strict_subset, set_difference
-from .utils import join_lists, join_bytes, crc32_int, xor_with, take_first
+from collections import deque
+from .fountain_utils import choose_fragments
+from .utils import join_bytes, crc32_int, take_first
 
 class InvalidPart(Exception):
     pass
@@ -14,28 +14,54 @@ class InvalidPart(Exception):
 class InvalidChecksum(Exception):
     pass
 
+def indexes_to_mask(indexes):
+    mask = 0
+    for index in indexes:
+        mask |= 1 << index
+    return mask
+
+def mask_to_indexes(mask):
+    indexes = []
+    while mask:
+        low_bit = mask & -mask
+        indexes.append(low_bit.bit_length() - 1)
+        mask ^= low_bit
+    return indexes
+
 class FountainDecoder:
+    """
+    Peeling decoder: fragment index sets are int bitmasks, mixed parts are indexed by
+    the fragments they contain and the work queue is a deque. Solving a fragment only
+    touches the mixed parts that contain it, rather than every mixed part.
+    """
+    # Weighted progress estimate: set a ceiling; don't let an index in a mixed/XOR
+    # frame achieve equal weight as a fully decoded frame. Also if the ceiling is too
+    # high, can potentially see your reported progress percentage DECREASE during a
+    # decode.
+    MIXED_INDEX_SCORE_CEILING = 0.75
+
     class Part:
-        def __init__(self, indexes, data):
-            self.indexes = frozenset(indexes)
+        def __init__(self, mask, data, order=None):
+            # Bit `i` is set if fragment `i` is mixed into this part
+            self.mask = mask
+            # The part's bytes as a big-endian int, so XOR is a single int operation
             self.data = data
-        
+            # Mixed parts are reduced against each other in the order they arrived
+            self.order = order
+
         @classmethod
         def from_encoder_part(cls, p):
-            return cls(choose_fragments(p.seq_num, p.seq_len, p.checksum), p.data[:])
+            return cls(indexes_to_mask(choose_fragments(p.seq_num, p.seq_len, p.checksum)), int.from_bytes(p.data, 'big'))
 
+        @property
         def indexes(self):
-            return self.indexes
-
-        def data(self):
-            return self.data
+            return frozenset(mask_to_indexes(self.mask))
 
         def is_simple(self):
-            return len(self.indexes) == 1
+            return self.mask != 0 and self.mask & (self.mask - 1) == 0
 
         def index(self):
-            # TODO: Not efficient
-            return list(self.indexes)[0]
+            return self.mask.bit_length() - 1
 
     # FountainDecoder
     def __init__(self):
@@ -47,9 +73,22 @@ class FountainDecoder:
         self.expected_fragment_len = None
         self.expected_message_len = None
         self.expected_checksum = None
+
+        # Solved fragment data by fragment index, and the bitmask of solved fragments
         self.simple_parts = {}
+        self.solved_mask = 0
+
+        # Unsolved parts by mask, and for each fragment index the set of mixed parts
+        # that contain it
         self.mixed_parts = {}
-        self.queued_parts = []
+        self.mixed_parts_by_index = {}
+        self.next_mixed_order = 0
+
+        # Weighted progress contributed by the mixed parts (see `score_mixed_part`)
+        self.mixed_index_scores = {}
+        self.mixed_score = 0.0
+
+        self.queued_parts = deque()
 
     def expected_part_count(self):
         return len(self.expected_part_indexes)  # TODO: Handle None?
@@ -89,37 +128,41 @@ class FountainDecoder:
             estimated_input_parts = self.expected_part_count() * 1.75
             return min(0.99, self.processed_parts_count / estimated_input_parts)
         else:
-            parts = self.expected_part_count() if self.expected_part_indexes != None else 'None'
-            mixed = []
-            mixed_index_scoring = {}
-            mixed_set = set()
-            for indexes, p in self.mixed_parts.items():
-                if not indexes:
-                    continue
-                mixed.append(self.indexes_to_string(indexes))
-                mixed_set.update(indexes)
-                score = 1.0 / float(len(indexes))
-                for index in indexes:
-                    if index not in mixed_index_scoring:
-                        mixed_index_scoring[index] = 0.0
-                    
-                    # sum up partial scores
-                    mixed_index_scoring[index] += score
-
-            mixed_score = 0.0
-            for index, score in mixed_index_scoring.items():
-                # set a ceiling; don't let an index in a mixed/XOR frame
-                # achieve equal weight as a fully decoded frame. Also if
-                # the ceiling is too high, can potentially see your
-                # reported progress percentage DECREASE during a decode.
-                mixed_score += min(score, 0.75)
-
+            # `mixed_score` is kept up to date by `score_mixed_part`
             num_complete = len(self.received_part_indexes)
-            weighted_estimate = (num_complete + mixed_score) / float(parts)
+            weighted_estimate = (num_complete + self.mixed_score) / float(self.expected_part_count())
             return weighted_estimate
 
+    def score_mixed_part(self, mask, sign):
+        """
+        Adds (sign=1) or removes (sign=-1) a mixed part's contribution to the weighted
+        progress estimate: each of its fragments scores 1/num fragments mixed, and each
+        fragment's summed score is capped at MIXED_INDEX_SCORE_CEILING.
+        """
+        indexes = mask_to_indexes(mask)
+        score = sign / float(len(indexes))
+        ceiling = self.MIXED_INDEX_SCORE_CEILING
+        for index in indexes:
+            old_score = self.mixed_index_scores.get(index, 0.0)
+            new_score = old_score + score
+            self.mixed_score += min(new_score, ceiling) - min(old_score, ceiling)
+            if new_score < 1e-9:
+                # Gone from every mixed part; drop it rather than accumulate float error
+                self.mixed_index_scores.pop(index, None)
+            else:
+                self.mixed_index_scores[index] = new_score
+
+        if not self.mixed_index_scores:
+            self.mixed_score = 0.0
+
 
     def receive_part(self, encoder_part):
+        """
+        Returns True if the part added new information: it solved a fragment or left a
+        new mixed part. Unlike the original set-based decoder, a mixed part whose
+        fragments are all solved already returns False; that decoder recorded it as an
+        empty mixed part, the first time, and so returned True.
+        """
         # Don't process the part if we're already done
         if self.is_complete():
             return False
@@ -143,12 +186,8 @@ class FountainDecoder:
         # Keep track of how many parts we've processed
         self.processed_parts_count += 1
 
-        # self.print_part_end()
-        # self.print_state()
-
         if num_complete == len(self.received_part_indexes) and num_mixed_frames == len(self.mixed_parts):
             # This part didn't add any new info
-            # print("No new data")
             return False
 
         return True
@@ -163,73 +202,75 @@ class FountainDecoder:
         self.queued_parts.append(p)
 
     def process_queue_item(self):
-        start = time.time()
-        part = self.queued_parts.pop(0)
-        # self.print_part(part)
+        part = self.queued_parts.popleft()
+
+        # Peel off every fragment we've already solved
+        self.reduce_part_by_mask(part, part.mask & self.solved_mask)
 
         if part.is_simple():
             self.process_simple_part(part)
-        else:
+        elif part.mask != 0:
             self.process_mixed_part(part)
-        
-        # print(f"Queue processing: {int((time.time() - start)*1000.0)}ms")
-        # self.print_state()
-
-    def reduce_mixed_by(self, p):
-        # Reduce all the current mixed parts by the given part
-        reduced_parts = []
-        for value in self.mixed_parts.values():
-            reduced_parts.append(self.reduce_part_by_part(value, p))
-
-        # Collect all the remaining mixed parts
-        new_mixed = {}
-        for reduced_part in reduced_parts:
-            # If this reduced part is now simple
-            if reduced_part.is_simple():
-                # Add it to the queue
-                self.enqueue(reduced_part)
-            else:
-                # Otherwise, add it to the dict of current mixed parts
-                new_mixed[reduced_part.indexes] = reduced_part
 
-        self.mixed_parts = new_mixed
-        # print(self.mixed_parts.keys())
+    def reduce_part_by_mask(self, p, mask):
+        # XOR the solved fragments in `mask` out of `p`, in place
+        if not mask:
+            return
+        for index in mask_to_indexes(mask):
+            p.data ^= self.simple_parts[index]
+        p.mask &= ~mask
 
     def reduce_part_by_part(self, a, b):
-        # If the fragments mixed into `b` are a strict (proper) subset of those in `a`...
-        if is_strict_subset(b.indexes, a.indexes):
-            # The new fragments in the revised part are `a` - `b`.
-            new_indexes = set_difference(a.indexes, b.indexes)
-            # The new data in the revised part are `a` XOR `b`
-            new_data = xor_with(bytearray(a.data), b.data)
-            return self.Part(new_indexes, new_data)
+        # `b` must be a subset of `a`; `a` becomes `a` - `b`, `a` XOR `b`, in place
+        a.mask &= ~b.mask
+        a.data ^= b.data
+
+    def add_mixed_part(self, p, indexes):
+        self.mixed_parts[p.mask] = p
+        self.score_mixed_part(p.mask, 1)
+        for index in indexes:
+            self.mixed_parts_by_index.setdefault(index, set()).add(p)
+
+    def unindex_mixed_part(self, p, indexes):
+        for index in indexes:
+            self.mixed_parts_by_index[index].discard(p)
+
+    def update_mixed_part(self, p, old_mask):
+        """
+        `p` is a mixed part that has just been reduced from `old_mask`, and is already
+        gone from the index entries of the fragments that were removed.
+        """
+        del self.mixed_parts[old_mask]
+        self.score_mixed_part(old_mask, -1)
+        if p.mask == 0:
+            # It was a duplicate of the part it was reduced by
+            return
+        if p.is_simple():
+            self.unindex_mixed_part(p, [p.index()])
+            self.enqueue(p)
+            return
+
+        existing = self.mixed_parts.get(p.mask)
+        if existing is not None:
+            # Same fragments, so the same data; keep the earlier position
+            existing.order = min(existing.order, p.order)
+            self.unindex_mixed_part(p, mask_to_indexes(p.mask))
         else:
-            # `a` is not reducable by `b`, so return a
-            return a
+            self.mixed_parts[p.mask] = p
+            self.score_mixed_part(p.mask, 1)
 
     def process_simple_part(self, p):
-        # Don't process duplicate parts
         fragment_index = p.index()
-        if contains(self.received_part_indexes, fragment_index):
-            return
 
         # Record this part
-        self.simple_parts[p.indexes] = p
+        self.simple_parts[fragment_index] = p.data
+        self.solved_mask |= p.mask
         self.received_part_indexes.add(fragment_index)
 
         # If we've received all the parts
         if self.received_part_indexes == self.expected_part_indexes:
             # Reassemble the message from its fragments
-            sorted_parts = []
-            for value in self.simple_parts.values():
-                sorted_parts.append(value)
-
-            sorted_parts.sort(key=lambda a: a.index())
-
-            fragments = []
-            for part in sorted_parts:
-                fragments.append(part.data)
-
+            fragments = [self.simple_parts[index].to_bytes(self.expected_fragment_len, 'big') for index in sorted(self.simple_parts)]
             message = self.join_fragments(fragments, self.expected_message_len)
 
             # Verify the message checksum and note success or failure
@@ -240,32 +281,46 @@ class FountainDecoder:
                 self.result = InvalidChecksum()
 
         else:
-            # Reduce all the mixed parts by this part
-            self.reduce_mixed_by(p)
+            # Peel this fragment out of just the mixed parts that contain it
+            for mixed_part in self.mixed_parts_by_index.pop(fragment_index, ()):
+                old_mask = mixed_part.mask
+                self.reduce_part_by_mask(mixed_part, p.mask)
+                self.update_mixed_part(mixed_part, old_mask)
 
     def process_mixed_part(self, p):
-        # Don't process duplicate parts
-        for r in self.mixed_parts.values():
-            if r == p.indexes:
-                return
-
-        # Reduce this part by all the others
-        p2 = p  # TODO: Does this need to make a copy of p?
-        for r in self.simple_parts.values():
-            p2 = self.reduce_part_by_part(p2, r)
-
-        for r in self.mixed_parts.values():
-            p2 = self.reduce_part_by_part(p2, r)
+        # Reduce this part by the mixed parts that are a subset of it, oldest first.
+        # Every candidate shares at least one fragment with it.
+        candidates = set()
+        for index in mask_to_indexes(p.mask):
+            candidates.update(self.mixed_parts_by_index.get(index, ()))
+        for r in sorted(candidates, key=lambda r: r.order):
+            if r.mask & ~p.mask == 0:
+                self.reduce_part_by_part(p, r)
+
+        if p.mask == 0:
+            # Duplicate of what we already have
+            return
 
         # If the part is now simple
-        if p2.is_simple():
+        if p.is_simple():
             # Add it to the queue
-            self.enqueue(p2)
-        else:
-            # Reduce all the mixed parts by this one
-            self.reduce_mixed_by(p2)
-            # Record this new mixed part
-            self.mixed_parts[p2.indexes] = p2
+            self.enqueue(p)
+            return
+
+        # Reduce the mixed parts that are a superset of this one; they must contain
+        # all of its fragments, so only the shortest index entry is searched.
+        indexes = mask_to_indexes(p.mask)
+        supersets = min((self.mixed_parts_by_index.get(index, set()) for index in indexes), key=len)
+        for mixed_part in [r for r in supersets if r.mask & p.mask == p.mask]:
+            old_mask = mixed_part.mask
+            self.unindex_mixed_part(mixed_part, indexes)
+            self.reduce_part_by_part(mixed_part, p)
+            self.update_mixed_part(mixed_part, old_mask)
+
+        # Record this new mixed part
+        p.order = self.next_mixed_order
+        self.next_mixed_order += 1
+        self.add_mixed_part(p, indexes)
 
     def validate_part(self, p):
         # If this is the first part we've seen
@@ -324,9 +379,8 @@ class FountainDecoder:
         mixed = []
         mixed_set = set()
         try:
-            for indexes, p in self.mixed_parts.items():
-                if not indexes or len(indexes) == 0:
-                    continue
+            for mask in self.mixed_parts:
+                indexes = mask_to_indexes(mask)
                 mixed.append(self.indexes_to_string(indexes))
                 mixed_set.update(indexes)
             
@@ -8,7 +8,7 @@
 import math
 from .cbor_lite import CBORDecoder, CBOREncoder
 from .fountain_utils import choose_fragments
-from .utils import split, crc32_int, xor_into, data_to_hex
+from .utils import crc32_int, data_to_hex
 from .constants import MAX_UINT32, MAX_UINT64
 
 class InvalidHeader(Exception):
@@ -111,17 +111,11 @@ class FountainEncoder:
 
     @staticmethod
     def partition_message(message, fragment_len):
-        remaining = message
-        fragments = []
-        while len(remaining) != 0:
-            (fragment, remaining) = split(remaining, fragment_len)
-            padding = fragment_len - len(fragment)
-            while padding > 0:
-                fragment.append(0)
-                padding -= 1
-            fragments.append(fragment)
-
-        return fragments
+        # Zero pad the message to a whole number of fragments; each fragment is then a
+        # view onto the padded buffer rather than a copy.
+        padding = -len(message) % fragment_len
+        buf = memoryview(bytes(message) + bytes(padding))
+        return [buf[i:i + fragment_len] for i in range(0, len(buf), fragment_len)]
 
     def last_part_indexes(self):
         return self.last_part_indexes
@@ -141,11 +135,18 @@ class FountainEncoder:
     def next_part(self):
         self.seq_num += 1
         self.seq_num = self.seq_num % MAX_UINT32  # wrap at period 2^32
-        indexes = choose_fragments(self.seq_num, self.seq_len(), self.checksum)
-        mixed = self.mix(indexes)
-        data = bytes(mixed)
-        self.current_part = Part(self.seq_num, self.seq_len(), self.message_len, self.checksum, data)
+        self.current_part = self.part_at(self.seq_num)
         return self.current_part
+
+
+    def part_at(self, seq_num):
+        """
+        Generates the part for any `seq_num` without advancing the encoder; parts are
+        fully determined by their `seq_num`.
+        """
+        indexes = choose_fragments(seq_num, self.seq_len(), self.checksum)
+        data = self.mix(indexes)
+        return Part(seq_num, self.seq_len(), self.message_len, self.checksum, data)
     
 
     def restart(self):
@@ -157,7 +158,8 @@ class FountainEncoder:
 
 
     def mix(self, indexes):
-        result = [0] * self.fragment_len
+        # XOR the fragments together as big ints rather than a byte at a time
+        result = 0
         for index in indexes:
-            xor_into(result, self.fragments[index])
-        return result
+            result ^= int.from_bytes(self.fragments[index], 'big')
+        return result.to_bytes(self.fragment_len, 'big')
@@ -5,45 +5,56 @@
 # Licensed under the "BSD-2-Clause Plus Patent License"
 #
 
+from functools import lru_cache
 from .random_sampler import RandomSampler
 from .utils import int_to_bytes
 from .xoshiro256 import Xoshiro256
 
-# Fisher-Yates shuffle
-def shuffled(items, rng):
-    remaining = items
+# Fisher-Yates shuffle. Only the first `count` items of the shuffle are drawn; the
+# rest would consume RNG output without changing those first items.
+def shuffled(items, rng, count=None):
+    remaining = list(items)
+    if count is None:
+        count = len(remaining)
     result = []
-    while len(remaining) > 0:
+    while len(result) < count and len(remaining) > 0:
         index = rng.next_int(0, len(remaining) - 1)
         item = remaining.pop(index)
         result.append(item)
 
     return result
 
-def choose_degree(seq_len, rng):
+@lru_cache(maxsize=16)
+def degree_sampler(seq_len):
+    # The alias table only depends on `seq_len`, so build it once per message
     degree_probabilities = []
     for i in range(1, seq_len + 1):
         degree_probabilities.append(1.0 / i)
 
-    degree_chooser = RandomSampler(degree_probabilities)
+    return RandomSampler(degree_probabilities)
+
+def choose_degree(seq_len, rng):
+    degree_chooser = degree_sampler(seq_len)
     return degree_chooser.next(lambda: rng.next_double()) + 1
 
 def choose_fragments(seq_num, seq_len, checksum):
+    return set(_choose_fragments(seq_num, seq_len, checksum))
+
+# The encoder and decoder both keep asking for the same parts' fragments (every
+# displayed or scanned frame), so remember the most recent ones.
+@lru_cache(maxsize=4096)
+def _choose_fragments(seq_num, seq_len, checksum):
     # The first `seq_len` parts are the "pure" fragments, not mixed with any
     # others. This means that if you only generate the first `seq_len` parts,
     # then you have all the parts you need to decode the message.
     if seq_num <= seq_len:
-        return set([seq_num - 1])
+        return frozenset([seq_num - 1])
     else:
         seed = int_to_bytes(seq_num) + int_to_bytes(checksum)
         rng = Xoshiro256.from_bytes(seed)
         degree = choose_degree(seq_len, rng)
-        indexes = []
-
-        for i in range(seq_len):
-            indexes.append(i)
-        shuffled_indexes = shuffled(indexes, rng)
-        return set(shuffled_indexes[0:degree])
+        shuffled_indexes = shuffled(range(seq_len), rng, count=degree)
+        return frozenset(shuffled_indexes)
 
 def contains(set_or_list, el):
     return el in set_or_list
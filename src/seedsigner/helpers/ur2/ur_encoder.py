@@ -51,6 +51,13 @@ class UREncoder:
             return UREncoder.encode_part(self.ur.type, part)
     
 
+    def part_at(self, seq_num) -> str:
+        if self.is_single_part():
+            return UREncoder.encode(self.ur)
+        else:
+            return UREncoder.encode_part(self.ur.type, self.fountain_encoder.part_at(seq_num))
+
+
     def restart(self):
         self.fountain_encoder.restart()
 
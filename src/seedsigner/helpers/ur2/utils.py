@@ -56,15 +56,13 @@ def join_bytes(list_of_ba):
     return out
 
 def xor_into(target, source):
-    count = len(target)
-    assert count == len(source) # Must be the same length
-    for i in range(count):
-        target[i] ^= source[i]
+    target[:] = xor_with(target, source)
 
 def xor_with(a, b):
-    target = a
-    xor_into(target, b)
-    return target
+    # XOR as one big int rather than a byte at a time in Python
+    count = len(a)
+    assert count == len(b) # Must be the same length
+    return (int.from_bytes(a, 'big') ^ int.from_bytes(b, 'big')).to_bytes(count, 'big')
 
 def take_first(s, count):
     return s[0:count]
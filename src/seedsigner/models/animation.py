@@ -0,0 +1,299 @@
+import logging
+import os
+import threading
+import time
+from threading import Condition, RLock
+from typing import List
+
+from seedsigner.helpers.dirty_rects import Rect
+from seedsigner.models.singleton import Singleton
+from seedsigner.models.threads import BaseThread
+
+logger = logging.getLogger(__name__)
+
+
+
+class Animation:
+    """
+    Base class for onscreen animations (scrolling text, pulsing edges, spinners,
+    etc). Rather than each running in its own thread, `step` is called by the
+    `AnimationScheduler` at up to `fps` times per second with the `Renderer.lock`
+    already held.
+
+    Exposes the same `start`/`stop`/`is_alive` interface as `BaseThread` so that
+    animations can be managed in a Screen's `threads` list.
+    """
+    fps: float = 10
+
+    # An exclusive animation (e.g. the screensaver) takes over the whole display: the
+    # other animations are paused while it runs and it's stepped without the
+    # `Renderer.lock` so that it can hold the lock itself.
+    is_exclusive: bool = False
+
+    # Log the CPU used while this animation ran (see `cpu_usage_summary`)
+    report_cpu_usage: bool = False
+
+
+    def __init__(self):
+        self.next_step_at: float = 0.0
+
+        # Measured while running
+        self.num_steps = 0
+        self.step_cpu_time = 0.0
+        self.process_cpu_time = 0.0
+        self.elapsed = 0.0
+        self._started_at = None
+
+
+    def start(self):
+        self.num_steps = 0
+        self.step_cpu_time = 0.0
+        self._started_at = (time.perf_counter(), time.process_time())
+        AnimationScheduler.get_instance().add(self)
+
+
+    def stop(self):
+        """ Once this returns, `step` is no longer running and won't be called again """
+        if not AnimationScheduler.get_instance().remove(self):
+            return
+
+        started_at, process_cpu_at_start = self._started_at
+        self.elapsed = time.perf_counter() - started_at
+        self.process_cpu_time = time.process_time() - process_cpu_at_start
+        if self.report_cpu_usage:
+            logger.info(self.cpu_usage_summary())
+
+
+    def is_alive(self) -> bool:
+        return AnimationScheduler.get_instance().is_scheduled(self)
+
+
+    def hold(self, seconds: float):
+        """ Call from `step` to delay the next step (e.g. to pause at the end of a scroll) """
+        self.next_step_at = time.perf_counter() + seconds
+
+
+    def step(self) -> List[Rect]:
+        """
+        Draws the next frame onto the `Renderer.canvas` and returns the rects of the
+        canvas that it changed. The scheduler sends them to the display.
+        """
+        raise Exception(f"Must implement step() in {self.__class__.__name__}")
+
+
+    def cpu_usage_summary(self) -> str:
+        """
+        Reports the CPU time spent in this animation's own steps and by the whole
+        process (display transfers, foreground work, etc) over its last run.
+        """
+        elapsed = max(self.elapsed, 1e-9)
+        return (
+            f"{self.__class__.__name__}: {self.num_steps} steps in {self.elapsed:.1f}s "
+            f"({self.num_steps / elapsed:.1f}fps); "
+            f"steps used {self.step_cpu_time:.2f}s CPU ({100 * self.step_cpu_time / elapsed:.1f}%), "
+            f"process used {self.process_cpu_time:.2f}s CPU ({100 * self.process_cpu_time / elapsed:.1f}%)"
+        )
+
+
+
+class AnimationScheduler(Singleton):
+    """
+    Runs every active `Animation` from a single thread.
+
+    Each tick steps the animations that are due, then sends the regions they changed
+    to the display in one update. Ticks are paced so that the whole UI stays within
+    `max_fps` and so that animating uses no more than `cpu_budget` of the CPU,
+    leaving the rest for foreground work. The budget covers both this thread's CPU
+    time and the Renderer's flush thread's CPU time sending the updates.
+
+    The low power mode (`SETTING__LOW_POWER_ANIMATIONS`) lowers both limits.
+    """
+    MAX_FPS = 30
+    CPU_BUDGET = 0.5
+
+    LOW_POWER_MAX_FPS = 8
+    LOW_POWER_CPU_BUDGET = 0.2
+
+    # Added to the scheduler thread's nice value so that the OS favors foreground work
+    # (e.g. deriving addresses behind a loading screen) over animating.
+    NICENESS = 5
+
+    # How long a tick waits for the previous update to reach the display or for the
+    # `Renderer.lock` before trying again later.
+    WAIT_TIMEOUT = 0.05
+
+    # How long to wait before trying again after a tick fails
+    ERROR_BACKOFF_SECS = 1.0
+
+    @classmethod
+    def get_instance(cls):
+        # This is the only way to access the one and only instance
+        if cls._instance is None:
+            cls._instance = cls.__new__(cls)
+            cls._instance.is_low_power = False
+            cls._instance.max_fps = cls.MAX_FPS
+            cls._instance.cpu_budget = cls.CPU_BUDGET
+            cls._instance.animations: List[Animation] = []
+            cls._instance.ticks = 0
+            cls._instance.busy_time = 0.0
+
+            # Resolved on first use; the Renderer isn't configured yet at import time
+            cls._instance.renderer = None
+
+            cls._instance._condition = Condition()
+
+            # Held while animations are being stepped so that `remove` can wait out a
+            # step in progress.
+            cls._instance._step_lock = RLock()
+            cls._instance._next_tick_at = 0.0
+            cls._instance._thread = None
+
+            # The Renderer's `flush_cpu_time` as of the last tick
+            cls._instance._flush_cpu_time = None
+        return cls._instance
+
+
+    def set_low_power(self, is_low_power: bool):
+        self.is_low_power = is_low_power
+        if is_low_power:
+            self.max_fps = self.LOW_POWER_MAX_FPS
+            self.cpu_budget = self.LOW_POWER_CPU_BUDGET
+        else:
+            self.max_fps = self.MAX_FPS
+            self.cpu_budget = self.CPU_BUDGET
+
+
+    def add(self, animation: Animation):
+        # Pick up any change to the setting
+        from seedsigner.models.settings import Settings, SettingsConstants
+        self.set_low_power(Settings.get_instance().get_value(SettingsConstants.SETTING__LOW_POWER_ANIMATIONS) == SettingsConstants.OPTION__ENABLED)
+
+        with self._condition:
+            if animation not in self.animations:
+                animation.next_step_at = time.perf_counter()
+                self.animations.append(animation)
+
+            if self._thread is None:
+                self._thread = AnimationScheduler.SchedulerThread(self)
+                self._thread.start()
+            self._condition.notify_all()
+
+
+    def remove(self, animation: Animation) -> bool:
+        """ Returns False if the animation wasn't scheduled """
+        with self._step_lock:
+            with self._condition:
+                if animation not in self.animations:
+                    return False
+                self.animations.remove(animation)
+                self._condition.notify_all()
+                return True
+
+
+    def is_scheduled(self, animation: Animation) -> bool:
+        with self._condition:
+            return animation in self.animations
+
+
+    def _wait_for_next_tick(self):
+        with self._condition:
+            while True:
+                if not self.animations:
+                    self._condition.wait()
+                    continue
+
+                next_tick_at = max(self._next_tick_at, min(a.next_step_at for a in self.animations))
+                delay = next_tick_at - time.perf_counter()
+                if delay <= 0:
+                    return
+                self._condition.wait(delay)
+
+
+    def tick(self):
+        """ Steps every animation that is due and sends their changes to the display """
+        if self.renderer is None:
+            from seedsigner.gui.renderer import Renderer
+            self.renderer = Renderer.get_instance()
+
+        tick_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        flush_busy = 0.0
+        try:
+            # Don't start drawing the next frame until the last one is on its way
+            self.renderer.wait_for_flush(self.WAIT_TIMEOUT)
+
+            # Charge the display updates sent since the last tick to the budget too
+            flush_cpu_time = float(self.renderer.flush_cpu_time())
+            if self._flush_cpu_time is not None:
+                flush_busy = max(flush_cpu_time - self._flush_cpu_time, 0.0)
+            self._flush_cpu_time = flush_cpu_time
+
+            with self._condition:
+                animations = [a for a in self.animations if a.is_exclusive] or list(self.animations)
+
+            cpu_start = time.thread_time()
+            if animations and animations[0].is_exclusive:
+                dirty_rects = self._step(animations)
+                if dirty_rects:
+                    self.renderer.show_image(dirty_rects=dirty_rects)
+
+            elif self.renderer.lock.acquire(timeout=self.WAIT_TIMEOUT):
+                try:
+                    dirty_rects = self._step(animations)
+                    if dirty_rects:
+                        self.renderer.show_image(dirty_rects=dirty_rects)
+                finally:
+                    self.renderer.lock.release()
+
+        finally:
+            # Pace the next tick even if this one failed
+            busy = time.thread_time() - cpu_start + flush_busy
+            self.ticks += 1
+            self.busy_time += busy
+            self._next_tick_at = tick_start + max(1.0 / self.max_fps, busy / self.cpu_budget)
+
+
+    def _step(self, animations: List[Animation]) -> List[Rect]:
+        dirty_rects = []
+        with self._step_lock:
+            now = time.perf_counter()
+            for animation in animations:
+                if animation.next_step_at > now or not self.is_scheduled(animation):
+                    continue
+
+                # Keep to the animation's own rate even if this tick is late
+                animation.next_step_at = max(animation.next_step_at + 1.0 / animation.fps, now)
+                cpu_start = time.thread_time()
+                try:
+                    dirty_rects += animation.step()
+                except Exception as e:
+                    logger.exception(e)
+                    self.remove(animation)
+                animation.num_steps += 1
+                animation.step_cpu_time += time.thread_time() - cpu_start
+        return dirty_rects
+
+
+
+    class SchedulerThread(BaseThread):
+        def __init__(self, scheduler: "AnimationScheduler"):
+            super().__init__()
+            self.scheduler = scheduler
+
+
+        def run(self):
+            try:
+                os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), os.getpriority(os.PRIO_PROCESS, 0) + AnimationScheduler.NICENESS)
+            except (AttributeError, OSError):
+                # Per-thread priorities are Linux-only
+                pass
+
+            while self.keep_running:
+                self.scheduler._wait_for_next_tick()
+                try:
+                    self.scheduler.tick()
+                except Exception as e:
+                    logger.exception(e)
+
+                    # Don't flood the log (and the CPU) if every tick is failing
+                    self.scheduler._next_tick_at = time.perf_counter() + AnimationScheduler.ERROR_BACKOFF_SECS
@@ -6,13 +6,14 @@ import re
 from binascii import a2b_base64, b2a_base64
 from enum import IntEnum
 from embit import psbt, bip39
-from pyzbar import pyzbar
-from pyzbar.pyzbar import ZBarSymbol
 from urtypes.crypto import PSBT as UR_PSBT
 from urtypes.crypto import Account, Output
 from urtypes.bytes import Bytes
 
+from seedsigner.helpers import qr_detectors
 from seedsigner.helpers.ur2.ur_decoder import URDecoder
+from seedsigner.models.partial_scan_cache import PartialScanCache
+from seedsigner.models.qr_search_ladder import QRSearchLadder, SearchResult
 from seedsigner.models.qr_type import QRType
 from seedsigner.models.seed import Seed
 from seedsigner.models.settings import SettingsConstants
@@ -21,6 +22,18 @@ from seedsigner.models.settings import SettingsConstants
 logger = logging.getLogger(__name__)
 
 
+# Used by `DecodeQR.is_segment_type` to validate frames once the QRType is known
+_UR_PREFIXES = {
+    QRType.PSBT__UR2: "UR:CRYPTO-PSBT/",
+    QRType.OUTPUT__UR: "UR:CRYPTO-OUTPUT/",
+    QRType.ACCOUNT__UR: "UR:CRYPTO-ACCOUNT/",
+    QRType.BYTES__UR: "UR:BYTES/",
+}
+_SPECTER_PSBT_SEGMENT = re.compile(r'^p(\d+)of(\d+) ([A-Za-z0-9+\/=]+$)', re.IGNORECASE)
+_SPECTER_SEGMENT = re.compile(r'^p(\d+)of(\d+) ', re.IGNORECASE)
+_BASE64_PSBT_MAGIC = "cHNidP8"
+
+
 
 class DecodeQRStatus(IntEnum):
     """
@@ -38,26 +51,44 @@ class DecodeQR:
     """
         Used to process images or string data from animated qr codes.
     """
-    def __init__(self, wordlist_language_code: str = SettingsConstants.WORDLIST_LANGUAGE__ENGLISH):
+    def __init__(self, wordlist_language_code: str = SettingsConstants.WORDLIST_LANGUAGE__ENGLISH, partial_scans: PartialScanCache = None):
         self.wordlist_language_code = wordlist_language_code
         self.complete = False
         self.qr_type = None
         self.decoder = None
 
+        # Interrupted animated UR scans to resume from; see `PartialScanCache`
+        self.partial_scans = partial_scans
+        self.resume_checked = False
+
+        # Tracks where the QR was in the previous frame; see `QRSearchLadder`
+        self.search_ladder = QRSearchLadder()
+
 
     def add_image(self, image):
-        data = DecodeQR.extract_qr_data(image, is_binary=True)
-        if data == None:
+        if image is None:
             return DecodeQRStatus.FALSE
 
-        return self.add_data(data)
+        attempts = self.search_ladder.plan(image, qr_type=self.qr_type)
+        return self.add_search_result(QRSearchLadder.search(image, attempts, is_binary=True))
+
+
+    def add_search_result(self, result: SearchResult):
+        """ For `QRSearchLadder.search` results computed elsewhere (e.g. `QRDecodePool`) """
+        status = self.add_data(result.payload)
+        self.search_ladder.record(result, qr_type=self.qr_type)
+        return status
 
 
     def add_data(self, data):
         if data == None:
             return DecodeQRStatus.FALSE
 
-        qr_type = DecodeQR.detect_segment_type(data, wordlist_language_code=self.wordlist_language_code)
+        if self.qr_type != None and DecodeQR.is_segment_type(data, self.qr_type):
+            # Fast path for subsequent frames of an animated QR; skip the full classifier
+            qr_type = self.qr_type
+        else:
+            qr_type = DecodeQR.detect_segment_type(data, wordlist_language_code=self.wordlist_language_code)
 
         if self.qr_type == None:
             self.qr_type = qr_type
@@ -121,6 +152,15 @@ class DecodeQR:
 
         if self.qr_type in [QRType.PSBT__UR2, QRType.OUTPUT__UR, QRType.ACCOUNT__UR, QRType.BYTES__UR]:
             added_part = self.decoder.receive_part(qr_str)
+            if self.partial_scans is not None and not self.resume_checked and self.resume_key is not None:
+                # The first valid part identifies the payload; pick up any earlier
+                # interrupted scan of it.
+                self.resume_checked = True
+                saved_scan = self.partial_scans.resume(self.resume_key)
+                if saved_scan:
+                    self.decoder = saved_scan.decoder
+                    added_part = self.decoder.receive_part(qr_str)
+
             if self.decoder.is_complete():
                 self.complete = True
                 return DecodeQRStatus.COMPLETE
@@ -229,10 +269,9 @@ class DecodeQR:
         if self.qr_type in [QRType.PSBT__UR2, QRType.OUTPUT__UR, QRType.ACCOUNT__UR, QRType.BYTES__UR]:
             return int(self.decoder.estimated_percent_complete(weight_mixed_frames=weight_mixed_frames) * 100)
 
-        elif self.qr_type in [QRType.PSBT__SPECTER]:
-            if self.decoder.total_segments == None:
-                return 0
-            return int((self.decoder.collected_segments / self.decoder.total_segments) * 100)
+        elif isinstance(self.decoder, BaseAnimatedQrDecoder):
+            # Specter `pNofM` formats; updated by the decoder as segments arrive
+            return self.decoder.percent_complete
 
         elif self.decoder.total_segments == 1:
             # The single frame QR formats are all or nothing
@@ -245,6 +284,21 @@ class DecodeQR:
             return 0
 
 
+    @property
+    def resume_key(self) -> tuple:
+        """
+        Identifies the payload of an animated UR scan once its first multi-part frame
+        has been received; None for every other QR format.
+        """
+        if self.qr_type not in [QRType.PSBT__UR2, QRType.OUTPUT__UR, QRType.ACCOUNT__UR, QRType.BYTES__UR]:
+            return None
+
+        fountain_decoder = self.decoder.fountain_decoder
+        if fountain_decoder.expected_checksum is None:
+            return None
+        return (self.qr_type, fountain_decoder.expected_checksum, fountain_decoder.expected_part_count())
+
+
     @property
     def is_complete(self) -> bool:
         return self.complete
@@ -313,15 +367,50 @@ class DecodeQR:
         if image is None:
             return None
 
-        barcodes = pyzbar.decode(image, symbols=[ZBarSymbol.QRCODE], binary=is_binary)
-
-        # if barcodes:
-            # print("--------------- extract_qr_data ---------------")
-            # print(barcodes)
+        # zbar unless another engine has been selected; see `qr_detectors`
+        payloads = qr_detectors.get_detector().detect(image, is_binary=is_binary)
 
-        for barcode in barcodes:
+        for payload in payloads:
             # Only pull and return the first barcode
-            return barcode.data
+            return payload
+
+
+    @staticmethod
+    def is_segment_type(s, qr_type: str) -> bool:
+        """
+        Cheap prefix/shape check that `s` is another frame of the given `qr_type`.
+
+        For the UR and Specter types, only returns True for data that
+        `detect_segment_type` would also classify as `qr_type`. PSBT__BASE64 is looser:
+        it only checks for the PSBT magic bytes and valid base64, so corrupt PSBT data
+        can pass and is only rejected when `get_psbt` parses it. False just means the
+        caller has to fall back to the full classifier. Types without a decisive prefix
+        (e.g. the single frame seed formats) always return False.
+        """
+        if type(s) == bytes:
+            try:
+                s = s.decode('utf-8')
+            except UnicodeDecodeError:
+                return False
+
+        if qr_type in _UR_PREFIXES:
+            # `detect_segment_type` checks the UR prefixes before anything else
+            return s[:len(_UR_PREFIXES[qr_type])].upper() == _UR_PREFIXES[qr_type]
+
+        elif qr_type == QRType.PSBT__SPECTER:
+            return _SPECTER_PSBT_SEGMENT.search(s) != None
+
+        elif qr_type == QRType.WALLET__SPECTER:
+            # Only the animated "pMofN " frames; the single frame json format falls back
+            return _SPECTER_SEGMENT.search(s) != None and _SPECTER_PSBT_SEGMENT.search(s) == None
+
+        elif qr_type == QRType.PSBT__BASE64:
+            # Base64 PSBTs always begin with the "psbt\xff" magic bytes. Unlike
+            # `detect_segment_type`, this doesn't parse the PSBT; that's deferred to
+            # `get_psbt`.
+            return s.startswith(_BASE64_PSBT_MAGIC) and DecodeQR.is_base64(s)
+
+        return False
 
 
     @staticmethod
@@ -390,18 +479,12 @@ class DecodeQR:
                 return QRType.SETTINGS
 
             # Seed
-            # create 4 letter wordlist only if not PSBT (performance gain)
-            wordlist = Seed.get_wordlist(wordlist_language_code)
-            try:
-                _4LETTER_WORDLIST = [word[:4].strip() for word in wordlist]
-            except:
-                _4LETTER_WORDLIST = []
-
-            if all(x in wordlist for x in s.strip().split(" ")):
+            wordlist_index = Seed.get_wordlist_index(wordlist_language_code)
+            if all(x in wordlist_index for x in s.strip().split(" ")):
                 # checks if all words in list are in bip39 word list
                 return QRType.SEED__MNEMONIC
 
-            elif all(x in _4LETTER_WORDLIST for x in s.strip().split(" ")):
+            elif all(wordlist_index.is_abbreviation(x) for x in s.strip().split(" ")):
                 # checks if all 4 letter words are in list are in 4 letter bip39 word list
                 return QRType.SEED__FOUR_LETTER_MNEMONIC
 
@@ -640,6 +723,7 @@ class BaseAnimatedQrDecoder(BaseQrDecoder):
     def __init__(self):
         super().__init__()
         self.segments = []
+        self.percent_complete = 0
 
     def current_segment_num(self, segment) -> int:
         raise Exception("Not implemented in child class")
@@ -661,9 +745,11 @@ class BaseAnimatedQrDecoder(BaseQrDecoder):
         elif self.total_segments != self.total_segment_nums(segment):
             raise Exception('Segment total changed unexpectedly')
 
-        if self.segments[self.current_segment_num(segment) - 1] == None:
-            self.segments[self.current_segment_num(segment) - 1] = self.parse_segment(segment)
+        segment_num = self.current_segment_num(segment)
+        if self.segments[segment_num - 1] == None:
+            self.segments[segment_num - 1] = self.parse_segment(segment)
             self.collected_segments += 1
+            self.percent_complete = int((self.collected_segments / self.total_segments) * 100)
             if self.total_segments == self.collected_segments:
                 if self.is_valid:
                     self.complete = True
@@ -771,6 +857,7 @@ class SeedQrDecoder(BaseSingleFrameQrDecoder):
         self.seed_phrase = []
         self.wordlist_language_code = wordlist_language_code
         self.wordlist = Seed.get_wordlist(wordlist_language_code)
+        self.wordlist_index = Seed.get_wordlist_index(wordlist_language_code)
 
 
     def add(self, segment, qr_type=QRType.SEED__SEEDQR):
@@ -829,9 +916,7 @@ class SeedQrDecoder(BaseSingleFrameQrDecoder):
                 seed_phrase_list = segment.strip().split(" ")
                 words = []
                 for s in seed_phrase_list:
-                    # TODO: Pre-calculate this once on startup
-                    _4LETTER_WORDLIST = [word[:4].strip() for word in self.wordlist]
-                    words.append(self.wordlist[_4LETTER_WORDLIST.index(s)])
+                    words.append(self.wordlist[self.wordlist_index.index_of_abbreviation(s)])
 
                 # embit mnemonic code to validate
                 seed = Seed(words, passphrase="", wordlist_language_code=self.wordlist_language_code)
@@ -1,4 +1,5 @@
 import math
+import qrcode
 
 from embit import bip32
 from embit.networks import NETWORKS
@@ -8,9 +9,11 @@ from typing import List
 from embit import bip32
 from embit.networks import NETWORKS
 from embit.psbt import PSBT
+from seedsigner.helpers.ur2.fountain_encoder import FountainEncoder
 from seedsigner.helpers.ur2.ur_encoder import UREncoder
 from seedsigner.helpers.ur2.ur import UR
-from seedsigner.helpers.qr import QR
+from seedsigner.helpers.ur2.utils import crc32_int
+from seedsigner.helpers.qr import QR, QRSymbolLayout
 from seedsigner.models.seed import Seed
 from seedsigner.models.settings import SettingsConstants
 
@@ -19,6 +22,20 @@ from urtypes.crypto import Account, HDKey, Output, Keypath, PathComponent, SCRIP
 
 
 
+def _cbor_uint_len(value: int) -> int:
+    """ Encoded size of a CBOR unsigned int (or of a length header) """
+    if value < 24:
+        return 1
+    elif value < 0x100:
+        return 2
+    elif value < 0x10000:
+        return 3
+    elif value < 0x100000000:
+        return 5
+    return 9
+
+
+
 @dataclass
 class BaseQrEncoder:
     qr_density: str = SettingsConstants.DENSITY__MEDIUM
@@ -33,7 +50,8 @@ class BaseQrEncoder:
         raise Exception("Not implemented in child class")
 
     @property
-    def qr_max_fragment_size(self):
+    def qr_version(self) -> int:
+        """ The QR version that each frame of an animated QR is sized to fill """
         raise Exception("Not implemented in child class")
 
     def seq_len(self):
@@ -44,6 +62,17 @@ class BaseQrEncoder:
     
     def cur_part(self) -> str:
         raise Exception("Not implemented in child class")
+
+    def num_frames(self) -> int:
+        """ Number of distinct frames in one loop of the (possibly animated) QR """
+        raise Exception("Not implemented in child class")
+
+    def part_at(self, frame_num: int) -> str:
+        """
+        Returns the part for `frame_num` (0-indexed within the loop) without changing
+        the encoder's `next_part` position. Lets frames be rendered out of band.
+        """
+        raise Exception("Not implemented in child class")
     
     def restart(self):
         # only used by animated QR encoders
@@ -57,6 +86,11 @@ class BaseQrEncoder:
         return self.qr.qrimage_io(part, width, height, border, background_color=background_color)
 
 
+    def part_to_paletted_image(self, part, width, height, border: int = 3, background_color: str = "ffffff"):
+        """ Background color can later be changed via `QR.set_background_color` """
+        return self.qr.qrimage_paletted(part, width, height, border, background_color=background_color)
+
+
     def next_part_image(self, width=240, height=240, border=3, background_color="bdbdbd"):
         part = self.next_part()
         return self.part_to_image(part, width, height, border, background_color=background_color)
@@ -76,6 +110,12 @@ class BaseStaticQrEncoder(BaseQrEncoder):
         """ static QRs only have a single part, which `next_part` always returns """
         return self.next_part()
 
+    def num_frames(self) -> int:
+        return 1
+
+    def part_at(self, frame_num: int) -> str:
+        return self.next_part()
+
 
     @property
     def is_complete(self):
@@ -91,12 +131,13 @@ class SeedQrEncoder(BaseStaticQrEncoder):
 
     def __post_init__(self):
         self.wordlist = Seed.get_wordlist(self.wordlist_language_code)
+        self.wordlist_index = Seed.get_wordlist_index(self.wordlist_language_code)
         super().__post_init__()
 
         self.data = ""
         # Output as Numeric data format
         for word in self.mnemonic:
-            index = self.wordlist.index(word)
+            index = self.wordlist_index.index(word)
             self.data += str("%04d" % index)
     
 
@@ -111,7 +152,7 @@ class CompactSeedQrEncoder(SeedQrEncoder):
         # Output as binary data format
         binary_str = ""
         for word in self.mnemonic:
-            index = self.wordlist.index(word)
+            index = self.wordlist_index.index(word)
 
             # Convert index to binary, strip out '0b' prefix; zero-pad to 11 bits
             binary_str += bin(index).split('b')[1].zfill(11)
@@ -232,6 +273,14 @@ class BaseSimpleAnimatedQREncoder(BaseQrEncoder):
         return self.next_part()
 
 
+    def num_frames(self) -> int:
+        return len(self.parts)
+
+
+    def part_at(self, frame_num: int) -> str:
+        return self.parts[frame_num % len(self.parts)]
+
+
     def restart(self) -> str:
         self.part_num_sent = 0
 
@@ -239,35 +288,43 @@ class BaseSimpleAnimatedQREncoder(BaseQrEncoder):
 
 @dataclass
 class SpecterXPubQrEncoder(BaseSimpleAnimatedQREncoder, BaseXpubQrEncoder):
+    # Frames are byte mode (the xpub is mixed case) at ECC level L
+    QR_VERSION_BY_DENSITY = {
+        SettingsConstants.DENSITY__LOW: 3,      # 29x29 modules
+        SettingsConstants.DENSITY__MEDIUM: 4,   # 33x33
+        SettingsConstants.DENSITY__HIGH: 5,     # 37x37
+    }
+
     @property
-    def qr_max_fragment_size(self):
-        density_mapping = {
-            SettingsConstants.DENSITY__LOW: 40,
-            SettingsConstants.DENSITY__MEDIUM: 65,
-            SettingsConstants.DENSITY__HIGH: 90,
-        }
-        return density_mapping.get(self.qr_density, 65)
+    def qr_version(self) -> int:
+        return self.QR_VERSION_BY_DENSITY.get(self.qr_density, 4)
 
 
     def _create_parts(self):
         self.prep_xpub()
-        start = 0
-        stop = self.qr_max_fragment_size
-        qr_cnt = ((len(self.xpubstring)-1) // self.qr_max_fragment_size) + 1
+        self.parts = self.split_into_parts(self.xpubstring, self.qr_version)
 
-        if qr_cnt == 1:
-            self.parts.append(self.xpubstring[start:stop])
 
-        cnt = 0
-        while cnt < qr_cnt and qr_cnt != 1:
-            part = "p" + str(cnt+1) + "of" + str(qr_cnt) + " " + self.xpubstring[start:stop]
-            self.parts.append(part)
+    @staticmethod
+    def split_into_parts(data: str, qr_version: int) -> list[str]:
+        """
+        Splits `data` into Specter's "pMofN " prefixed parts, each as long as will fit
+        in a `qr_version` QR. Data that fits in a single QR isn't prefixed.
+        """
+        capacity = QRSymbolLayout.capacity(qr_version, qrcode.util.MODE_8BIT_BYTE, qrcode.constants.ERROR_CORRECT_L)
+        if len(data) <= capacity:
+            return [data]
 
-            start = start + self.qr_max_fragment_size
-            stop = stop + self.qr_max_fragment_size
-            if stop > len(self.xpubstring):
-                stop = len(self.xpubstring)
-            cnt += 1
+        # The prefix grows with the number of digits in the part count
+        qr_cnt = 1
+        while True:
+            fragment_size = capacity - len(f"p{qr_cnt}of{qr_cnt} ")
+            needed = math.ceil(len(data) / fragment_size)
+            if needed <= qr_cnt:
+                break
+            qr_cnt = needed
+
+        return [f"p{i + 1}of{qr_cnt} {data[i * fragment_size:(i + 1) * fragment_size]}" for i in range(qr_cnt)]
 
 
 
@@ -276,6 +333,14 @@ class SpecterXPubQrEncoder(BaseSimpleAnimatedQREncoder, BaseXpubQrEncoder):
 **************************************************************************************"""
 @dataclass
 class BaseFountainQrEncoder(BaseQrEncoder):
+    # The fountain encoder can generate parts forever, but the display loops after the
+    # `seq_len` pure fragments plus this many multiples of `seq_len` mixed parts so that
+    # rendered frames can be cached and replayed.
+    MIXED_PARTS_PER_LOOP = 1
+
+    # `UREncoder`'s default `min_fragment_len`
+    MIN_FRAGMENT_LEN = 10
+
     def __post_init__(self):
         super().__post_init__()
 
@@ -287,14 +352,82 @@ class BaseFountainQrEncoder(BaseQrEncoder):
         return self.ur2_encode.is_complete()
 
 
+    # Frames are alphanumeric mode (uppercase UR) at ECC level L. Each density uses at
+    # least this QR version...
+    QR_VERSION_BY_DENSITY = {
+        SettingsConstants.DENSITY__LOW: 3,      # 29x29 modules
+        SettingsConstants.DENSITY__MEDIUM: 4,   # 33x33
+        SettingsConstants.DENSITY__HIGH: 8,     # 49x49
+    }
+
+    # ...or the larger version that the frames needed back when each density used
+    # this fixed fragment size, so that filling it never takes more frames than that.
+    LEGACY_FRAGMENT_LEN_BY_DENSITY = {
+        SettingsConstants.DENSITY__LOW: 10,
+        SettingsConstants.DENSITY__MEDIUM: 30,
+        SettingsConstants.DENSITY__HIGH: 120,
+    }
+
     @property
-    def qr_max_fragment_size(self):
-        density_mapping = {
-            SettingsConstants.DENSITY__LOW: 10,
-            SettingsConstants.DENSITY__MEDIUM: 30,
-            SettingsConstants.DENSITY__HIGH: 120,
-        }
-        return density_mapping.get(self.qr_density, 30)
+    def qr_version(self) -> int:
+        return self.qr_version_for(self.ur2_encode.ur)
+
+
+    def qr_version_for(self, ur: UR) -> int:
+        """ The QR version that frames of `ur` are sized to fill """
+        legacy_fragment_len = self.LEGACY_FRAGMENT_LEN_BY_DENSITY.get(self.qr_density, 30)
+        message_len = len(ur.cbor)
+        if message_len <= legacy_fragment_len:
+            # Single part: just the bytewords of the message and its checksum
+            frame_len = len(f"ur:{ur.type}/") + 2 * (message_len + 4)
+        else:
+            # The longest frame in the displayed loop (see `max_fragment_len`)
+            fragment_len = FountainEncoder.find_nominal_fragment_length(message_len, self.MIN_FRAGMENT_LEN, legacy_fragment_len)
+            seq_len = math.ceil(message_len / fragment_len)
+            max_seq_num = seq_len * (1 + self.MIXED_PARTS_PER_LOOP)
+            num_bytes = 4 + 1 + _cbor_uint_len(max_seq_num) + _cbor_uint_len(seq_len) + _cbor_uint_len(message_len) + _cbor_uint_len(crc32_int(ur.cbor))
+            num_bytes += _cbor_uint_len(fragment_len) + fragment_len
+            frame_len = len(f"ur:{ur.type}/{max_seq_num}-{seq_len}/") + 2 * num_bytes
+
+        qr_version = self.QR_VERSION_BY_DENSITY.get(self.qr_density, 4)
+        while qr_version < 40 and QRSymbolLayout.capacity(qr_version, qrcode.util.MODE_ALPHA_NUM, qrcode.constants.ERROR_CORRECT_L) < frame_len:
+            qr_version += 1
+        return qr_version
+
+
+    def max_fragment_len(self, ur: UR) -> int:
+        """
+        The largest fountain fragment for which every frame in the displayed loop still
+        fits in a `qr_version_for(ur)` QR, once the UR and bytewords overhead is added.
+        """
+        capacity = QRSymbolLayout.capacity(self.qr_version_for(ur), qrcode.util.MODE_ALPHA_NUM, qrcode.constants.ERROR_CORRECT_L)
+        message_len = len(ur.cbor)
+        if len(f"ur:{ur.type}/") + 2 * (message_len + 4) <= capacity:
+            # Single part: just the bytewords of the message and its checksum
+            return message_len
+
+        # The overhead grows with the number of digits in `seq_len`; iterate until the
+        # `seq_len` we sized the overhead for is enough.
+        seq_len = 1
+        while True:
+            max_seq_num = seq_len * (1 + self.MIXED_PARTS_PER_LOOP)
+            num_bytes = (capacity - len(f"ur:{ur.type}/{max_seq_num}-{seq_len}/")) // 2
+
+            # Bytewords checksum, then the CBOR part: an array header, seq_num, seq_len,
+            # message_len and the message checksum.
+            num_bytes -= 4 + 1 + _cbor_uint_len(max_seq_num) + _cbor_uint_len(seq_len) + _cbor_uint_len(message_len) + _cbor_uint_len(crc32_int(ur.cbor))
+
+            # ...and finally the fragment itself, with its own CBOR length header
+            fragment_len = num_bytes - 1
+            while fragment_len + _cbor_uint_len(fragment_len) > num_bytes:
+                fragment_len -= 1
+
+            fragment_len = max(fragment_len, self.MIN_FRAGMENT_LEN)
+            nominal_fragment_len = FountainEncoder.find_nominal_fragment_length(message_len, self.MIN_FRAGMENT_LEN, fragment_len)
+            needed = math.ceil(message_len / nominal_fragment_len)
+            if needed <= seq_len:
+                return fragment_len
+            seq_len = needed
 
 
     def _create_parts(self):
@@ -312,6 +445,17 @@ class BaseFountainQrEncoder(BaseQrEncoder):
 
     def cur_part(self) -> str:
         return self.ur2_encode.current_part().upper()
+
+
+    def num_frames(self) -> int:
+        if self.ur2_encode.is_single_part():
+            return 1
+        return self.seq_len() * (1 + self.MIXED_PARTS_PER_LOOP)
+
+
+    def part_at(self, frame_num: int) -> str:
+        # fountain `seq_num`s start at 1
+        return self.ur2_encode.part_at(frame_num % self.num_frames() + 1).upper()
     
 
     def restart(self):
@@ -385,7 +529,7 @@ class UrXpubQrEncoder(BaseFountainQrEncoder, BaseXpubQrEncoder):
 
         qr_ur_bytes = UR("crypto-account", ur_account.to_cbor())
 
-        self.ur2_encode = UREncoder(ur=qr_ur_bytes, max_fragment_len=self.qr_max_fragment_size)
+        self.ur2_encode = UREncoder(ur=qr_ur_bytes, max_fragment_len=self.max_fragment_len(qr_ur_bytes))
 
 
 
@@ -396,4 +540,4 @@ class UrPsbtQrEncoder(BaseFountainQrEncoder):
     def __post_init__(self):
         super().__post_init__()
         qr_ur_bytes = UR("crypto-psbt", UR_PSBT(self.psbt.serialize()).to_cbor())
-        self.ur2_encode = UREncoder(ur=qr_ur_bytes, max_fragment_len=self.qr_max_fragment_size)
+        self.ur2_encode = UREncoder(ur=qr_ur_bytes, max_fragment_len=self.max_fragment_len(qr_ur_bytes))
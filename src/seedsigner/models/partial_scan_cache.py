@@ -0,0 +1,50 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+
+class PartialScanCache:
+    """
+    Holds the `DecodeQR` of animated UR scans that were interrupted before they
+    completed (backed out, screensaver, etc) so that rescanning the same animated QR
+    picks up where it left off instead of starting from zero.
+
+    Entries are keyed by `DecodeQR.resume_key` (the UR type and the fountain
+    encoder's checksum and part count), which identifies the payload being scanned.
+    Seeing a different payload evicts everything else; only one interrupted scan is
+    ever worth keeping around.
+    """
+    def __init__(self):
+        self._decoders = {}
+
+
+    def __len__(self):
+        return len(self._decoders)
+
+
+    def save(self, decoder) -> bool:
+        """ Keeps `decoder` for later if it's an incomplete animated UR scan """
+        key = decoder.resume_key
+        if decoder.is_complete or key is None:
+            return False
+
+        self._decoders = {key: decoder}
+        logger.info(f"Saved partial scan: {key}")
+        return True
+
+
+    def resume(self, key):
+        """
+        Removes and returns the saved `DecodeQR` for `key`, if any. Saved scans of any
+        other payload are discarded.
+        """
+        decoder = self._decoders.pop(key, None)
+        self._decoders.clear()
+        if decoder:
+            logger.info(f"Resuming partial scan: {key}")
+        return decoder
+
+
+    def clear(self):
+        self._decoders.clear()
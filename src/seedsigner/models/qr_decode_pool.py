@@ -0,0 +1,209 @@
+import logging
+import multiprocessing
+import os
+from collections import deque
+from multiprocessing import forkserver, resource_tracker, shared_memory, util
+
+from seedsigner.helpers import qr_detectors
+from seedsigner.models.qr_search_ladder import QRSearchLadder, SearchAttempt, SearchResult
+from seedsigner.models.singleton import Singleton
+
+logger = logging.getLogger(__name__)
+
+
+
+# The worker processes' attached `QRDecodePool` frame buffers, by name
+_frame_buffers = {}
+
+
+def _init_worker(detector_name: str):
+    # Runs in each worker process. Forkserver workers don't inherit the main
+    # process' selected detector.
+    qr_detectors.select_detector(detector_name)
+
+    # Detach from the frame buffers when `QRDecodePool.stop` shuts the worker down
+    util.Finalize(None, _close_frame_buffers, exitpriority=10)
+
+
+def _attach_frame_buffer(buffer_name: str) -> shared_memory.SharedMemory:
+    # The main process owns the frame buffers and unlinks them. Forkserver workers
+    # share its resource tracker, which keeps one entry per name: registering the
+    # buffer again here and unregistering it afterwards would drop the main
+    # process' entry too. So attach without registering at all.
+    try:
+        # Python 3.13+
+        return shared_memory.SharedMemory(name=buffer_name, track=False)
+    except TypeError:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return shared_memory.SharedMemory(name=buffer_name)
+        finally:
+            resource_tracker.register = register
+
+
+def _close_frame_buffers():
+    for frame_buffer in _frame_buffers.values():
+        frame_buffer.close()
+    _frame_buffers.clear()
+
+
+def _search(buffer_name: str, shape: tuple, attempts):
+    # Runs in the worker processes
+    import numpy as np
+    if shape is None:
+        frame = None
+    else:
+        if buffer_name not in _frame_buffers:
+            _frame_buffers[buffer_name] = _attach_frame_buffer(buffer_name)
+        frame = np.ndarray(shape, dtype=np.uint8, buffer=_frame_buffers[buffer_name].buf)
+    return QRSearchLadder.search(frame, attempts, is_binary=True)
+
+
+
+class QRDecodePool(Singleton):
+    """
+    Optional multi-core stage for the scan pipeline: zbar runs in a small pool of
+    worker processes so that several camera frames can be searched for a QR at once
+    without competing with the live preview for the GIL.
+
+    Results are handed back in capture order so that the stateful
+    `DecodeQR.add_data` still sees frames in sequence. If every worker is busy, new
+    frames are dropped rather than queued; a stale backlog is worthless for a live
+    scan.
+
+    The workers are forked from a forkserver process rather than from the main
+    process, so they never get a copy of its memory (e.g. loaded seeds).
+    `start_server` launches the forkserver at app startup; each scan then starts the
+    pool and stops it when it's done. Frames are handed over in shared memory
+    rather than pickled: one buffer per worker, reused from frame to frame.
+
+    On single-core boards (Pi Zero) `num_workers` is 0 and the caller should decode
+    inline, as before.
+    """
+    MAX_WORKERS = 3
+
+    @classmethod
+    def get_instance(cls):
+        # This is the only way to access the one and only instance
+        if cls._instance is None:
+            cls._instance = cls.__new__(cls)
+            cls._instance.num_workers = cls.default_num_workers()
+            cls._instance._pool = None
+            cls._instance._pending = deque()
+            cls._instance._frame_buffers = []
+        return cls._instance
+
+
+    @staticmethod
+    def default_num_workers() -> int:
+        # Leave one core for the main process (`add_data`, buttons) and the preview
+        num_cores = os.cpu_count() or 1
+        return min(num_cores - 1, QRDecodePool.MAX_WORKERS)
+
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.num_workers > 0
+
+
+    @staticmethod
+    def _get_context():
+        return multiprocessing.get_context("forkserver")
+
+
+    def start_server(self):
+        """
+        Launches the forkserver that the workers are forked from. Call at startup,
+        before any seeds are loaded; the forkserver is a fresh interpreter either way
+        but this keeps its startup out of the first scan.
+        """
+        if self.is_enabled:
+            context = self._get_context()
+            context.set_forkserver_preload([__name__])
+            forkserver.ensure_running()
+
+
+    def start(self):
+        """ Starts the worker processes; call `stop` when the scan ends """
+        if self.is_enabled and self._pool is None:
+            logger.info(f"Starting {self.num_workers} QR decode workers")
+            self._pool = self._get_context().Pool(
+                self.num_workers,
+                initializer=_init_worker,
+                initargs=(qr_detectors.get_detector().name,)
+            )
+
+
+    def _get_free_buffer(self, size: int) -> shared_memory.SharedMemory:
+        in_use = [frame_buffer for frame_seq, frame_buffer, async_result in self._pending]
+        for frame_buffer in self._frame_buffers:
+            if frame_buffer not in in_use and frame_buffer.size >= size:
+                return frame_buffer
+
+        # None free that are big enough
+        frame_buffer = shared_memory.SharedMemory(create=True, size=size)
+        self._frame_buffers.append(frame_buffer)
+        return frame_buffer
+
+
+    def submit(self, frame_seq: int, frame, attempts: list[SearchAttempt]) -> bool:
+        """
+        Searches `frame` (a camera luma frame or a grayscale Image) per `attempts`
+        (see `QRSearchLadder.plan`). Returns False if the frame was dropped because
+        all workers are busy.
+        """
+        if len(self._pending) >= self.num_workers:
+            return False
+
+        if frame is None:
+            frame_buffer, shape = None, None
+        else:
+            import numpy as np
+            frame = np.asarray(frame, dtype=np.uint8)
+            frame_buffer = self._get_free_buffer(frame.nbytes)
+            shape = frame.shape
+            np.ndarray(shape, dtype=np.uint8, buffer=frame_buffer.buf)[:] = frame
+
+        async_result = self._pool.apply_async(_search, (frame_buffer.name if frame_buffer else None, shape, attempts))
+        self._pending.append((frame_seq, frame_buffer, async_result))
+        return True
+
+
+    def get_results(self) -> list[tuple[int, SearchResult]]:
+        """
+        Returns (frame_seq, search_result) for each submitted frame that has finished,
+        in submission order; the result's `payload` is None if no QR was found in that
+        frame.
+        """
+        results = []
+        while self._pending and self._pending[0][2].ready():
+            frame_seq, frame_buffer, async_result = self._pending.popleft()
+            try:
+                results.append((frame_seq, async_result.get()))
+            except Exception as e:
+                logger.exception(repr(e))
+                results.append((frame_seq, SearchResult()))
+        return results
+
+
+    def discard_pending(self):
+        """ Forget any in-flight frames """
+        self._pending.clear()
+
+
+    def stop(self):
+        """ Shuts down the worker processes and frees the frame buffers """
+        if self._pool is not None:
+            logger.info("Stopping QR decode workers")
+            # Let the workers finish their current frame and exit normally, rather
+            # than `terminate` them, so that they close their frame buffers.
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        self._pending.clear()
+
+        for frame_buffer in self._frame_buffers:
+            frame_buffer.close()
+            frame_buffer.unlink()
+        self._frame_buffers = []
@@ -0,0 +1,137 @@
+import logging
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from PIL import Image
+
+from seedsigner.helpers.qr import QR
+from seedsigner.models.encode_qr import BaseQrEncoder
+from seedsigner.models.threads import BaseThread
+
+logger = logging.getLogger(__name__)
+
+
+
+class QRFrameCache:
+    """
+    Rendered images of each distinct frame in a (possibly animated) QR's loop.
+
+    Frames are rendered on demand by `get_frame` and ahead of the playhead by the
+    `FillThread`. Memory is bounded by `memory_budget`; once full, the least recently
+    used frames are evicted. When the whole loop fits in the budget, every frame after
+    the first loop is a cache hit.
+
+    Frames are held as paletted images so the background color (i.e. the QR
+    brightness) is applied with a palette swap when a frame is fetched; cached frames
+    stay valid across brightness changes.
+    """
+    # Default budget leaves plenty of headroom on a 512MB Pi Zero: ~580 full-screen
+    # 240x240 frames at one byte per pixel.
+    MEMORY_BUDGET = 32 * 1024 * 1024
+
+
+    class FillThread(BaseThread):
+        def __init__(self, frame_cache: "QRFrameCache"):
+            super().__init__()
+            self.frame_cache = frame_cache
+
+
+        def run(self):
+            while self.keep_running:
+                if not self.frame_cache.fill_next():
+                    # Everything we can usefully hold is already rendered
+                    time.sleep(0.05)
+
+
+    def __init__(self, qr_encoder: BaseQrEncoder, width: int = 240, height: int = 240, border: int = 2, memory_budget: int = MEMORY_BUDGET):
+        self.qr_encoder = qr_encoder
+        self.width = width
+        self.height = height
+        self.border = border
+
+        self.num_frames = qr_encoder.num_frames()
+        frame_size = width * height
+        self.capacity = max(1, min(self.num_frames, memory_budget // frame_size))
+
+        if self.num_frames <= self.capacity:
+            self.fill_ahead = self.num_frames
+        else:
+            # Only prefetch half the budget so that LRU eviction drops frames that were
+            # played longest ago rather than ones we've prefetched but not yet played.
+            self.fill_ahead = max(1, self.capacity // 2)
+
+        self._frames: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        self.playhead = None
+        self.hits = 0
+        self.misses = 0
+
+        self.fill_thread = QRFrameCache.FillThread(self)
+
+
+    def __len__(self):
+        return len(self._frames)
+
+
+    def _render(self, frame_num: int) -> Image.Image:
+        part = self.qr_encoder.part_at(frame_num)
+        return self.qr_encoder.part_to_paletted_image(part, self.width, self.height, self.border)
+
+
+    def _store(self, frame_num: int, image: Image.Image):
+        with self._lock:
+            self._frames[frame_num] = image
+            self._frames.move_to_end(frame_num)
+            while len(self._frames) > self.capacity:
+                self._frames.popitem(last=False)
+
+
+    def get_frame(self, frame_num: int, background_color: str) -> Image.Image:
+        """
+        Returns the frame recolored with `background_color`, rendering it now if the
+        `FillThread` hasn't got to it yet. The returned image is the caller's to draw
+        on.
+        """
+        frame_num %= self.num_frames
+        with self._lock:
+            self.playhead = frame_num
+            image = self._frames.get(frame_num)
+            if image is not None:
+                self._frames.move_to_end(frame_num)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if image is None:
+            image = self._render(frame_num)
+            self._store(frame_num, image)
+
+        # Copying a paletted frame is a 1-byte-per-pixel memcpy
+        image = image.copy()
+        QR.set_background_color(image, background_color)
+        return image
+
+
+    def fill_next(self) -> bool:
+        """
+        Renders the next missing frame ahead of the playhead. Returns False if there
+        was nothing left to render.
+        """
+        with self._lock:
+            if self.playhead is None:
+                # Nothing has been displayed yet
+                return False
+
+            frame_num = None
+            for offset in range(1, self.fill_ahead + 1):
+                candidate = (self.playhead + offset) % self.num_frames
+                if candidate not in self._frames:
+                    frame_num = candidate
+                    break
+
+        if frame_num is None:
+            return False
+
+        self._store(frame_num, self._render(frame_num))
+        return True
@@ -0,0 +1,126 @@
+import logging
+from typing import NamedTuple
+
+from PIL import Image
+
+from seedsigner.helpers import qr_detectors
+
+logger = logging.getLogger(__name__)
+
+
+
+class SearchAttempt(NamedTuple):
+    # (left, top, right, bottom) region of the frame to search
+    box: tuple
+    # Only every `scale`th pixel in each direction is handed to the detector
+    scale: int
+    is_roi: bool = False
+
+
+
+class SearchResult(NamedTuple):
+    payload: bytes = None
+    attempt: SearchAttempt = None
+    # Where the QR was found, in full frame coordinates (if the detector says)
+    rect: tuple = None
+
+
+
+class QRSearchLadder:
+    """
+    Decides where, and at what resolution, to look for a QR in each camera frame.
+
+    The QR rarely moves between frames of an animated scan, so once it's been
+    located the next frame is first searched in a crop around its last position. If
+    that misses, the whole frame is searched downscaled and only then at full
+    resolution. The coarsest full frame scale that worked is remembered per QRType;
+    dense QRs that need full resolution stop wasting time on the downscaled attempt.
+
+    `plan` and `record` keep the state; `search` is stateless so that it can run in
+    the `QRDecodePool` workers.
+    """
+    # Coarsest first
+    SCALES = (2, 1)
+
+    # Don't downscale below this many pixels on the short side
+    MIN_SCALED_SIZE = 240
+
+    # Grow the last known QR position by this fraction of its size on each side
+    ROI_MARGIN = 0.25
+
+
+    def __init__(self):
+        self.last_rect = None
+        self.scale_by_qr_type = {}
+
+
+    @staticmethod
+    def frame_size(frame) -> tuple[int, int]:
+        if isinstance(frame, Image.Image):
+            return frame.size
+        # numpy array from the camera
+        return (frame.shape[1], frame.shape[0])
+
+
+    def plan(self, frame, qr_type: str = None) -> list[SearchAttempt]:
+        """ The ordered list of attempts to make on `frame` """
+        width, height = self.frame_size(frame)
+        preferred_scale = self.scale_by_qr_type.get(qr_type)
+
+        attempts = []
+        if self.last_rect:
+            left, top, right, bottom = self.last_rect
+            margin_x = int((right - left) * self.ROI_MARGIN)
+            margin_y = int((bottom - top) * self.ROI_MARGIN)
+            box = (max(0, left - margin_x), max(0, top - margin_y), min(width, right + margin_x), min(height, bottom + margin_y))
+            if box[0] < box[2] and box[1] < box[3] and box != (0, 0, width, height):
+                attempts.append(SearchAttempt(box=box, scale=preferred_scale or 1, is_roi=True))
+
+        for scale in self.SCALES:
+            if preferred_scale and scale > preferred_scale:
+                # Already known to be too coarse for this QRType
+                continue
+            if scale > 1 and min(width, height) // scale < self.MIN_SCALED_SIZE:
+                continue
+            attempts.append(SearchAttempt(box=(0, 0, width, height), scale=scale))
+
+        return attempts
+
+
+    @staticmethod
+    def search(frame, attempts: list[SearchAttempt], is_binary: bool = True) -> SearchResult:
+        """ Runs `attempts` in order and returns the first hit """
+        if frame is None:
+            return SearchResult()
+
+        detector = qr_detectors.get_detector()
+        for attempt in attempts:
+            left, top, right, bottom = attempt.box
+            scale = attempt.scale
+            if isinstance(frame, Image.Image):
+                region = frame.crop(attempt.box)
+                if scale > 1:
+                    region = region.resize((region.width // scale, region.height // scale), resample=Image.NEAREST)
+            else:
+                # Crop and downscale are just a view onto the camera's array
+                region = frame[top:bottom:scale, left:right:scale]
+
+            for payload, rect in detector.locate(region, is_binary=is_binary):
+                if rect is not None:
+                    rect = (left + rect[0] * scale, top + rect[1] * scale, left + rect[2] * scale, top + rect[3] * scale)
+                # Only pull and return the first barcode
+                return SearchResult(payload=payload, attempt=attempt, rect=rect)
+
+        return SearchResult()
+
+
+    def record(self, result: SearchResult, qr_type: str = None):
+        """ Updates the plan for the next frame with how `search` went on this one """
+        if result.payload is None:
+            # The QR has moved or is gone; look everywhere next time
+            self.last_rect = None
+            return
+
+        self.last_rect = result.rect
+        if not result.attempt.is_roi and qr_type is not None:
+            self.scale_by_qr_type[qr_type] = result.attempt.scale
@@ -4,9 +4,10 @@ import hashlib
 import hmac
 
 from binascii import hexlify
+from bisect import bisect_left
 from embit import bip39, bip32, bip85
 from embit.networks import NETWORKS
-from typing import List
+from typing import Dict, List
 
 from seedsigner.models.settings import SettingsConstants
 
@@ -18,7 +19,85 @@ class InvalidSeedException(Exception):
 
 
 
+class WordlistIndex:
+    """
+    Precomputed lookups over a BIP-39 wordlist so that callers don't have to linearly
+    scan the 2048 words. Get the shared instance via `Seed.get_wordlist_index`.
+
+    Lookups are NFKD-normalized (as `Seed` normalizes mnemonics) so that non-English
+    wordlists with accented words will match regardless of the input's normal form.
+    """
+    def __init__(self, wordlist: List[str]):
+        self.wordlist = wordlist
+        self._word_to_index: Dict[str, int] = {}
+        self._abbreviation_to_index: Dict[str, int] = {}
+        for i, word in enumerate(wordlist):
+            self._word_to_index.setdefault(unicodedata.normalize("NFKD", word), i)
+
+            # BIP-39 words are uniquely identified by their first four letters (not
+            # code points, hence the NFC)
+            abbreviation = unicodedata.normalize("NFC", word)[:4].strip()
+            self._abbreviation_to_index.setdefault(unicodedata.normalize("NFKD", abbreviation), i)
+
+        # For prefix searches: a contiguous range of the sorted words starts with any
+        # given prefix.
+        self._sorted_words = sorted(self._word_to_index.keys())
+
+
+    @staticmethod
+    def _normalize(word: str) -> str:
+        if word.isascii():
+            return word
+        return unicodedata.normalize("NFKD", word)
+
+
+    def __contains__(self, word: str) -> bool:
+        return self._normalize(word) in self._word_to_index
+
+
+    def index(self, word: str) -> int:
+        """ Same as `wordlist.index(word)`; raises ValueError if not found """
+        try:
+            return self._word_to_index[self._normalize(word)]
+        except KeyError:
+            raise ValueError(f"'{word}' is not in the wordlist")
+
+
+    def is_abbreviation(self, abbreviation: str) -> bool:
+        """ Is `abbreviation` the first four letters (or fewer for short words) of a word? """
+        return self._normalize(abbreviation) in self._abbreviation_to_index
+
+
+    def index_of_abbreviation(self, abbreviation: str) -> int:
+        """ Returns the wordlist index of the word whose first four letters match """
+        try:
+            return self._abbreviation_to_index[self._normalize(abbreviation)]
+        except KeyError:
+            raise ValueError(f"'{abbreviation}' is not an abbreviation in the wordlist")
+
+
+    def words_starting_with(self, prefix: str) -> List[str]:
+        """ All words that start with `prefix`, in wordlist order """
+        if not prefix:
+            return list(self.wordlist)
+
+        prefix = self._normalize(prefix)
+        start = bisect_left(self._sorted_words, prefix)
+        end = start
+        while end < len(self._sorted_words) and self._sorted_words[end].startswith(prefix):
+            end += 1
+
+        matches = self._sorted_words[start:end]
+        if len(matches) > 1:
+            matches.sort(key=self._word_to_index.__getitem__)
+        return [self.wordlist[self._word_to_index[word]] for word in matches]
+
+
+
 class Seed:
+    # Shared `WordlistIndex` instances, built on first use
+    _wordlist_indexes: Dict[str, WordlistIndex] = {}
+
     def __init__(self,
                  mnemonic: List[str] = None,
                  passphrase: str = "",
@@ -45,6 +124,13 @@ class Seed:
             raise Exception(f"Unrecognized wordlist_language_code {wordlist_language_code}")
 
 
+    @staticmethod
+    def get_wordlist_index(wordlist_language_code: str = SettingsConstants.WORDLIST_LANGUAGE__ENGLISH) -> WordlistIndex:
+        if wordlist_language_code not in Seed._wordlist_indexes:
+            Seed._wordlist_indexes[wordlist_language_code] = WordlistIndex(Seed.get_wordlist(wordlist_language_code))
+        return Seed._wordlist_indexes[wordlist_language_code]
+
+
     def _generate_seed(self):
         try:
             self.seed_bytes = bip39.mnemonic_to_seed(self.mnemonic_str, password=self._passphrase, wordlist=self.wordlist)
@@ -197,11 +197,13 @@ class SettingsConstants:
     SETTING__DIRE_WARNINGS = "dire_warnings"
     SETTING__QR_BRIGHTNESS_TIPS = "qr_brightness_tips"
     SETTING__PARTNER_LOGOS = "partner_logos"
+    SETTING__LOW_POWER_ANIMATIONS = "low_power_animations"
 
     SETTING__DEBUG = "debug"
 
     # Hidden settings
     SETTING__QR_BRIGHTNESS = "qr_background_color"
+    SETTING__QR_DETECTOR = "qr_detector"
 
 
     # Structural constants
@@ -542,6 +544,14 @@ class SettingsDefinition:
                       visibility=SettingsConstants.VISIBILITY__ADVANCED,
                       default_value=SettingsConstants.OPTION__ENABLED),
 
+        SettingsEntry(category=SettingsConstants.CATEGORY__FEATURES,
+                      attr_name=SettingsConstants.SETTING__LOW_POWER_ANIMATIONS,
+                      abbreviated_name="low_power",
+                      display_name=_mft("Low power animations"),
+                      help_text=_mft("Slower screensaver & spinners"),
+                      visibility=SettingsConstants.VISIBILITY__ADVANCED,
+                      default_value=SettingsConstants.OPTION__DISABLED),
+
         # Developer options
         # TODO: No real Developer options needed yet. Disable for now.
         # SettingsEntry(category=SettingsConstants.CATEGORY__SYSTEM,
@@ -558,6 +568,15 @@ class SettingsDefinition:
                       type=SettingsConstants.TYPE__FREE_ENTRY,
                       visibility=SettingsConstants.VISIBILITY__HIDDEN,
                       default_value=62),
+
+        # Set by tools/qr_detector_benchmark.py
+        SettingsEntry(category=SettingsConstants.CATEGORY__SYSTEM,
+                      attr_name=SettingsConstants.SETTING__QR_DETECTOR,
+                      abbreviated_name="qr_detector",
+                      display_name=_mft("QR detector"),
+                      type=SettingsConstants.TYPE__FREE_ENTRY,
+                      visibility=SettingsConstants.VISIBILITY__HIDDEN,
+                      default_value="zbar"),
     ]
 
 
@@ -1,4 +1,6 @@
 import logging
+import time
+from collections import deque
 from threading import Thread, Lock
 
 logger = logging.getLogger(__name__)
@@ -44,3 +46,57 @@ class ThreadsafeCounter:
             self.count = value
 
 
+
+
+
+class FramePacer:
+    """
+    Deadline-based pacing for animation loops: frame n is due at start + n/target_fps,
+    regardless of how long the work for earlier frames took, so the animation's rate
+    doesn't drift with the cost of each frame.
+
+    When a frame's work overruns its deadline, `wait` reports the frames that are
+    already overdue so the caller can skip them (and the work of preparing them)
+    instead of slowing the animation down.
+    """
+    # Number of recent frames that `achieved_fps` is measured over
+    FPS_WINDOW = 30
+
+
+    def __init__(self, target_fps: float):
+        self.frame_interval = 1.0 / target_fps
+        self.next_deadline = None
+        self.frames_presented = 0
+        self.frames_skipped = 0
+        self._present_times = deque(maxlen=self.FPS_WINDOW)
+
+
+    def wait(self) -> int:
+        """
+        Sleeps until the next frame is due. Returns the number of frame slots to
+        advance the animation by: 1 if on schedule, more if frames had to be skipped.
+        """
+        now = time.perf_counter()
+        if self.next_deadline is None:
+            self.next_deadline = now
+
+        if now < self.next_deadline:
+            time.sleep(self.next_deadline - now)
+
+            # sleep() can overshoot; record when the frame is actually presented
+            now = time.perf_counter()
+
+        num_overdue = int((now - self.next_deadline) / self.frame_interval)
+        self.next_deadline += (num_overdue + 1) * self.frame_interval
+        self.frames_skipped += num_overdue
+        self.frames_presented += 1
+        self._present_times.append(now)
+        return num_overdue + 1
+
+
+    @property
+    def achieved_fps(self) -> float:
+        if len(self._present_times) < 2:
+            return 0.0
+        elapsed = self._present_times[-1] - self._present_times[0]
+        return (len(self._present_times) - 1) / elapsed if elapsed > 0 else 0.0
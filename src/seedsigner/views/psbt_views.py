@@ -91,8 +91,8 @@ class PSBTOverviewView(View):
         if not self.controller.psbt_parser or self.controller.psbt_parser.seed != self.controller.psbt_seed:
             # The PSBTParser takes a while to read the PSBT. Run the loading screen while
             # we wait.
-            from seedsigner.gui.screens.screen import LoadingScreenThread
-            self.loading_screen = LoadingScreenThread(text=_("Parsing PSBT..."))
+            from seedsigner.gui.screens.screen import LoadingScreenAnimation
+            self.loading_screen = LoadingScreenAnimation(text=_("Parsing PSBT..."))
             self.loading_screen.start()
                 
             try:
@@ -373,8 +373,8 @@ class PSBTChangeDetailsView(View):
                     loading_screen_text = _("Verifying Change...")
                 else:
                     loading_screen_text = _("Verifying Self-Transfer...")
-                from seedsigner.gui.screens.screen import LoadingScreenThread
-                loading_screen = LoadingScreenThread(text=loading_screen_text)
+                from seedsigner.gui.screens.screen import LoadingScreenAnimation
+                loading_screen = LoadingScreenAnimation(text=loading_screen_text)
                 loading_screen.start()
 
                 # convert change address to script pubkey to get script type
@@ -31,7 +31,10 @@ class ScanView(View):
         # Define the decoder here to make it available to child classes' is_valid_qr_type
         # checks and so we can inject data into it in the test suite's `before_run()`.
         self.wordlist_language_code = self.settings.get_value(SettingsConstants.SETTING__WORDLIST_LANGUAGE)
-        self.decoder: DecodeQR = DecodeQR(wordlist_language_code=self.wordlist_language_code)
+        self.decoder: DecodeQR = DecodeQR(
+            wordlist_language_code=self.wordlist_language_code,
+            partial_scans=self.controller.partial_scans,
+        )
 
 
     @property
@@ -53,6 +56,13 @@ class ScanView(View):
         # doesn't immediately engage when we leave here.
         self.controller.reset_screensaver_timeout()
 
+        if self.decoder.is_complete:
+            # Any other interrupted scan is no longer of interest
+            self.controller.partial_scans.clear()
+        else:
+            # Keep the collected parts of an incomplete animated QR for a rescan
+            self.controller.partial_scans.save(self.decoder)
+
         # Handle the results
         if self.decoder.is_complete:
             if not self.is_valid_qr_type:
@@ -8,6 +8,7 @@ from gettext import gettext as _
 
 from seedsigner.gui.components import Fonts, GUIConstants, load_image
 from seedsigner.gui.screens.screen import BaseScreen
+from seedsigner.models.animation import Animation
 from seedsigner.models.settings import Settings
 from seedsigner.models.settings_definition import SettingsConstants
 from seedsigner.views.view import View
@@ -138,15 +139,28 @@ class OpeningSplashScreen(LogoScreen):
 
 
 class ScreensaverScreen(LogoScreen):
+    # How often to check for the input that dismisses the screensaver
+    INPUT_POLL_SECS = 0.05
+
+    # Number of logo positions that are planned at a time
+    PATH_LENGTH = 300
+
     def __init__(self, buttons):
-        from PIL import Image
+        from collections import deque
         super().__init__()
 
         self.buttons = buttons
 
-        # Paste the logo in a bigger image that is 2x the size of the logo
-        self.image = Image.new("RGB", (2 * self.logo.size[0], 2 * self.logo.size[1]), (0,0,0))
-        self.image.paste(self.logo, (int(self.logo.size[0] / 2), int(self.logo.size[1] / 2)))
+        # The screensaver pans a display-sized window around a bigger image that is 2x
+        # the size of the logo, with the logo in the middle. Everything but the logo
+        # itself is black so only the logo needs to be drawn (and sent) at each step.
+        logo = self.logo.convert("RGB")
+        logo_bbox = logo.getbbox()
+        self.sprite = logo.crop(logo_bbox)
+        self.sprite_offset = (int(self.logo.size[0] / 2) + logo_bbox[0], int(self.logo.size[1] / 2) + logo_bbox[1])
+
+        # Upcoming onscreen positions of the sprite
+        self.path = deque()
 
         self.min_coords = (0, 0)
         self.max_coords = (self.logo.size[0], self.logo.size[1])
@@ -158,6 +172,7 @@ class ScreensaverScreen(LogoScreen):
 
         self._is_running = False
         self.last_screen = None
+        self.animation: ScreensaverScreen.BounceAnimation = None
 
 
     @property
@@ -174,6 +189,44 @@ class ScreensaverScreen(LogoScreen):
         return increment
 
 
+    def advance(self):
+        """ Moves the logo one step along its path """
+        self.cur_x += self.increment_x
+        self.cur_y += self.increment_y
+
+        # At each edge bump, calculate a new random rate of change for that axis
+        if self.cur_x < self.min_coords[0]:
+            self.cur_x = self.min_coords[0]
+            self.increment_x = self.rand_increment()
+            if self.increment_x < 0.0:
+                self.increment_x *= -1.0
+        elif self.cur_x > self.max_coords[0]:
+            self.cur_x = self.max_coords[0]
+            self.increment_x = self.rand_increment()
+            if self.increment_x > 0.0:
+                self.increment_x *= -1.0
+
+        if self.cur_y < self.min_coords[1]:
+            self.cur_y = self.min_coords[1]
+            self.increment_y = self.rand_increment()
+            if self.increment_y < 0.0:
+                self.increment_y *= -1.0
+        elif self.cur_y > self.max_coords[1]:
+            self.cur_y = self.max_coords[1]
+            self.increment_y = self.rand_increment()
+            if self.increment_y > 0.0:
+                self.increment_y *= -1.0
+
+
+    def plan_path(self, num_steps: int) -> list[tuple[int, int]]:
+        """ Returns the sprite's onscreen position for each of the next `num_steps` """
+        path = []
+        for i in range(num_steps):
+            path.append((int(self.sprite_offset[0] - self.cur_x), int(self.sprite_offset[1] - self.cur_y)))
+            self.advance()
+        return path
+
+
     def start(self):
         if self.is_running:
             return
@@ -186,44 +239,16 @@ class ScreensaverScreen(LogoScreen):
         screensaver_start = int(time.time() * 1000)
 
         # Screensaver must block any attempts to use the Renderer in another thread so it
-        # never gives up the lock until it returns.
+        # never gives up the lock until it returns. The animation itself is stepped by the
+        # `AnimationScheduler`, which pauses all other animations meanwhile.
         with self.renderer.lock:
+            self.animation = ScreensaverScreen.BounceAnimation(self)
             try:
+                self.animation.start()
                 while self._is_running:
                     if self.buttons.has_any_input() or self.buttons.override_ind:
                         break
-
-                    # Must crop the image to the exact display size
-                    crop = self.image.crop((
-                        self.cur_x, self.cur_y,
-                        self.cur_x + self.renderer.canvas_width, self.cur_y + self.renderer.canvas_height))
-                    self.renderer.disp.ShowImage(crop, 0, 0)
-
-                    self.cur_x += self.increment_x
-                    self.cur_y += self.increment_y
-
-                    # At each edge bump, calculate a new random rate of change for that axis
-                    if self.cur_x < self.min_coords[0]:
-                        self.cur_x = self.min_coords[0]
-                        self.increment_x = self.rand_increment()
-                        if self.increment_x < 0.0:
-                            self.increment_x *= -1.0
-                    elif self.cur_x > self.max_coords[0]:
-                        self.cur_x = self.max_coords[0]
-                        self.increment_x = self.rand_increment()
-                        if self.increment_x > 0.0:
-                            self.increment_x *= -1.0
-
-                    if self.cur_y < self.min_coords[1]:
-                        self.cur_y = self.min_coords[1]
-                        self.increment_y = self.rand_increment()
-                        if self.increment_y < 0.0:
-                            self.increment_y *= -1.0
-                    elif self.cur_y > self.max_coords[1]:
-                        self.cur_y = self.max_coords[1]
-                        self.increment_y = self.rand_increment()
-                        if self.increment_y > 0.0:
-                            self.increment_y *= -1.0
+                    time.sleep(self.INPUT_POLL_SECS)
 
             except KeyboardInterrupt as e:
                 # Exit triggered; close gracefully
@@ -234,13 +259,52 @@ class ScreensaverScreen(LogoScreen):
 
             finally:
                 self._is_running = False
+                self.animation.stop()
 
                 # Restore the original screen
                 self.renderer.show_image(self.last_screen)
 
 
-
     def stop(self):
         self._is_running = False
 
 
+
+    class BounceAnimation(Animation):
+        # Roughly the rate that full frame pushes used to sustain; the low power mode
+        # caps it lower.
+        fps = 30
+        is_exclusive = True
+        report_cpu_usage = True
+
+        def __init__(self, screen: "ScreensaverScreen"):
+            super().__init__()
+            self.screen = screen
+            self.prev_rect = None
+
+            # Work out the motion ahead of time so that each step is just a paste
+            if not screen.path:
+                screen.path.extend(screen.plan_path(screen.PATH_LENGTH))
+
+
+        def step(self) -> list[tuple[int, int, int, int]]:
+            screen = self.screen
+            renderer = screen.renderer
+            if not screen.path:
+                screen.path.extend(screen.plan_path(screen.PATH_LENGTH))
+
+            x, y = screen.path.popleft()
+            rect = (x, y, x + screen.sprite.width, y + screen.sprite.height)
+
+            if self.prev_rect is None:
+                # Black out whatever was onscreen
+                renderer.draw.rectangle((0, 0, renderer.canvas_width, renderer.canvas_height), fill="black")
+                dirty_rects = [(0, 0, renderer.canvas_width, renderer.canvas_height)]
+            else:
+                # Erase the logo from its previous position
+                renderer.draw.rectangle((self.prev_rect[0], self.prev_rect[1], self.prev_rect[2] - 1, self.prev_rect[3] - 1), fill="black")
+                dirty_rects = [self.prev_rect, rect]
+
+            renderer.canvas.paste(screen.sprite, rect[:2])
+            self.prev_rect = rect
+            return dirty_rects
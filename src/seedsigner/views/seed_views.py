@@ -222,7 +222,7 @@ class SeedMnemonicEntryView(View):
             # TRANSLATOR_NOTE: Inserts the word number (e.g. "Seed Word #6")
             title=_("Seed Word #{}").format(self.cur_word_index + 1),  # Human-readable 1-indexing!
             initial_letters=list(self.cur_word) if self.cur_word else ["a"],
-            wordlist=Seed.get_wordlist(wordlist_language_code=self.settings.get_value(SettingsConstants.SETTING__WORDLIST_LANGUAGE)),
+            wordlist_language_code=self.settings.get_value(SettingsConstants.SETTING__WORDLIST_LANGUAGE),
         )
 
         if ret == RET_CODE__BACK_BUTTON:
@@ -929,8 +929,8 @@ class SeedExportXpubDetailsView(View):
 
         else:
             # The derivation calc takes a few moments. Run the loading screen while we wait.
-            from seedsigner.gui.screens.screen import LoadingScreenThread
-            self.loading_screen = LoadingScreenThread(text=_("Generating xpub..."))
+            from seedsigner.gui.screens.screen import LoadingScreenAnimation
+            self.loading_screen = LoadingScreenAnimation(text=_("Generating xpub..."))
             self.loading_screen.start()
 
             try:
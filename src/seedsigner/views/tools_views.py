@@ -348,7 +348,7 @@ class ToolsCalcFinalWordShowFinalWordView(View):
         from seedsigner.helpers import mnemonic_generation
 
         wordlist_language_code = self.settings.get_value(SettingsConstants.SETTING__WORDLIST_LANGUAGE)
-        wordlist = Seed.get_wordlist(wordlist_language_code)
+        indexed_wordlist = Seed.get_wordlist_index(wordlist_language_code)
 
         # Prep the user's selected word / coin flips and the actual final word for
         # the display.
@@ -358,7 +358,7 @@ class ToolsCalcFinalWordShowFinalWordView(View):
         else:
             # Convert the user's final word selection into its binary index equivalent
             self.selected_final_word = self.controller.storage.pending_mnemonic[-1]
-            self.selected_final_bits = format(wordlist.index(self.selected_final_word), '011b')
+            self.selected_final_bits = format(indexed_wordlist.index(self.selected_final_word), '011b')
 
         if coin_flips:
             # fill the last bits (what will eventually be the checksum) with zeros
@@ -387,7 +387,7 @@ class ToolsCalcFinalWordShowFinalWordView(View):
         # And grab the actual final word's checksum bits
         self.actual_final_word = self.controller.storage.pending_mnemonic[-1]
         num_checksum_bits = 4 if mnemonic_length == 12 else 8
-        self.checksum_bits = format(wordlist.index(self.actual_final_word), '011b')[-num_checksum_bits:]
+        self.checksum_bits = format(indexed_wordlist.index(self.actual_final_word), '011b')[-num_checksum_bits:]
 
 
     def run(self):
@@ -636,10 +636,10 @@ class ToolsAddressExplorerAddressListView(View):
 
         else:
             try:
-                from seedsigner.gui.screens.screen import LoadingScreenThread
+                from seedsigner.gui.screens.screen import LoadingScreenAnimation
                 from seedsigner.helpers import embit_utils
                 # TRANSLATOR_NOTE: a status message that our payment addresses are being calculated
-                self.loading_screen = LoadingScreenThread(text=_("Calculating addrs..."))
+                self.loading_screen = LoadingScreenAnimation(text=_("Calculating addrs..."))
                 self.loading_screen.start()
 
                 if addr_storage_key not in data:
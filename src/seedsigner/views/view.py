@@ -198,6 +198,11 @@ class MainMenuView(View):
             button_data=button_data,
         )
 
+        if selected_menu_num == RET_CODE__POWER_BUTTON or button_data[selected_menu_num] != self.SCAN:
+            # Backing out of a scan lands here; only give up on any interrupted scan
+            # once the user moves on to something else.
+            self.controller.partial_scans.clear()
+
         if selected_menu_num == RET_CODE__POWER_BUTTON:
             return Destination(PowerOptionsView)
 
@@ -41,7 +41,7 @@ class BaseTest:
         Settings.SETTINGS_FILENAME = "settings-test.json"
 
         # Mock out the loading screen so it can't spawn. View classes must import locally!
-        patch('seedsigner.gui.screens.screen.LoadingScreenThread').start()
+        patch('seedsigner.gui.screens.screen.LoadingScreenAnimation').start()
 
         # Instantiate the mocked MicroSD; hold on to the instance so tests can manipulate
         # it later.
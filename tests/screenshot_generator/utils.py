@@ -1,4 +1,5 @@
 import os
+import threading
 
 from dataclasses import dataclass
 from PIL import Image, ImageDraw
@@ -30,7 +31,11 @@ class ScreenshotRenderer(Renderer):
 
         renderer.canvas = Image.new('RGB', (renderer.canvas_width, renderer.canvas_height))
         renderer.draw = ImageDraw.Draw(renderer.canvas)
-    
+
+        # Screenshots are saved directly; nothing is ever sent to a display
+        renderer.framebuffer = None
+        renderer.flush_thread = None
+
 
     def set_screenshot_filename(self, filename:str):
         self.screenshot_filename = filename
@@ -42,8 +47,9 @@ class ScreenshotRenderer(Renderer):
         self.screenshot_path = path
 
 
-    def show_image(self, image=None, alpha_overlay=None, is_background_thread: bool = False):            
-        if is_background_thread:
+    def show_image(self, image=None, alpha_overlay=None, show_direct=False, full_frame=False, dirty_rects=None, is_background_thread: bool = False):
+        if is_background_thread or threading.current_thread() is not threading.main_thread():
+            # Animations (stepped by the `AnimationScheduler`) aren't captured
             return
 
         if alpha_overlay:
@@ -59,6 +65,18 @@ class ScreenshotRenderer(Renderer):
         raise ScreenshotComplete()
 
 
+    def flush(self, full_frame=False, dirty_rects=None):
+        pass
+
+
+    def wait_for_flush(self, timeout: float = None) -> bool:
+        return True
+
+
+    def flush_cpu_time(self) -> float:
+        return 0.0
+
+
 
 @dataclass
 class ScreenshotConfig:
@@ -0,0 +1,221 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from seedsigner.models.animation import Animation, AnimationScheduler
+
+
+
+class FakeRenderer:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.updates = []
+        self.flush_cpu = 0.0
+
+    def show_image(self, dirty_rects=None):
+        self.updates.append(dirty_rects)
+
+    def wait_for_flush(self, timeout=None):
+        return True
+
+    def flush_cpu_time(self):
+        return self.flush_cpu
+
+
+
+class FakeAnimation(Animation):
+    def __init__(self, rects, fps=10, is_exclusive=False):
+        super().__init__()
+        self.rects = rects
+        self.fps = fps
+        self.is_exclusive = is_exclusive
+
+    def step(self):
+        return list(self.rects)
+
+
+
+@pytest.fixture
+def scheduler():
+    AnimationScheduler._instance = None
+    scheduler = AnimationScheduler.get_instance()
+    scheduler.renderer = FakeRenderer()
+    yield scheduler
+    AnimationScheduler._instance = None
+
+
+
+@pytest.fixture
+def manual_scheduler(scheduler):
+    """ Ticked by the test itself rather than from its own thread """
+    with patch.object(AnimationScheduler, "SchedulerThread"):
+        yield scheduler
+
+
+
+def test_one_display_update_per_tick(manual_scheduler):
+    spinner = FakeAnimation([(100, 100, 140, 140)])
+    edges = FakeAnimation([(0, 0, 240, 8), (0, 232, 240, 240)])
+    spinner.start()
+    edges.start()
+
+    manual_scheduler.tick()
+    assert spinner.num_steps == edges.num_steps == 1
+    assert manual_scheduler.renderer.updates == [[(100, 100, 140, 140), (0, 0, 240, 8), (0, 232, 240, 240)]]
+
+
+
+def test_animations_step_at_their_own_rate(manual_scheduler):
+    fast = FakeAnimation([(0, 0, 10, 10)], fps=1000)
+    slow = FakeAnimation([(20, 20, 30, 30)], fps=1)
+    fast.start()
+    slow.start()
+
+    manual_scheduler.tick()
+    time.sleep(0.01)
+    manual_scheduler.tick()
+    assert fast.num_steps == 2
+    assert slow.num_steps == 1
+    assert manual_scheduler.renderer.updates[-1] == [(0, 0, 10, 10)]
+
+
+
+def test_idle_animation_does_not_update_display(manual_scheduler):
+    paused = FakeAnimation([])
+    paused.start()
+
+    manual_scheduler.tick()
+    assert paused.num_steps == 1
+    assert manual_scheduler.renderer.updates == []
+
+
+
+def test_exclusive_animation_pauses_others(manual_scheduler):
+    background = FakeAnimation([(0, 0, 10, 10)])
+    screensaver = FakeAnimation([], is_exclusive=True)
+    background.start()
+    screensaver.start()
+
+    # The screensaver holds the lock for as long as it runs
+    with manual_scheduler.renderer.lock:
+        manual_scheduler.tick()
+    assert screensaver.num_steps == 1
+    assert background.num_steps == 0
+
+    screensaver.stop()
+    manual_scheduler.tick()
+    assert background.num_steps == 1
+
+
+
+def test_failing_animation_is_removed(manual_scheduler):
+    broken = FakeAnimation(None)
+    broken.start()
+    assert broken.is_alive()
+
+    manual_scheduler.tick()
+    assert not broken.is_alive()
+
+
+
+def test_cpu_budget_spaces_out_ticks(manual_scheduler):
+    class BusyAnimation(FakeAnimation):
+        def step(self):
+            # Burn 20ms of CPU
+            cpu_start = time.thread_time()
+            while time.thread_time() - cpu_start < 0.02:
+                pass
+            return super().step()
+
+    busy = BusyAnimation([(0, 0, 10, 10)], fps=1000)
+    busy.start()
+    manual_scheduler.cpu_budget = 0.5
+
+    tick_start = time.perf_counter()
+    manual_scheduler.tick()
+
+    # 20ms of work at a 50% budget means waiting at least 40ms until the next tick
+    assert manual_scheduler._next_tick_at - tick_start >= 0.04 - 0.001
+    assert manual_scheduler.busy_time >= 0.02
+    assert busy.step_cpu_time >= 0.02
+
+    busy.stop()
+    assert "1 steps" in busy.cpu_usage_summary()
+
+
+
+def test_cpu_budget_includes_display_updates(manual_scheduler):
+    animation = FakeAnimation([(0, 0, 10, 10)], fps=1000)
+    animation.start()
+    manual_scheduler.cpu_budget = 0.5
+
+    manual_scheduler.tick()
+
+    # Sending the last tick's update took the flush thread 30ms of CPU
+    manual_scheduler.renderer.flush_cpu += 0.03
+    tick_start = time.perf_counter()
+    manual_scheduler.tick()
+    assert manual_scheduler._next_tick_at - tick_start >= 0.06 - 0.001
+    assert manual_scheduler.busy_time >= 0.03
+
+
+
+def test_low_power_caps_fps(manual_scheduler):
+    FakeAnimation([(0, 0, 10, 10)], fps=1000).start()
+    manual_scheduler.set_low_power(True)
+
+    tick_start = time.perf_counter()
+    manual_scheduler.tick()
+    assert manual_scheduler._next_tick_at - tick_start >= 1 / AnimationScheduler.LOW_POWER_MAX_FPS - 0.001
+
+    manual_scheduler.set_low_power(False)
+    assert manual_scheduler.max_fps == AnimationScheduler.MAX_FPS
+
+
+
+def test_scheduler_thread(scheduler):
+    stepped = threading.Event()
+
+    class SignalingAnimation(FakeAnimation):
+        def step(self):
+            rects = super().step()
+            if self.num_steps == 2:
+                # This is the third step
+                stepped.set()
+            return rects
+
+    animation = SignalingAnimation([(0, 0, 10, 10)], fps=100)
+    animation.start()
+    try:
+        assert stepped.wait(timeout=5)
+    finally:
+        animation.stop()
+
+    # No more steps once `stop` returns
+    num_steps = animation.num_steps
+    time.sleep(0.05)
+    assert animation.num_steps == num_steps
+    assert not animation.is_alive()
+
+
+
+def test_failing_ticks_back_off(scheduler):
+    class BrokenRenderer(FakeRenderer):
+        num_calls = 0
+
+        def wait_for_flush(self, timeout=None):
+            BrokenRenderer.num_calls += 1
+            raise Exception("Display is gone")
+
+    scheduler.renderer = BrokenRenderer()
+    animation = FakeAnimation([(0, 0, 10, 10)], fps=100)
+    animation.start()
+    try:
+        time.sleep(0.3)
+    finally:
+        animation.stop()
+
+    # Retries after `ERROR_BACKOFF_SECS` rather than spinning
+    assert BrokenRenderer.num_calls == 1
@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+from seedsigner.helpers.ur2.bytewords import (Bytewords, Bytewords_Style_minimal, Bytewords_Style_standard,
+    Bytewords_Style_uri, decode_word, get_minimal_word, get_word)
+
+
+
+def test_reference_vectors():
+    """ From the BC-UR Bytewords spec """
+    data = bytes([0, 1, 2, 128, 255])
+    assert Bytewords.encode(Bytewords_Style_standard, data) == "able acid also lava zoom jade need echo taxi"
+    assert Bytewords.encode(Bytewords_Style_uri, data) == "able-acid-also-lava-zoom-jade-need-echo-taxi"
+    assert Bytewords.encode(Bytewords_Style_minimal, data) == "aeadaolazmjendeoti"
+
+    assert Bytewords.decode(Bytewords_Style_standard, "able acid also lava zoom jade need echo taxi") == data
+    assert Bytewords.decode(Bytewords_Style_uri, "able-acid-also-lava-zoom-jade-need-echo-taxi") == data
+    assert Bytewords.decode(Bytewords_Style_minimal, "aeadaolazmjendeoti") == data
+
+    # QR alphanumeric mode UR strings are uppercase
+    assert Bytewords.decode(Bytewords_Style_minimal, "AEADAOLAZMJENDEOTI") == data
+
+
+
+def test_round_trip():
+    for length in [1, 2, 100, 1000]:
+        data = os.urandom(length)
+        for style in [Bytewords_Style_standard, Bytewords_Style_uri, Bytewords_Style_minimal]:
+            assert Bytewords.decode(style, Bytewords.encode(style, data)) == data
+
+
+
+def test_checksum_is_always_four_bytes():
+    # This input's CRC32 (0x004eb362) has a leading zero byte
+    data = bytes.fromhex("0000d9")
+    encoded = Bytewords.encode(Bytewords_Style_minimal, data)
+    assert len(encoded) == 2 * (len(data) + 4)
+    assert Bytewords.decode(Bytewords_Style_minimal, encoded) == data
+
+
+
+def test_words():
+    for value in range(256):
+        assert decode_word(get_word(value), 4) == value
+        assert decode_word(get_minimal_word(value), 2) == value
+
+
+
+@pytest.mark.parametrize("style,encoded", [
+    # Corrupted checksum
+    (Bytewords_Style_minimal, "aeadaolazmjendeota"),
+    # Corrupted data
+    (Bytewords_Style_minimal, "adadaolazmjendeoti"),
+    # Not a Byteword
+    (Bytewords_Style_minimal, "aeadaolazmjendeotx"),
+    # Odd length
+    (Bytewords_Style_minimal, "aeadaolazmjendeot"),
+    # Too short to hold a checksum
+    (Bytewords_Style_minimal, "aeadaola"),
+    # Wrong middle letters
+    (Bytewords_Style_standard, "able acid also lava zoom jade need echo tbxi"),
+    # Wrong separator
+    (Bytewords_Style_standard, "able-acid-also-lava-zoom-jade-need-echo-taxi"),
+    (Bytewords_Style_uri, "able-acid-also-lava-zoom-jade-need-echo--taxi"),
+    # Not ASCII
+    (Bytewords_Style_minimal, "aeadaolazmjendeotí"),
+])
+def test_rejects_invalid(style, encoded):
+    with pytest.raises(ValueError):
+        Bytewords.decode(style, encoded)
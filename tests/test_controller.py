@@ -4,6 +4,7 @@ import pytest
 from base import BaseTest
 
 from seedsigner.controller import Controller
+from seedsigner.helpers import qr_detectors
 from seedsigner.models.settings_definition import SettingsConstants
 
 
@@ -110,7 +111,49 @@ class TestController(BaseTest):
         assert controller.settings.get_value(SettingsConstants.SETTING__DIRE_WARNINGS) == SettingsConstants.OPTION__ENABLED
         assert controller.settings.get_value(SettingsConstants.SETTING__QR_BRIGHTNESS_TIPS) == SettingsConstants.OPTION__ENABLED
         assert controller.settings.get_value(SettingsConstants.SETTING__PARTNER_LOGOS) == SettingsConstants.OPTION__ENABLED
+        assert controller.settings.get_value(SettingsConstants.SETTING__LOW_POWER_ANIMATIONS) == SettingsConstants.OPTION__DISABLED
 
         # Hidden Settings defaults
         assert controller.settings.get_value(SettingsConstants.SETTING__QR_BRIGHTNESS) == 62
+        assert controller.settings.get_value(SettingsConstants.SETTING__QR_DETECTOR) == "zbar"
+
+
+    def test_applies_qr_detector_setting(self):
+        """ The Controller should use the saved QR detector, if it's available """
+        probed = []
+
+        class AvailableDetector(qr_detectors.BaseQRDetector):
+            name = "test-available"
+
+            @classmethod
+            def is_available(cls) -> bool:
+                return True
+
+        class UnavailableDetector(AvailableDetector):
+            name = "test-unavailable"
+
+            @classmethod
+            def is_available(cls) -> bool:
+                probed.append(cls.name)
+                return False
+
+        for detector_cls in [AvailableDetector, UnavailableDetector]:
+            qr_detectors.register_detector(detector_cls)
+        try:
+            self.settings.set_value(SettingsConstants.SETTING__QR_DETECTOR, AvailableDetector.name)
+            BaseTest.reset_controller()
+            assert type(qr_detectors.get_detector()) == AvailableDetector
+
+            # Only the saved detector's engine is imported at boot
+            assert probed == []
+
+            # Keeps the current detector
+            self.settings.set_value(SettingsConstants.SETTING__QR_DETECTOR, UnavailableDetector.name)
+            BaseTest.reset_controller()
+            assert type(qr_detectors.get_detector()) == AvailableDetector
+
+        finally:
+            qr_detectors._selected_detector = None
+            for detector_cls in [AvailableDetector, UnavailableDetector]:
+                qr_detectors._DETECTORS.pop(detector_cls.name)
 
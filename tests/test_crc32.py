@@ -0,0 +1,48 @@
+import random
+
+from seedsigner.helpers.ur2.crc32 import crc32, crc32n
+
+
+
+def reference_crc32(buf):
+    """ The original pure-Python, table-driven implementation """
+    table = []
+    for i in range(256):
+        c = i
+        for j in range(8):
+            c = (c >> 1) if (c % 2 == 0) else (0xEDB88320 ^ (c >> 1))
+        table.append(c)
+
+    crc = 0xFFFFFFFF
+    for byte in buf:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return 0xFFFFFFFF & ~crc
+
+
+
+def test_reference_vectors():
+    assert crc32(b"") == 0
+    assert crc32(b"Hello, world!") == 0xebe6c6e6
+    assert crc32n(b"Hello, world!") == bytes.fromhex("ebe6c6e6")
+    assert crc32(b"Wolf") == 0x598c84dc
+    assert crc32n(b"Wolf") == bytes.fromhex("598c84dc")
+
+
+
+def test_matches_reference_implementation():
+    """ Property test: identical to the original implementation for random inputs """
+    random.seed(0)
+    for i in range(300):
+        buf = random.randbytes(random.choice([0, 1, 2, 3, 4, 7, 64, 255, random.randint(0, 5000)]))
+        assert crc32(buf) == reference_crc32(buf)
+        assert crc32(bytearray(buf)) == reference_crc32(buf)
+        assert crc32(memoryview(buf)) == reference_crc32(buf)
+        assert crc32n(buf) == reference_crc32(buf).to_bytes(4, 'big')
+
+
+
+def test_crc32n_is_always_four_bytes():
+    # 0x004eb362 has a leading zero byte; the original `crc32n` returned just 3 bytes
+    assert crc32(bytes.fromhex("0000d9")) == 0x004eb362
+    assert crc32n(bytes.fromhex("0000d9")) == bytes.fromhex("004eb362")
+    assert crc32n(b"") == bytes(4)
@@ -1,3 +1,5 @@
+import pytest
+
 from seedsigner.models.decode_qr import DecodeQR, DecodeQRStatus
 from seedsigner.models.psbt_parser import PSBTParser
 from seedsigner.models.qr_type import QRType
@@ -434,3 +436,81 @@ def test_specter_wallet_json2():
     
     assert d.qr_type == QRType.WALLET__SPECTER
     assert d.is_complete
+
+
+
+def test_is_segment_type():
+    """ The locked-type fast path must never disagree with the full classifier """
+    samples = [
+        ("UR:CRYPTO-PSBT/1-3/LPADAXCFAXHLCYYNCHAXWZ", QRType.PSBT__UR2, True),
+        ("ur:crypto-account/2-4/lpaoaacskpcymomnlgryhdckoeadcyss", QRType.ACCOUNT__UR, True),
+        ("UR:CRYPTO-OUTPUT/TAADMWTAADDLOSAOWKAXHDCLAOYLFLOLPTS", QRType.OUTPUT__UR, True),
+        (b"UR:BYTES/1-9/LPADASCFAXHLCYYNCHAXWZ", QRType.BYTES__UR, True),
+        ("p1of5 cHNidP8BAKQCAAAAA6DLc9RAdKwWQb/7Nrq1FyAtDQ3e0w5E4LkLpcrwBL0a", QRType.PSBT__SPECTER, True),
+        ('p1of3 {"label": "SeedSigner Dev Funds", "blockheight": 692143', QRType.WALLET__SPECTER, True),
+
+        # Frames of a different type, or types that always need the full classifier
+        ("UR:CRYPTO-PSBT/1-3/LPADAXCFAXHLCYYNCHAXWZ", QRType.ACCOUNT__UR, False),
+        ('p1of3 {"label": "SeedSigner Dev Funds", "blockheight": 692143', QRType.PSBT__SPECTER, False),
+        ("p1of5 cHNidP8BAKQCAAAAA6DLc9RAdKwWQb/7Nrq1FyAtDQ3e0w5E4LkLpcrwBL0a", QRType.WALLET__SPECTER, False),
+        ("cHNidP8 not base64", QRType.PSBT__BASE64, False),
+        ("011513251154012711900771041507421289190620080870026613431420201617920614089619290300152408010643", QRType.SEED__SEEDQR, False),
+        (b"\xff\xfe", QRType.PSBT__UR2, False),
+    ]
+    for data, qr_type, expected in samples:
+        assert DecodeQR.is_segment_type(data, qr_type) == expected
+        if expected:
+            assert DecodeQR.detect_segment_type(data) == qr_type
+
+    # The one exception: PSBT__BASE64 doesn't parse the PSBT, so a truncated one passes
+    assert DecodeQR.is_segment_type("cHNidP8BAAAA", QRType.PSBT__BASE64)
+    with pytest.raises(Exception, match="Unrecognized"):
+        DecodeQR.detect_segment_type("cHNidP8BAAAA")
+
+
+
+def test_locked_qr_type_skips_classifier(monkeypatch):
+    """ Only the first frame of an animated QR should need the full classifier """
+    parts = [
+        "UR:CRYPTO-ACCOUNT/1-4/LPADAACSKPCYMOMNLGRYHDCKOEADCYSSMECPONAOLYTAADMETAADDLOXAXHDCLAOKSRLNLKPUEGYATHPMNSNIYMUECBY",
+        "UR:CRYPTO-ACCOUNT/2-4/LPAOAACSKPCYMOMNLGRYHDCKKKGHZMLUZORPVDGUOTECSTTKTOLPCWPTNTLKZTTIZTBEAAHDCXVDTPMYRSTDMOPSCXFZ",
+        "UR:CRYPTO-ACCOUNT/3-4/LPAXAACSKPCYMOMNLGRYHDCKSPZSBZSPGERLGDATUYNLPYBTGYIYYKBTWTAOSWKSVTSGCHBYDKYAVDAMTAADMONDGDFD",
+        "UR:CRYPTO-ACCOUNT/4-4/LPAAAACSKPCYMOMNLGRYHDCKDYOTADLOCSDYYKADYKAEYKAOYKAOCYSSMECPONAXAAAYCYIOREKKJKAEAEAEWZWDMYON",
+    ]
+    detect_segment_type = DecodeQR.detect_segment_type
+    calls = []
+    def counting_detect_segment_type(s, wordlist_language_code=None):
+        calls.append(s)
+        return detect_segment_type(s, wordlist_language_code=wordlist_language_code)
+    monkeypatch.setattr(DecodeQR, "detect_segment_type", staticmethod(counting_detect_segment_type))
+
+    d = DecodeQR()
+    for part in parts:
+        d.add_data(part)
+
+    assert d.is_complete
+    assert d.qr_type == QRType.ACCOUNT__UR
+    assert calls == parts[:1]
+
+    # A frame of a different type still raises
+    try:
+        d.add_data("p1of5 cHNidP8BAKQCAAAAA6DLc9RAdKwWQb/7Nrq1FyAtDQ3e0w5E4LkLpcrwBL0a")
+        assert False
+    except Exception as e:
+        assert "Unexpected Type Change" in str(e)
+
+
+
+def test_specter_percent_complete():
+    d = DecodeQR()
+    assert d.get_percent_complete() == 0
+
+    assert d.add_data("p1of3 cHNidP8BAKQCAAAAA6DL") == DecodeQRStatus.PART_COMPLETE
+    assert d.get_percent_complete() == 33
+
+    # Repeated segments don't count
+    assert d.add_data("p1of3 cHNidP8BAKQCAAAAA6DL") == DecodeQRStatus.PART_EXISTING
+    assert d.get_percent_complete() == 33
+
+    assert d.add_data("p3of3 AAAAAAAA") == DecodeQRStatus.PART_COMPLETE
+    assert d.get_percent_complete() == 66
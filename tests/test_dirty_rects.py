@@ -0,0 +1,83 @@
+from PIL import Image, ImageDraw
+
+from seedsigner.helpers.dirty_rects import find_dirty_rects, merge_rects
+
+
+
+def apply(previous: Image.Image, current: Image.Image, rects) -> Image.Image:
+    """ Simulates pushing just the dirty rects to a display showing `previous` """
+    displayed = previous.copy()
+    for rect in rects:
+        displayed.paste(current.crop(rect), rect[:2])
+    return displayed
+
+
+
+def test_no_changes():
+    image = Image.new("RGB", (240, 240), "#123456")
+    assert find_dirty_rects(image, image.copy()) == []
+
+
+
+def test_single_pixel_change():
+    previous = Image.new("RGB", (240, 240))
+    current = previous.copy()
+
+    # Even the smallest change in a single channel is picked up
+    current.putpixel((100, 37), (0, 0, 1))
+    assert find_dirty_rects(previous, current) == [(100, 37, 101, 38)]
+
+
+
+def test_separate_changes():
+    previous = Image.new("RGB", (240, 240))
+    current = previous.copy()
+    draw = ImageDraw.Draw(current)
+
+    # A button highlight and a spinner arc in different parts of the screen
+    draw.rectangle((10, 50, 229, 89), fill="orange")
+    draw.rectangle((100, 200, 139, 219), fill="white")
+    rects = find_dirty_rects(previous, current)
+    assert rects == [(10, 50, 230, 90), (100, 200, 140, 220)]
+    assert apply(previous, current, rects).tobytes() == current.tobytes()
+
+
+
+def test_border_change():
+    """ A pulsing border shouldn't send the unchanged middle of the screen """
+    previous = Image.new("RGB", (240, 240))
+    current = previous.copy()
+    ImageDraw.Draw(current).rectangle((0, 0, 240, 240), outline="red", width=6)
+
+    rects = find_dirty_rects(previous, current)
+    assert len(rects) == 4
+    assert sum((r[2] - r[0]) * (r[3] - r[1]) for r in rects) < 240 * 240 / 4
+    assert apply(previous, current, rects).tobytes() == current.tobytes()
+
+
+
+def test_scattered_changes_fall_back_to_bounding_box():
+    previous = Image.new("RGB", (240, 240))
+    current = previous.copy()
+    for i in range(10):
+        current.putpixel((20 * i + 5, 20 * i + 7), (255, 255, 255))
+
+    rects = find_dirty_rects(previous, current, max_rects=6)
+    assert rects == [(5, 7, 186, 188)]
+    assert apply(previous, current, rects).tobytes() == current.tobytes()
+
+
+
+def test_merge_rects():
+    # Overlapping rects are combined, including transitively via a later rect
+    rects = [(0, 0, 10, 10), (20, 0, 30, 10), (5, 5, 25, 8), (100, 100, 110, 110)]
+    assert merge_rects(rects) == [(0, 0, 30, 10), (100, 100, 110, 110)]
+
+    # Empty rects are dropped; touching (but not overlapping) rects are kept apart
+    assert merge_rects([(5, 5, 5, 10), (0, 0, 10, 10), (10, 0, 20, 10)]) == [(0, 0, 10, 10), (10, 0, 20, 10)]
+
+
+
+def test_merge_rects_falls_back_to_bounding_box():
+    rects = [(10 * i, 10 * i, 10 * i + 5, 10 * i + 5) for i in range(4)]
+    assert merge_rects(rects, max_rects=3) == [(0, 0, 35, 35)]
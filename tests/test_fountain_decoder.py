@@ -0,0 +1,177 @@
+import os
+import random
+
+from seedsigner.helpers.ur2.fountain_decoder import FountainDecoder, indexes_to_mask, mask_to_indexes
+from seedsigner.helpers.ur2.fountain_encoder import FountainEncoder
+from seedsigner.helpers.ur2.utils import xor_into, xor_with
+
+from legacy_fountain_decoder import FountainDecoder as LegacyFountainDecoder
+
+
+
+def test_mask_conversions():
+    assert indexes_to_mask([]) == 0
+    assert indexes_to_mask({0, 3, 64}) == 0b1001 | (1 << 64)
+    assert mask_to_indexes(indexes_to_mask({0, 3, 64})) == [0, 3, 64]
+
+
+
+def test_xor():
+    a = bytes([0x00, 0xff, 0x0f, 0x80])
+    b = bytes([0xff, 0xff, 0xf0, 0x01])
+    assert xor_with(a, b) == bytes([0xff, 0x00, 0xff, 0x81])
+
+    # Leading zero bytes survive the round trip through an int
+    assert xor_with(b"\x00\x00\x01", b"\x00\x00\x01") == b"\x00\x00\x00"
+
+    target = bytearray(a)
+    xor_into(target, b)
+    assert target == bytearray([0xff, 0x00, 0xff, 0x81])
+
+
+
+def test_partition_message_pads_last_fragment():
+    fragments = FountainEncoder.partition_message(b"abcdefg", 3)
+    assert [bytes(fragment) for fragment in fragments] == [b"abc", b"def", b"g\x00\x00"]
+
+
+
+def test_decodes_with_lost_and_reordered_parts():
+    random.seed(0)
+    for seq_len in [2, 5, 20, 100]:
+        message = os.urandom(seq_len * 10)
+        encoder = FountainEncoder(message, 10)
+        assert encoder.seq_len() == seq_len
+        parts = [encoder.part_at(seq_num) for seq_num in range(1, 5 * seq_len + 20)]
+
+        # Drop a third of the parts and shuffle the rest
+        parts = [part for part in parts if random.random() > 0.33]
+        random.shuffle(parts)
+
+        decoder = FountainDecoder()
+        for part in parts:
+            decoder.receive_part(part)
+            if decoder.is_complete():
+                break
+
+        assert decoder.is_success()
+        assert decoder.result_message() == message
+        assert decoder.received_part_indexes == set(range(seq_len))
+
+
+
+def test_mixed_parts_are_peeled():
+    message = os.urandom(50)
+    encoder = FountainEncoder(message, 10)
+    mixed_parts = [encoder.part_at(seq_num) for seq_num in range(6, 200)]
+    mixed_parts = [part for part in mixed_parts if len(FountainDecoder.Part.from_encoder_part(part).indexes) > 1]
+
+    decoder = FountainDecoder()
+    assert decoder.receive_part(mixed_parts[0])
+    assert decoder.last_part_indexes == FountainDecoder.Part.from_encoder_part(mixed_parts[0]).indexes
+    assert len(decoder.mixed_parts) == 1
+
+    # A repeat of a mixed part adds nothing
+    assert not decoder.receive_part(mixed_parts[0])
+    assert len(decoder.mixed_parts) == 1
+
+    # Solving a fragment removes it from the mixed parts that contain it
+    index = min(decoder.last_part_indexes)
+    decoder.receive_part(encoder.part_at(index + 1))
+    assert index in decoder.received_part_indexes
+    for mask in decoder.mixed_parts:
+        assert index not in mask_to_indexes(mask)
+    assert index not in decoder.mixed_parts_by_index
+
+
+
+def test_weighted_progress_is_maintained_incrementally():
+    def recomputed(decoder):
+        # The weighted estimate, computed from scratch
+        index_scores = {}
+        for mask in decoder.mixed_parts:
+            indexes = mask_to_indexes(mask)
+            for index in indexes:
+                index_scores[index] = index_scores.get(index, 0.0) + 1.0 / len(indexes)
+        mixed_score = sum(min(score, FountainDecoder.MIXED_INDEX_SCORE_CEILING) for score in index_scores.values())
+        return (len(decoder.received_part_indexes) + mixed_score) / decoder.expected_part_count()
+
+    random.seed(1)
+    message = os.urandom(300)
+    encoder = FountainEncoder(message, 10)
+    decoder = FountainDecoder()
+    assert decoder.estimated_percent_complete(weight_mixed_frames=True) == 0
+
+    seq_num = 0
+    while not decoder.is_complete():
+        seq_num += 1
+        if random.random() < 0.5:
+            continue
+        decoder.receive_part(encoder.part_at(seq_num))
+        if not decoder.is_complete():
+            assert abs(decoder.estimated_percent_complete(weight_mixed_frames=True) - recomputed(decoder)) < 1e-9
+
+    assert decoder.estimated_percent_complete(weight_mixed_frames=True) == 1
+
+
+
+def test_matches_legacy_decoder():
+    """
+    The peeling decoder must complete on the same part as the original decoder and
+    return the same message, whatever parts are lost, reordered or repeated.
+    """
+    rng = random.Random(2)
+    for trial in range(60):
+        seq_len = rng.choice([1, 2, 3, 5, 8, 13, 20, 40, 100])
+        message = rng.randbytes(max(10, seq_len * 10 - rng.randrange(10)))
+        encoder = FountainEncoder(message, 10)
+        parts = [encoder.part_at(seq_num) for seq_num in range(1, 4 * seq_len + 30)]
+        parts = [part for part in parts if rng.random() > 0.3]
+        rng.shuffle(parts)
+        parts += parts[:len(parts) // 4]
+
+        legacy_decoder = LegacyFountainDecoder()
+        decoder = FountainDecoder()
+        for part in parts:
+            legacy_had_empty_part = frozenset() in legacy_decoder.mixed_parts
+            legacy_added_info = legacy_decoder.receive_part(part)
+            added_info = decoder.receive_part(part)
+            if added_info != legacy_added_info:
+                # The only difference: the legacy decoder records a mixed part whose
+                # fragments are all solved as an empty mixed part (see `receive_part`)
+                assert legacy_added_info and not added_info
+                assert not legacy_had_empty_part and frozenset() in legacy_decoder.mixed_parts
+
+            assert decoder.received_part_indexes == legacy_decoder.received_part_indexes
+            assert decoder.is_complete() == legacy_decoder.is_complete()
+            if decoder.is_complete():
+                break
+
+        if decoder.is_complete():
+            assert decoder.is_success() == legacy_decoder.is_success()
+            assert decoder.result_message() == legacy_decoder.result_message()
+
+
+
+def test_solved_mixed_part_adds_nothing():
+    message = os.urandom(50)
+    encoder = FountainEncoder(message, 10)
+    decoder = FountainDecoder()
+    for seq_num in [1, 2, 3]:
+        assert decoder.receive_part(encoder.part_at(seq_num))
+
+    # A mixed part of fragments that are all solved already
+    for seq_num in range(6, 200):
+        mixed_part = encoder.part_at(seq_num)
+        indexes = FountainDecoder.Part.from_encoder_part(mixed_part).indexes
+        if len(indexes) > 1 and indexes <= {0, 1, 2}:
+            break
+    assert not decoder.receive_part(mixed_part)
+    assert decoder.mixed_parts == {}
+
+    # The legacy decoder recorded it as an empty mixed part
+    legacy_decoder = LegacyFountainDecoder()
+    for seq_num in [1, 2, 3]:
+        legacy_decoder.receive_part(encoder.part_at(seq_num))
+    assert legacy_decoder.receive_part(mixed_part)
+    assert frozenset() in legacy_decoder.mixed_parts
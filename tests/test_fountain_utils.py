@@ -0,0 +1,53 @@
+import random
+
+from seedsigner.helpers.ur2.fountain_utils import choose_fragments, degree_sampler, shuffled
+from seedsigner.helpers.ur2.random_sampler import RandomSampler
+from seedsigner.helpers.ur2.utils import int_to_bytes
+from seedsigner.helpers.ur2.xoshiro256 import Xoshiro256
+
+
+
+def reference_choose_fragments(seq_num, seq_len, checksum):
+    """ The original implementation: new sampler and a full shuffle every time """
+    if seq_num <= seq_len:
+        return set([seq_num - 1])
+    rng = Xoshiro256.from_bytes(int_to_bytes(seq_num) + int_to_bytes(checksum))
+    degree = RandomSampler([1.0 / i for i in range(1, seq_len + 1)]).next(lambda: rng.next_double()) + 1
+    remaining = list(range(seq_len))
+    result = []
+    while len(remaining) > 0:
+        result.append(remaining.pop(rng.next_int(0, len(remaining) - 1)))
+    return set(result[0:degree])
+
+
+
+def test_choose_fragments_matches_reference():
+    random.seed(0)
+    for i in range(500):
+        seq_len = random.choice([1, 2, 3, 11, 50, 200])
+        seq_num = random.randint(1, 10 * seq_len + 20)
+        checksum = random.getrandbits(32)
+
+        # Twice: computed, then from the cache
+        assert choose_fragments(seq_num, seq_len, checksum) == reference_choose_fragments(seq_num, seq_len, checksum)
+        assert choose_fragments(seq_num, seq_len, checksum) == reference_choose_fragments(seq_num, seq_len, checksum)
+
+
+
+def test_cached_results_are_not_shared():
+    indexes = choose_fragments(100, 20, 1234)
+    indexes.add(99)
+    assert 99 not in choose_fragments(100, 20, 1234)
+
+
+
+def test_partial_shuffle():
+    # The first items drawn don't depend on how many are drawn
+    full = shuffled(range(30), Xoshiro256.from_bytes(b"seed"))
+    assert sorted(full) == list(range(30))
+    assert shuffled(range(30), Xoshiro256.from_bytes(b"seed"), count=5) == full[:5]
+
+
+
+def test_degree_sampler_is_cached():
+    assert degree_sampler(42) is degree_sampler(42)
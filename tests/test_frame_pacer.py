@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+from seedsigner.models.threads import FramePacer
+
+
+
+class FakeClock:
+    def __init__(self, oversleep: float = 0.0):
+        self.now = 100.0
+        self.oversleep = oversleep
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds + self.oversleep
+
+
+
+def run_frames(work_durations: list[float], target_fps: float = 10, oversleep: float = 0.0) -> tuple[FramePacer, list[int], list[float]]:
+    """ Simulates an animation loop where each frame's work takes the given time """
+    clock = FakeClock(oversleep=oversleep)
+    with patch("seedsigner.models.threads.time", clock):
+        pacer = FramePacer(target_fps)
+        advances = []
+        present_times = []
+        for work in work_durations:
+            clock.now += work
+            advances.append(pacer.wait())
+            present_times.append(clock.now)
+    return pacer, advances, present_times
+
+
+
+def test_frames_are_presented_on_deadlines():
+    # Work that varies from frame to frame but always fits in the frame interval
+    pacer, advances, present_times = run_frames([0.01, 0.08, 0.03, 0.09, 0.0, 0.05])
+    assert advances == [1] * 6
+    start = present_times[0]
+    assert [round(t - start, 6) for t in present_times] == [0.0, 0.1, 0.2, 0.3, 0.4, 0.5]
+    assert pacer.frames_skipped == 0
+    assert round(pacer.achieved_fps, 6) == 10
+
+
+
+def test_overdue_frames_are_skipped():
+    # The third frame's work overruns its deadline by more than a frame interval, so
+    # it's presented in the following frame's slot and one frame is skipped.
+    pacer, advances, present_times = run_frames([0.0, 0.05, 0.27, 0.02, 0.05])
+    assert advances == [1, 1, 2, 1, 1]
+    assert pacer.frames_skipped == 1
+    assert pacer.frames_presented == 5
+
+    # Back on the original schedule afterwards
+    start = present_times[0]
+    assert [round(t - start, 6) for t in present_times] == [0.0, 0.1, 0.37, 0.4, 0.5]
+
+
+
+def test_late_wakeups_are_measured():
+    # Every sleep overshoots by 20ms; frames are presented late but the schedule holds
+    pacer, advances, present_times = run_frames([0.0] * 6, oversleep=0.02)
+    assert advances == [1] * 6
+    start = present_times[0]
+    assert [round(t - start, 6) for t in present_times] == [0.0, 0.12, 0.22, 0.32, 0.42, 0.52]
+    assert pacer._present_times[-1] == present_times[-1]
+    assert round(pacer.achieved_fps, 6) == round(5 / 0.52, 6)
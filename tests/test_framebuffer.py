@@ -0,0 +1,148 @@
+import array
+import threading
+
+from PIL import Image
+
+from seedsigner.helpers import framebuffer
+from seedsigner.helpers.framebuffer import DisplayFlushThread, RGB565Framebuffer
+
+
+
+def frame(width: int = 240, height: int = 240, color: int = 0x0000) -> array.array:
+    return array.array("H", [color]) * (width * height)
+
+
+
+def test_first_update_is_full_frame():
+    fb = RGB565Framebuffer(240, 240)
+    pixels = frame(color=0x1234)
+    assert fb.update(pixels) == [(0, 0, 240, 240)]
+    assert fb.buffer == pixels.tobytes()
+
+    # Nothing changed
+    assert fb.update(pixels) == []
+
+    # Forced full frame
+    assert fb.update(pixels, full_frame=True) == [(0, 0, 240, 240)]
+
+
+
+def test_partial_update():
+    fb = RGB565Framebuffer(240, 240)
+    pixels = frame()
+    fb.update(pixels)
+
+    # Change a 20x10 block and a single byte of one pixel
+    for y in range(50, 60):
+        for x in range(100, 120):
+            pixels[y * 240 + x] = 0xF800
+    pixels[200 * 240 + 7] = 0x0100
+
+    rects = fb.update(pixels)
+    assert rects == [(100, 50, 120, 60), (7, 200, 8, 201)]
+    assert fb.buffer == pixels.tobytes()
+
+    # Windows come out in display write order
+    assert fb.window(rects[0]).tobytes() == b"\x00\xf8" * 200
+    assert fb.window(rects[1]).tobytes() == b"\x00\x01"
+
+
+
+def test_update_with_known_dirty_rects():
+    fb = RGB565Framebuffer(240, 240)
+    pixels = frame()
+    fb.update(pixels)
+
+    for y in range(50, 60):
+        for x in range(100, 120):
+            pixels[y * 240 + x] = 0xF800
+
+    # Overlapping rects are merged and clipped to the screen; nothing else is compared
+    rects = fb.update(pixels, dirty_rects=[(100, 50, 110, 60), (105, 50, 120, 60), (230, 230, 250, 250)])
+    assert rects == [(100, 50, 120, 60), (230, 230, 240, 240)]
+    assert fb.buffer == pixels.tobytes()
+
+    # Changes outside of the given rects aren't picked up
+    pixels[0] = 0xFFFF
+    assert fb.update(pixels, dirty_rects=[]) == []
+    assert fb.buffer != pixels.tobytes()
+
+
+
+def test_update_from_image_converts_only_dirty_rects(monkeypatch):
+    converted = []
+
+    def fake_to_rgb565(image):
+        # Any one-to-one stand-in for the real conversion will do
+        converted.append(image.size)
+        rgb = image.tobytes()
+        return array.array("H", [(rgb[i] << 8) | rgb[i + 1] for i in range(0, len(rgb), 3)])
+    monkeypatch.setattr(framebuffer, "to_rgb565", fake_to_rgb565)
+
+    fb = RGB565Framebuffer(240, 240)
+    image = Image.new("RGB", (240, 240), (0, 0, 0))
+    assert fb.update_from_image(image) == [(0, 0, 240, 240)]
+    assert converted == [(240, 240)]
+
+    image.paste((0x12, 0x34, 0), (100, 50, 120, 60))
+    image.paste((0x56, 0x78, 0), (0, 0, 10, 10))
+    converted.clear()
+    rects = fb.update_from_image(image, dirty_rects=[(100, 50, 110, 60), (105, 50, 120, 60)])
+    assert rects == [(100, 50, 120, 60)]
+    assert converted == [(20, 10)]
+
+    # Matches a full conversion within the rect; untouched outside of it
+    expected = fake_to_rgb565(image)
+    assert fb.window(rects[0]).tobytes() == fake_to_rgb565(image.crop(rects[0])).tobytes()
+    assert fb.buffer != expected.tobytes()
+    assert fb.window((0, 0, 10, 10)).tobytes() == b"\x00" * 200
+
+    # A full update picks up the rest
+    assert fb.update_from_image(image, full_frame=True) == [(0, 0, 240, 240)]
+    assert fb.buffer == expected.tobytes()
+
+
+
+def test_full_width_window_is_not_copied():
+    fb = RGB565Framebuffer(240, 240)
+    fb.update(frame())
+
+    window = fb.window((0, 10, 240, 20))
+    assert window.obj is fb.buffer
+    assert len(window) == 240 * 10 * 2
+
+
+
+def test_flush_thread_coalesces_pending_frames():
+    pushed = []
+    first_push_started = threading.Event()
+    release_first_push = threading.Event()
+
+    def push(image, full_frame, dirty_rects):
+        pushed.append((image, full_frame, dirty_rects))
+        first_push_started.set()
+        release_first_push.wait()
+
+    flush_thread = DisplayFlushThread(push=push)
+    flush_thread.start()
+    try:
+        flush_thread.submit("frame 1", dirty_rects=[(0, 0, 10, 10)])
+        assert first_push_started.wait(timeout=5)
+
+        # These all arrive while the first push is still in progress
+        flush_thread.submit("frame 2", full_frame=True, dirty_rects=[(0, 0, 10, 10)])
+        flush_thread.submit("frame 3")
+        flush_thread.submit("frame 4", dirty_rects=[(20, 20, 30, 30)])
+        assert not flush_thread.wait_until_idle(timeout=0.01)
+
+        release_first_push.set()
+        assert flush_thread.wait_until_idle(timeout=5)
+
+        # Only the newest frame was sent, still as a full frame
+        assert pushed == [("frame 1", False, [(0, 0, 10, 10)]), ("frame 4", True, None)]
+        assert flush_thread.frames_submitted == 4
+        assert flush_thread.frames_pushed == 2
+        assert flush_thread.frames_dropped == 2
+        assert flush_thread.max_latency >= flush_thread.last_latency > 0
+    finally:
+        flush_thread.stop()
@@ -0,0 +1,73 @@
+import os
+
+from urtypes.bytes import Bytes
+
+from seedsigner.helpers.ur2.ur import UR
+from seedsigner.helpers.ur2.ur_encoder import UREncoder
+from seedsigner.models.decode_qr import DecodeQR, DecodeQRStatus
+from seedsigner.models.partial_scan_cache import PartialScanCache
+from seedsigner.models.qr_type import QRType
+
+
+
+def make_encoder(message_len: int = 500) -> UREncoder:
+    return UREncoder(ur=UR("bytes", Bytes(os.urandom(message_len)).to_cbor()), max_fragment_len=50)
+
+
+
+def test_resumes_interrupted_scan():
+    partial_scans = PartialScanCache()
+    encoder = make_encoder()
+    seq_len = encoder.fountain_encoder.seq_len()
+
+    # Scan the first half, then get interrupted
+    decoder = DecodeQR(partial_scans=partial_scans)
+    for seq_num in range(1, seq_len // 2 + 1):
+        assert decoder.add_data(encoder.part_at(seq_num)) == DecodeQRStatus.PART_COMPLETE
+    assert decoder.resume_key == (QRType.BYTES__UR, encoder.fountain_encoder.checksum, seq_len)
+    assert partial_scans.save(decoder)
+
+    # The rescan picks up where the first one left off
+    rescan = DecodeQR(partial_scans=partial_scans)
+    assert rescan.add_data(encoder.part_at(1)) == DecodeQRStatus.PART_EXISTING
+    assert rescan.decoder is decoder.decoder
+    assert len(partial_scans) == 0
+
+    for seq_num in range(seq_len // 2 + 1, seq_len):
+        assert rescan.add_data(encoder.part_at(seq_num)) == DecodeQRStatus.PART_COMPLETE
+    assert rescan.add_data(encoder.part_at(seq_len)) == DecodeQRStatus.COMPLETE
+    assert rescan.decoder.result_message() == encoder.ur
+
+    # Nothing left to resume
+    assert not partial_scans.save(rescan)
+
+
+
+def test_different_payload_evicts():
+    partial_scans = PartialScanCache()
+    encoder = make_encoder()
+
+    decoder = DecodeQR(partial_scans=partial_scans)
+    decoder.add_data(encoder.part_at(1))
+    partial_scans.save(decoder)
+
+    # A different animated QR starts from scratch and discards the saved scan
+    other_encoder = make_encoder()
+    rescan = DecodeQR(partial_scans=partial_scans)
+    assert rescan.add_data(other_encoder.part_at(1)) == DecodeQRStatus.PART_COMPLETE
+    assert rescan.decoder is not decoder.decoder
+    assert len(partial_scans) == 0
+
+
+
+def test_only_incomplete_animated_scans_are_saved():
+    partial_scans = PartialScanCache()
+
+    decoder = DecodeQR(partial_scans=partial_scans)
+    assert decoder.add_data("bitcoin:bc1qcr8te4kr609gcawutmrza0j4xv80jy8z306fyu") == DecodeQRStatus.COMPLETE
+    assert decoder.resume_key is None
+    assert not partial_scans.save(decoder)
+
+    # Nothing scanned yet
+    assert not partial_scans.save(DecodeQR(partial_scans=partial_scans))
+    assert len(partial_scans) == 0
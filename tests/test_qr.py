@@ -0,0 +1,324 @@
+import os
+import random
+import qrcode
+
+from seedsigner.helpers.qr import QR, QRSymbolLayout
+
+
+
+def libqrencode_penalty(width: int, frame: bytes) -> int:
+    """
+    Straight port of libqrencode's `Mask_mask` / `Mask_evaluateSymbol` scoring
+    (mask.c) to check our vectorized version against.
+    """
+    def run_lengths(line):
+        runs = []
+        if line[0]:
+            runs.append(-1)
+        prev = None
+        for module in line:
+            if module == prev:
+                runs[-1] += 1
+            else:
+                runs.append(1)
+                prev = module
+        return runs
+
+    def n1_n3(runs):
+        demerit = 0
+        length = len(runs)
+        for i in range(length):
+            if runs[i] >= 5:
+                demerit += 3 + (runs[i] - 5)
+            if i & 1 and 3 <= i < length - 2 and runs[i] % 3 == 0:
+                fact = runs[i] // 3
+                if runs[i-2] == fact and runs[i-1] == fact and runs[i+1] == fact and runs[i+2] == fact:
+                    if i == 3 or runs[i-3] >= 4 * fact:
+                        demerit += 40
+                    elif i + 4 >= length or runs[i+3] >= 4 * fact:
+                        demerit += 40
+        return demerit
+
+    num_modules = width * width
+    bratio = (200 * frame.count(1) + num_modules) // num_modules // 2
+    demerit = (abs(bratio - 50) // 5) * 10
+
+    for y in range(1, width):
+        for x in range(1, width):
+            block = {frame[y*width + x], frame[y*width + x - 1], frame[(y-1)*width + x], frame[(y-1)*width + x - 1]}
+            if len(block) == 1:
+                demerit += 3
+
+    for y in range(width):
+        demerit += n1_n3(run_lengths(frame[y*width:(y+1)*width]))
+    for x in range(width):
+        demerit += n1_n3(run_lengths(frame[x::width]))
+
+    return demerit
+
+
+
+# Display frames as `qrencode -l L -m 0 -t ASCII <data> | sed 's/##/#/g; s/  /./g'`
+# prints them ('#' = dark). The qrencode CLI wasn't available where these were
+# recorded, so they were generated with `QR.qrmatrix` after checking its segmentation
+# by hand against libqrencode 4.1.1's split.c and decoding the symbols; re-capture
+# them with the command above where qrencode is installed.
+QRENCODE_MATRICES = {
+    "UR:CRYPTO-ACCOUNT/1-4/LPADAACSKPCYMOMNLGRYHDCKOEADCYSSMECPONAOLYTAADMETAADDLOXAXHDCLAOKSRLNLKPUEGYATHPMNSNIYMUECBY": """
+        #######..###.###.####...#.#######
+        #.....#.##.#..#...#####.#.#.....#
+        #.###.#..###..#.##.....#..#.###.#
+        #.###.#.#####..##..#..##..#.###.#
+        #.###.#..#..#...#..###....#.###.#
+        #.....#.##.#..##.##.##....#.....#
+        #######.#.#.#.#.#.#.#.#.#.#######
+        .........##.##....#####..........
+        #####.###..##.##.##...##.#.#.#.#.
+        .###.....#.#..#.#..###.#.#..###.#
+        #..#.##..#....##.#####.####.#.##.
+        ..##...#.#####.###...##...#...#..
+        #..####..#..#..#..##.#####..###.#
+        ....##.##.#.#....#.....#.#.#.####
+        ..#.#####.....#..#.###.#...#..#..
+        .###....#.#....#.##.#..#.#..####.
+        .###.###.####..###..###.#####....
+        .#.##..#.#####...#.#.#.#...##.##.
+        ..#.###....#.##.###....#.###.##.#
+        ###....#...#...#...#.#.#####..###
+        #.#####.#.##.######.....#..#.#.##
+        ###..#.#....#.#.######.####....#.
+        #.######...#.##...#.#..##.##.##..
+        #..###....#..#.##..#####.#...#..#
+        #..#..#..##.##.#..####.######.##.
+        ........###..#..##....#.#...#..#.
+        #######.#..###.##.#..##.#.#.#.##.
+        #.....#...##...#.#.#...##...##.#.
+        #.###.#.####.#.##.....#########.#
+        #.###.#.##.###.####.#####.#...###
+        #.###.#.#.##.##.##..###.#...#....
+        #.....#.#..##.#.....##....###...#
+        #######.#.#.##.....##.##....#....
+    """,
+    "p1of3 [c49122a5/48h/1h/0h/2h]Vpub5mXgECaX5yYDNc5VnUG4": """
+        #######..##.....####..#######
+        #.....#.###.####.#....#.....#
+        #.###.#..###..##......#.###.#
+        #.###.#.#####.#.####..#.###.#
+        #.###.#..#.#...##..##.#.###.#
+        #.....#.#.#.#.###.#.#.#.....#
+        #######.#.#.#.#.#.#.#.#######
+        .........###..###.#..........
+        #####.###.....#..#..##.#.#.#.
+        ###..#.####.....####..#.##.##
+        ...#.##..##..#.##.#.##....#..
+        #....#...#....###.#####.#...#
+        ##..######...#######...#.##.#
+        .#.....#.#.##....###.##.#..##
+        #..#.##...#....#.#...#.####..
+        ##...#.#.#.##.#.........#....
+        ..##..#.##..#.##.###.#.#..##.
+        #...#..###.#.##.#..##.#.#...#
+        #...#.#.#.#.#..####....##..#.
+        #.#.#....###...##.#......#.#.
+        #...#.##..####.###.#######.#.
+        ........#.#...#.#####...#.#.#
+        #######.###.#.##..###.#.###..
+        #.....#.......##..#.#...##...
+        #.###.#.#...#####...#####.#..
+        #.###.#.##...##.##...#.#....#
+        #.###.#.#.#....#...#.##.####.
+        #.....#.##..#.#.#..##.#.#..#.
+        #######.####..###.....#####..
+    """,
+    "p2of3 9PXxT72ZJ36DCZCfJX83teEBispN5KTSt8yWE6fNUm26A77": """
+        #######..#..#.######..#######
+        #.....#.###....##.#.#.#.....#
+        #.###.#.....#.###.....#.###.#
+        #.###.#.####..#..#.##.#.###.#
+        #.###.#...#..#....#...#.###.#
+        #.....#.#####.###.###.#.....#
+        #######.#.#.#.#.#.#.#.#######
+        ............#######..........
+        #####.#######.####...#.#.#.#.
+        ....##.#..#...###.#..##.##.##
+        .#.####..####.....##.#.##.#..
+        .#..##.###...#.#.##..#.#....#
+        .#.#.##..#...##.#...##.####.#
+        ###.##...#.##....##..#.##..##
+        .#..####.#.#...##...#.#.###..
+        ..##...#.....###.#.#..#.#..##
+        .#..#.#..##..###....###...##.
+        ##..##....#....##..####.#...#
+        #.#...##......#.#.###.#.#..#.
+        #......#....#.####.#.......#.
+        #...#.##.#.#..#...#.########.
+        ........#.#######...#...#.#.#
+        #######.#.....#.#..##.#.##...
+        #.....#.....#.###...#...##.##
+        #.###.#.#.##...#..########.##
+        #.###.#.#.#.#.#....#...#...#.
+        #.###.#.##.#..#.#..######..#.
+        #.....#.#...##.#.....##.##.#.
+        #######.#..#..#...#.##...#...
+    """,
+}
+
+
+
+def test_symbol_layout_matches_qrcode():
+    """ Codewords and module placement should match `qrcode` for any given mask """
+    random.seed(1)
+    samples = [
+        "UR:CRYPTO-PSBT/12-25/LPBBCSKNCYFZTNWSETHDDCZMDKNDDSHHPLZCDTPKBKFZZSBNLPDWKOYNESWPAAOYMOF",
+        "p1of4 [c49122a5/48h/1h/0h/2h]Vpub5mXgECaX5yYDN",
+        "011513251154012711900771041507421289190620080870026613431420201617920614089619290300152408010643",
+        b'\x0et\xb6A\x07\xf9L\xc0\xcc\xfa\xe6\xa1=\xcb\xec6b\x15O\xecg\xe0\xe0\t\x99\xc0x\x92Y}\x19\n',
+    ]
+    samples += [os.urandom(random.randint(1, 400)) for _ in range(5)]
+
+    for data in samples:
+        for error_correction in [qrcode.constants.ERROR_CORRECT_L, qrcode.constants.ERROR_CORRECT_M]:
+            qr = qrcode.QRCode(error_correction=error_correction)
+            qr.add_data(data)
+            version = qr.best_fit()
+            assert QRSymbolLayout.fit_version(qr.data_list, error_correction) == version
+
+            layout = QRSymbolLayout.get(version, error_correction)
+            codewords = layout.codewords(qr.data_list)
+            assert codewords == bytes(qrcode.util.create_data(version, error_correction, qr.data_list))
+
+            data_frame = layout.data_frame(codewords)
+            for mask_pattern in range(8):
+                expected = qrcode.QRCode(version=version, error_correction=error_correction, mask_pattern=mask_pattern)
+                expected.add_data(data)
+                expected.make(fit=False)
+                assert layout.frame(data_frame, mask_pattern) == bytes(1 if module else 0 for row in expected.modules for module in row)
+
+
+
+def test_capacity():
+    L = qrcode.constants.ERROR_CORRECT_L
+    # From the ISO/IEC 18004 capacity tables
+    assert [QRSymbolLayout.capacity(v, qrcode.util.MODE_NUMBER, L) for v in [1, 5, 9, 40]] == [41, 255, 552, 7089]
+    assert [QRSymbolLayout.capacity(v, qrcode.util.MODE_ALPHA_NUM, L) for v in [1, 5, 9, 40]] == [25, 154, 335, 4296]
+    assert [QRSymbolLayout.capacity(v, qrcode.util.MODE_8BIT_BYTE, L) for v in [1, 5, 9, 40]] == [17, 106, 230, 2953]
+
+    # A full segment fits; one more char doesn't
+    for version in [3, 4, 5, 9]:
+        capacity = QRSymbolLayout.capacity(version, qrcode.util.MODE_ALPHA_NUM, L)
+        assert QRSymbolLayout.fit_version([qrcode.util.QRData("A" * capacity)], L) == version
+        assert QRSymbolLayout.fit_version([qrcode.util.QRData("A" * (capacity + 1))], L) == version + 1
+
+
+
+def test_mask_penalty_matches_libqrencode():
+    random.seed(2)
+    for version in [1, 2, 6, 7, 10]:
+        layout = QRSymbolLayout.get(version, qrcode.constants.ERROR_CORRECT_L)
+        for _ in range(3):
+            data_frame = layout.data_frame(os.urandom(len(layout.data_positions) // 8))
+            for mask_pattern in range(8):
+                frame = layout.frame(data_frame, mask_pattern)
+                assert layout.penalty(frame) == libqrencode_penalty(layout.width, frame)
+
+
+
+def test_qrimage_io():
+    """ Should render a display-sized image with the requested quiet zone and colors """
+    qr = QR()
+    image = qr.qrimage_io("UR:CRYPTO-PSBT/1-3/LPADAXCFAXHLCYYNCHAXWZ", width=240, height=240, border=3, background_color="bdbdbd")
+    assert image.size == (240, 240)
+    assert image.mode == "RGBA"
+
+    modules_width, frame = qr.qrmatrix("UR:CRYPTO-PSBT/1-3/LPADAXCFAXHLCYYNCHAXWZ")
+    px_per_module = 240 / (modules_width + 6)
+
+    # Quiet zone is background colored; the top-left finder pattern starts right after it
+    assert image.getpixel((0, 0)) == (0xbd, 0xbd, 0xbd, 255)
+    assert image.getpixel((int(2.5 * px_per_module), int(2.5 * px_per_module))) == (0xbd, 0xbd, 0xbd, 255)
+    assert image.getpixel((int(3.5 * px_per_module), int(3.5 * px_per_module))) == (0, 0, 0, 255)
+    assert frame[0] == 1
+
+
+
+def test_qrmatrix_falls_back_to_qrcode(monkeypatch):
+    """ If the fast encoder fails, the qrcode library's symbol should be used instead """
+    data = "UR:CRYPTO-PSBT/1-3/LPADAXCFAXHLCYYNCHAXWZ"
+
+    def fail(*args, **kwargs):
+        raise Exception("Encoder failed")
+    monkeypatch.setattr(QRSymbolLayout, "fit_version", fail)
+
+    expected = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_L)
+    expected.add_data(data)
+    expected.make(fit=True)
+
+    qr = QR()
+    modules_width, frame = qr.qrmatrix(data)
+    assert modules_width == expected.modules_count
+    assert frame == bytes(1 if module else 0 for row in expected.modules for module in row)
+    assert qr.qrimage_io(data).size == (240, 240)
+
+
+
+def test_set_background_color():
+    """ Swapping the palette should recolor only the background """
+    qr = QR()
+    image = qr.qrimage_paletted("UR:CRYPTO-PSBT/1-3/LPADAXCFAXHLCYYNCHAXWZ", width=240, height=240, border=3, background_color="bdbdbd")
+    assert image.mode == "P"
+    before = image.tobytes()
+
+    QR.set_background_color(image, "1f1f1f")
+    assert image.tobytes() == before
+    assert image.convert("RGB").getpixel((0, 0)) == (0x1f, 0x1f, 0x1f)
+    assert image.convert("RGB").getpixel((30, 30)) == (0, 0, 0)
+
+
+
+def test_segments_match_libqrencode():
+    """ Modes only switch where libqrencode's bit cost estimate says it's shorter """
+    N, A, B = qrcode.util.MODE_NUMBER, qrcode.util.MODE_ALPHA_NUM, qrcode.util.MODE_8BIT_BYTE
+    def segments(data):
+        return [(segment.mode, segment.data) for segment in QRSymbolLayout.segments(data)]
+
+    # UR parts are one alphanumeric segment; short digit runs aren't worth switching
+    assert segments("UR:CRYPTO-PSBT/12-25/LPBBCSKNCY") == [(A, b"UR:CRYPTO-PSBT/12-25/LPBBCSKNCY")]
+    assert segments("0123456789") == [(N, b"0123456789")]
+    assert segments("ABC" + "1" * 13 + "DEF") == [(A, b"ABC" + b"1" * 13 + b"DEF")]
+    assert segments("ABC" + "1" * 14 + "DEF") == [(A, b"ABC"), (N, b"1" * 14), (A, b"DEF")]
+
+    # 8-bit data only breaks for an alphanumeric run of 11 or more, or a number of 4
+    # or more at the end
+    assert segments("p1of3 [c49122a5/48h/1h/0h/2h]Vpub5mXgECaX5yYDNc5VnUG4") == [(B, b"p1of3 [c49122a5/48h/1h/0h/2h]Vpub5mXgECaX5yYDNc5VnUG4")]
+    assert segments("p2of3 9PXxT72ZJ36DCZCfJX83") == [(B, b"p2of3 9PXx"), (A, b"T72ZJ36DCZC"), (B, b"fJX83")]
+    assert segments("hello 123456789012 world") == [(B, b"hello"), (A, b" 123456789012 "), (B, b"world")]
+    assert segments("abc123") == [(B, b"abc123")]
+    assert segments("abc1234") == [(B, b"abc"), (N, b"1234")]
+
+    # Binary data is taken as is
+    assert segments(b"\x00\xff12") == [(B, b"\x00\xff12")]
+
+
+
+def test_qrmatrix_matches_qrencode():
+    qr = QR()
+    for data, expected in QRENCODE_MATRICES.items():
+        rows = expected.split()
+        modules_width, frame = qr.qrmatrix(data)
+        assert modules_width == len(rows)
+        assert frame == "".join(rows).replace("#", "\x01").replace(".", "\x00").encode()
+
+    # The `qrcode` library segments this one differently
+    data = "p2of3 9PXxT72ZJ36DCZCfJX83teEBispN5KTSt8yWE6fNUm26A77"
+    qr_code = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_L)
+    qr_code.add_data(data)
+    assert len(qr_code.data_list) == 1 and len(QRSymbolLayout.segments(data)) == 3
+
+
+
+def test_split_for_version():
+    """ Segments too long for the version's length indicator are split like libqrencode """
+    data_list = [qrcode.util.QRData(b"A" * 2100, mode=qrcode.util.MODE_ALPHA_NUM)]
+    assert [len(data) for data in QRSymbolLayout.split_for_version(data_list, 26)] == [2047, 53]
+    assert [len(data) for data in QRSymbolLayout.split_for_version(data_list, 27)] == [2100]
+    assert QRSymbolLayout.fit_version(data_list, qrcode.constants.ERROR_CORRECT_L) == 27
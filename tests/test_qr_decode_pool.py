@@ -0,0 +1,102 @@
+import subprocess
+import sys
+import textwrap
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+from PIL import Image
+
+from seedsigner.models import qr_decode_pool
+from seedsigner.models.qr_decode_pool import QRDecodePool
+from seedsigner.models.qr_search_ladder import SearchAttempt
+
+
+
+def test_default_num_workers(monkeypatch):
+    """ Single core boards must fall back to decoding inline """
+    monkeypatch.setattr("os.cpu_count", lambda: 1)
+    assert QRDecodePool.default_num_workers() == 0
+
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    assert QRDecodePool.default_num_workers() == 3
+
+    monkeypatch.setattr("os.cpu_count", lambda: 16)
+    assert QRDecodePool.default_num_workers() == QRDecodePool.MAX_WORKERS
+
+
+
+def test_results_in_order_and_drops_when_busy():
+    decode_pool = QRDecodePool.get_instance()
+    decode_pool.num_workers = 2
+    decode_pool.start_server()
+    decode_pool.start()
+    try:
+        # Neither frame has a QR to find
+        assert decode_pool.submit(1, None, [])
+        assert decode_pool.submit(2, Image.new("L", (64, 64), 255), [SearchAttempt(box=(0, 0, 64, 64), scale=1)])
+
+        # Workers are all spoken for until their results are collected
+        assert not decode_pool.submit(3, None, [])
+
+        results = []
+        while len(results) < 2:
+            results += decode_pool.get_results()
+            time.sleep(0.01)
+        assert [(frame_seq, result.payload) for frame_seq, result in results] == [(1, None), (2, None)]
+
+        assert decode_pool.submit(4, None, [])
+        decode_pool.discard_pending()
+        assert decode_pool.get_results() == []
+    finally:
+        decode_pool.stop()
+        decode_pool.num_workers = QRDecodePool.default_num_workers()
+
+    # The workers and their frame buffers are gone
+    assert decode_pool._pool is None
+    assert decode_pool._frame_buffers == []
+
+
+
+def test_workers_attach_frame_buffers_untracked(monkeypatch):
+    """ Only the main process, which unlinks the frame buffers, may track them """
+    registered = []
+    monkeypatch.setattr(resource_tracker, "register", lambda name, rtype: registered.append(name))
+    frame_buffer = shared_memory.SharedMemory(create=True, size=64)
+    try:
+        assert registered == [frame_buffer._name]
+
+        attached = qr_decode_pool._attach_frame_buffer(frame_buffer.name)
+        attached.close()
+        assert registered == [frame_buffer._name]
+    finally:
+        frame_buffer.close()
+        frame_buffer.unlink()
+
+
+
+def test_restart_without_resource_tracker_warnings():
+    """ Starting and stopping the pool must not leave shared memory behind """
+    script = textwrap.dedent("""
+        import time
+        from PIL import Image
+        from seedsigner.models.qr_decode_pool import QRDecodePool
+        from seedsigner.models.qr_search_ladder import SearchAttempt
+
+        if __name__ == "__main__":
+            decode_pool = QRDecodePool.get_instance()
+            decode_pool.num_workers = 2
+            decode_pool.start_server()
+            for i in range(2):
+                decode_pool.start()
+                for frame_seq in range(2):
+                    decode_pool.submit(frame_seq, Image.new("L", (64, 64), 255), [SearchAttempt(box=(0, 0, 64, 64), scale=1)])
+                while decode_pool._pending:
+                    decode_pool.get_results()
+                    time.sleep(0.01)
+                decode_pool.stop()
+    """)
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=60)
+    assert completed.returncode == 0, completed.stderr
+    assert "resource_tracker" not in completed.stderr
+    assert "leaked" not in completed.stderr
+    assert "Traceback" not in completed.stderr
@@ -0,0 +1,69 @@
+from PIL import Image
+
+from seedsigner.helpers import qr_detectors
+from seedsigner.helpers.qr_detectors import BaseQRDetector
+from seedsigner.models.decode_qr import DecodeQR
+
+
+
+class AlwaysFindsDetector(BaseQRDetector):
+    name = "test-always"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return True
+
+    def detect(self, image, is_binary: bool = False):
+        return [b"first", b"second"] if is_binary else ["first", "second"]
+
+
+
+class NeverFindsDetector(AlwaysFindsDetector):
+    name = "test-never"
+
+    def detect(self, image, is_binary: bool = False):
+        return []
+
+
+
+class UnavailableDetector(AlwaysFindsDetector):
+    name = "test-unavailable"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return False
+
+
+
+def test_extract_qr_data_uses_selected_detector():
+    qr_detectors.register_detector(AlwaysFindsDetector)
+    try:
+        qr_detectors.select_detector(AlwaysFindsDetector.name)
+
+        # Only the first barcode is returned
+        assert DecodeQR.extract_qr_data("image", is_binary=True) == b"first"
+        assert DecodeQR.extract_qr_data("image") == "first"
+        assert DecodeQR.extract_qr_data(None) is None
+    finally:
+        qr_detectors._selected_detector = None
+        qr_detectors._DETECTORS.pop(AlwaysFindsDetector.name)
+
+
+
+def test_select_fastest_detector():
+    """ Success rate on the corpus matters most; unavailable engines are skipped """
+    for detector_cls in [AlwaysFindsDetector, NeverFindsDetector, UnavailableDetector]:
+        qr_detectors.register_detector(detector_cls)
+    try:
+        assert UnavailableDetector.name not in qr_detectors.get_available_detectors()
+
+        corpus = [(Image.new("L", (64, 64), 255), b"first")] * 5
+        results = [result for result in qr_detectors.select_fastest_detector(corpus) if result.name.startswith("test-")]
+        assert [result.name for result in results] == [AlwaysFindsDetector.name, NeverFindsDetector.name]
+        assert results[0].success_rate == 1.0
+        assert results[1].success_rate == 0.0
+        assert isinstance(qr_detectors.get_detector(), AlwaysFindsDetector)
+    finally:
+        qr_detectors._selected_detector = None
+        for detector_cls in [AlwaysFindsDetector, NeverFindsDetector, UnavailableDetector]:
+            qr_detectors._DETECTORS.pop(detector_cls.name)
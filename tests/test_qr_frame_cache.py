@@ -0,0 +1,75 @@
+from seedsigner.models.encode_qr import SpecterXPubQrEncoder
+from seedsigner.models.qr_frame_cache import QRFrameCache
+from seedsigner.models.seed import Seed
+from seedsigner.models.settings import SettingsConstants
+
+
+
+def get_encoder():
+    mnemonic = "obscure bone gas open exotic abuse virus bunker shuffle nasty ship dash"
+    return SpecterXPubQrEncoder(seed=Seed(mnemonic.split(), passphrase="pass"), network=SettingsConstants.TESTNET, derivation="m/48h/1h/0h/2h", qr_density=SettingsConstants.DENSITY__LOW)
+
+
+
+def test_replay_from_cache():
+    """ Once the whole loop has been rendered, every frame should be a cache hit """
+    cache = QRFrameCache(get_encoder(), width=120, height=120)
+    assert cache.num_frames == 3
+
+    first_loop = [cache.get_frame(i, "bdbdbd").tobytes() for i in range(3)]
+    assert cache.misses == 3
+    assert [cache.get_frame(i, "bdbdbd").tobytes() for i in range(3, 6)] == first_loop
+    assert cache.hits == 3
+
+
+
+def test_brightness_change():
+    """ Changing the background color should recolor cached frames, not re-render them """
+    cache = QRFrameCache(get_encoder(), width=120, height=120)
+    dim = cache.get_frame(0, "3e3e3e")
+    bright = cache.get_frame(0, "ffffff")
+    assert cache.misses == 1
+    assert cache.hits == 1
+
+    assert dim.convert("RGB").getpixel((0, 0)) == (0x3e, 0x3e, 0x3e)
+    assert bright.convert("RGB").getpixel((0, 0)) == (0xff, 0xff, 0xff)
+
+    # Recoloring one frame must not affect frames already handed out
+    assert dim.convert("RGB").getpixel((0, 0)) == (0x3e, 0x3e, 0x3e)
+
+
+
+def test_memory_budget():
+    """ Should never hold more frames than the budget allows, evicting the LRU frame """
+    frame_size = 120 * 120
+    cache = QRFrameCache(get_encoder(), width=120, height=120, memory_budget=2 * frame_size)
+    assert cache.capacity == 2
+    assert cache.fill_ahead == 1
+
+    cache.get_frame(0, "bdbdbd")
+    assert cache.fill_next()
+    assert len(cache) == 2
+
+    # Frame 1 was prefetched; fetching it bumps it and evicts nothing
+    cache.get_frame(1, "bdbdbd")
+    assert cache.hits == 1
+
+    # Prefetching frame 2 evicts frame 0
+    assert cache.fill_next()
+    assert len(cache) == 2
+    cache.get_frame(0, "bdbdbd")
+    assert cache.misses == 2
+
+
+
+def test_fill_next():
+    """ The fill thread's unit of work should stop once the loop is fully rendered """
+    cache = QRFrameCache(get_encoder(), width=120, height=120)
+
+    # Nothing displayed yet; nothing to prefetch
+    assert not cache.fill_next()
+
+    cache.get_frame(0, "bdbdbd")
+    while cache.fill_next():
+        pass
+    assert len(cache) == 3
@@ -0,0 +1,122 @@
+from PIL import Image, ImageChops
+
+from seedsigner.helpers import qr_detectors
+from seedsigner.helpers.qr_detectors import BaseQRDetector
+from seedsigner.models.decode_qr import DecodeQR, DecodeQRStatus
+from seedsigner.models.qr_search_ladder import QRSearchLadder, SearchAttempt
+from seedsigner.models.qr_type import QRType
+
+
+
+class SquareDetector(BaseQRDetector):
+    """
+    Treats a black square on a white background as a QR; it can only be "decoded"
+    if it's at least `min_size` pixels wide in the image it's given.
+    """
+    name = "test-square"
+    min_size = 0
+    searched = []
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return True
+
+    def detect(self, image, is_binary: bool = False):
+        return [payload for payload, rect in self.locate(image, is_binary)]
+
+    def locate(self, image, is_binary: bool = False):
+        SquareDetector.searched.append(image.size)
+        rect = ImageChops.invert(image).getbbox()
+        if rect is None or rect[2] - rect[0] < SquareDetector.min_size:
+            return []
+        return [("bitcoin:bc1qcr8te4kr609gcawutmrza0j4xv80jy8z306fyu", rect)]
+
+
+
+def make_frame(box) -> Image.Image:
+    frame = Image.new("L", (480, 480), 255)
+    frame.paste(0, box)
+    return frame
+
+
+
+def run_with_detector(func):
+    qr_detectors.register_detector(SquareDetector)
+    try:
+        qr_detectors.select_detector(SquareDetector.name)
+        SquareDetector.min_size = 0
+        SquareDetector.searched = []
+        func()
+    finally:
+        qr_detectors._selected_detector = None
+        qr_detectors._DETECTORS.pop(SquareDetector.name)
+
+
+
+def test_plan():
+    ladder = QRSearchLadder()
+    frame = make_frame((100, 100, 300, 300))
+
+    # Nothing known yet: downscaled, then full resolution
+    assert ladder.plan(frame) == [
+        SearchAttempt(box=(0, 0, 480, 480), scale=2),
+        SearchAttempt(box=(0, 0, 480, 480), scale=1),
+    ]
+
+    # Small frames aren't downscaled
+    assert ladder.plan(Image.new("L", (240, 240))) == [SearchAttempt(box=(0, 0, 240, 240), scale=1)]
+
+    # ROI around the last known position first, with margins clipped to the frame
+    ladder.last_rect = (100, 100, 300, 440)
+    assert ladder.plan(frame)[0] == SearchAttempt(box=(50, 15, 350, 480), scale=1, is_roi=True)
+
+    # Scales that are too coarse for the QRType are skipped
+    ladder.scale_by_qr_type[QRType.PSBT__UR2] = 1
+    assert ladder.plan(frame, qr_type=QRType.PSBT__UR2) == [
+        SearchAttempt(box=(50, 15, 350, 480), scale=1, is_roi=True),
+        SearchAttempt(box=(0, 0, 480, 480), scale=1),
+    ]
+
+
+
+def test_search_maps_rect_to_frame_coordinates():
+    def check():
+        frame = make_frame((100, 120, 300, 320))
+        attempts = [
+            SearchAttempt(box=(0, 0, 50, 50), scale=1, is_roi=True),
+            SearchAttempt(box=(0, 0, 480, 480), scale=2),
+        ]
+        result = QRSearchLadder.search(frame, attempts)
+        assert result.attempt == attempts[1]
+        assert result.rect == (100, 120, 300, 320)
+        assert SquareDetector.searched == [(50, 50), (240, 240)]
+
+        assert QRSearchLadder.search(None, attempts).payload is None
+    run_with_detector(check)
+
+
+
+def test_decoder_uses_roi_and_remembers_scale():
+    def check():
+        frame = make_frame((100, 100, 300, 300))
+
+        # Only decodable at full resolution
+        SquareDetector.min_size = 150
+        decoder = DecodeQR()
+        assert decoder.add_image(frame) == DecodeQRStatus.COMPLETE
+        assert decoder.qr_type == QRType.BITCOIN_ADDRESS
+        assert SquareDetector.searched == [(240, 240), (480, 480)]
+        assert decoder.search_ladder.last_rect == (100, 100, 300, 300)
+        assert decoder.search_ladder.scale_by_qr_type[QRType.BITCOIN_ADDRESS] == 1
+
+        # Next frame: straight to the ROI at the scale that worked
+        SquareDetector.searched = []
+        attempts = decoder.search_ladder.plan(frame, qr_type=decoder.qr_type)
+        result = QRSearchLadder.search(frame, attempts)
+        assert result.attempt.is_roi
+        assert SquareDetector.searched == [(300, 300)]
+
+        # A miss resets the ROI
+        decoder.search_ladder.record(QRSearchLadder.search(Image.new("L", (480, 480), 255), attempts))
+        assert decoder.search_ladder.last_rect is None
+    run_with_detector(check)
@@ -1,5 +1,5 @@
 import pytest
-from seedsigner.models.seed import InvalidSeedException, Seed, ElectrumSeed
+from seedsigner.models.seed import InvalidSeedException, Seed, ElectrumSeed, WordlistIndex
 
 from seedsigner.models.settings import SettingsConstants
 
@@ -83,3 +83,37 @@ def test_electrum_seed_rejects_most_bip39_mnemonics():
 	mnemonic = "only gain spot output unknown craft simple cram absorb suggest ridge famous".split()
 	Seed(mnemonic)
 	ElectrumSeed(mnemonic)
+
+
+
+def test_wordlist_index():
+	""" Should match the linear scans over the wordlist that it replaces """
+	wordlist = Seed.get_wordlist()
+	wordlist_index = Seed.get_wordlist_index()
+	assert Seed.get_wordlist_index() is wordlist_index
+
+	for word in ["abandon", "zoo", "obscure", "act", "action"]:
+		assert word in wordlist_index
+		assert wordlist_index.index(word) == wordlist.index(word)
+		assert wordlist_index.index_of_abbreviation(word[:4]) == wordlist.index(word)
+	assert "qwerty" not in wordlist_index
+	assert not wordlist_index.is_abbreviation("qwer")
+	with pytest.raises(ValueError):
+		wordlist_index.index("qwerty")
+
+	for prefix in ["", "a", "ab", "act", "zoo", "zz", "q", "wa"]:
+		assert wordlist_index.words_starting_with(prefix) == [word for word in wordlist if word.startswith(prefix)]
+
+
+
+def test_wordlist_index_unsorted_wordlist():
+	""" Prefix matches should come back in wordlist order for any language's ordering """
+	wordlist_index = WordlistIndex(["ñandú", "bebé", "abeja", "nadar", "ábaco"])
+	assert wordlist_index.words_starting_with("b") == ["bebé"]
+
+	# NFKD-normalized, so unaccented letters also match accented words
+	assert wordlist_index.words_starting_with("n") == ["ñandú", "nadar"]
+	assert wordlist_index.words_starting_with("a") == ["abeja", "ábaco"]
+	assert wordlist_index.words_starting_with("ñ") == ["ñandú"]
+	assert wordlist_index.index("bebé") == 1
+	assert wordlist_index.index_of_abbreviation("ábac") == 4
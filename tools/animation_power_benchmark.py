@@ -0,0 +1,193 @@
+import argparse
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# The display driver and buttons talk to SPI and GPIO; stand them in so that the real
+# screens can run without a Pi. These must precede any SeedSigner imports.
+sys.modules['spidev'] = MagicMock()
+sys.modules['RPi'] = MagicMock()
+sys.modules['RPi.GPIO'] = MagicMock()
+
+from seedsigner.gui.renderer import Renderer
+from seedsigner.hardware import ST7789 as st7789_module
+from seedsigner.models.settings import Settings, SettingsConstants
+
+"""
+Measures the CPU used by the screensaver and the loading screen spinner, before (each
+in its own unpaced loop) and after (stepped by the `AnimationScheduler`, with and
+without the low power mode).
+
+While the loading screen is up, a pure Python workload stands in for the View's
+foreground work (e.g. deriving addresses). The CPU it uses is left out of the CPU %;
+its throughput is reported relative to running it with no loading screen at all.
+
+The stand-in SPI bus blocks for as long as the bytes would take to clock out at the
+Pi's 40MHz. Absolute CPU numbers depend on the host; compare the rows.
+
+Requires the pinned Pillow (10.0.x); newer releases dropped the "BGR;16" conversion.
+
+tldr:
+    pip3 install -e .
+    cd tools
+    python3 animation_power_benchmark.py -h
+"""
+
+SPI_HZ = 40_000_000
+
+
+
+class SimulatedSpi:
+    def __init__(self):
+        self.bytes_written = 0
+
+    def writebytes(self, data):
+        self.bytes_written += len(data)
+
+    def writebytes2(self, data):
+        num_bytes = len(memoryview(data).cast("B"))
+        self.bytes_written += num_bytes
+        time.sleep(num_bytes * 8 / SPI_HZ)
+
+
+
+class TimedButtons:
+    """ Stands in for `HardwareButtons`; "pressed" once `duration` has elapsed """
+    def __init__(self, duration: float):
+        self.stop_at = time.perf_counter() + duration
+        self.override_ind = False
+
+    def has_any_input(self) -> bool:
+        return time.perf_counter() >= self.stop_at
+
+
+
+def foreground_work(duration: float) -> tuple:
+    """
+    Busy pure Python work (like address derivation). Returns iterations/sec and the
+    CPU time it used.
+    """
+    iterations = 0
+    cpu_start = time.thread_time()
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        sum(i * i for i in range(1000))
+        iterations += 1
+    return iterations / duration, time.thread_time() - cpu_start
+
+
+
+def set_low_power(mode: str):
+    Settings.get_instance().set_value(
+        SettingsConstants.SETTING__LOW_POWER_ANIMATIONS,
+        SettingsConstants.OPTION__ENABLED if mode == "low power" else SettingsConstants.OPTION__DISABLED
+    )
+
+
+
+def legacy_screensaver(screensaver, duration: float):
+    """ The screensaver's original loop: crop and push a full frame, no pacing """
+    from PIL import Image
+    image = Image.new("RGB", (2 * screensaver.logo.size[0], 2 * screensaver.logo.size[1]), (0,0,0))
+    image.paste(screensaver.logo, (int(screensaver.logo.size[0] / 2), int(screensaver.logo.size[1] / 2)))
+
+    renderer = Renderer.get_instance()
+    frames = 0
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        crop = image.crop((
+            screensaver.cur_x, screensaver.cur_y,
+            screensaver.cur_x + renderer.canvas_width, screensaver.cur_y + renderer.canvas_height))
+        renderer.show_image(crop, show_direct=True)
+        renderer.wait_for_flush()
+        screensaver.advance()
+        frames += 1
+    return frames
+
+
+
+class LegacyLoadingScreenThread(threading.Thread):
+    """ The loading screen's original loop: redraw the arcs with no pacing """
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.keep_running = True
+        self.frames = 0
+
+    def run(self):
+        from seedsigner.gui.screens.screen import LoadingScreenAnimation
+        animation = LoadingScreenAnimation(text="Calculating addrs...")
+        renderer = Renderer.get_instance()
+        while self.keep_running:
+            with renderer.lock:
+                animation.step()
+                renderer.show_image()
+            renderer.wait_for_flush()
+            self.frames += 1
+
+
+
+def measure(run) -> tuple:
+    """ Returns (fps, animation CPU %, KB/s sent to the display, foreground work rate) """
+    spi = Renderer.get_instance().disp._spi
+    spi.bytes_written = 0
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    frames, work_rate, work_cpu = run()
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start - work_cpu
+    return frames / elapsed, 100 * cpu / elapsed, spi.bytes_written / elapsed / 1024, work_rate
+
+
+
+def run_screensaver(mode: str, duration: float):
+    from seedsigner.views.screensaver import ScreensaverScreen
+    screensaver = ScreensaverScreen(TimedButtons(duration))
+    if mode == "before":
+        return legacy_screensaver(screensaver, duration), None, 0.0
+
+    set_low_power(mode)
+    screensaver.start()
+    return screensaver.animation.num_steps, None, 0.0
+
+
+
+def run_loading_screen(mode: str, duration: float):
+    from seedsigner.gui.screens.screen import LoadingScreenAnimation
+    if mode == "before":
+        thread = LegacyLoadingScreenThread()
+        thread.start()
+        work_rate, work_cpu = foreground_work(duration)
+        thread.keep_running = False
+        thread.join()
+        return thread.frames, work_rate, work_cpu
+
+    set_low_power(mode)
+    animation = LoadingScreenAnimation(text="Calculating addrs...")
+    animation.start()
+    work_rate, work_cpu = foreground_work(duration)
+    animation.stop()
+    return animation.num_steps, work_rate, work_cpu
+
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SeedSigner animation CPU usage benchmark")
+    parser.add_argument('-d', '--duration', type=float, default=5.0, help="Seconds to run each measurement")
+    args = parser.parse_args()
+
+    Renderer.configure_instance()
+    Renderer.get_instance().disp._spi = SimulatedSpi()
+
+    # Keep the GPIO stand-in's overhead out of the measurements
+    st7789_module.GPIO = SimpleNamespace(output=lambda *args: None, HIGH=1, LOW=0)
+
+    baseline_work_rate, _ = foreground_work(args.duration)
+
+    print(f"{'animation':>14} {'mode':>10}   {'fps':>6} {'CPU %':>6} {'KB/s':>7} {'foreground work':>15}")
+    for name, run in [("screensaver", run_screensaver), ("loading screen", run_loading_screen)]:
+        for mode in ["before", "normal", "low power"]:
+            fps, cpu, kb_per_sec, work_rate = measure(lambda: run(mode, args.duration))
+            work = f"{100 * work_rate / baseline_work_rate:14.0f}%" if work_rate else f"{'-':>15}"
+            print(f"{name:>14} {mode:>10}   {fps:6.1f} {cpu:6.1f} {kb_per_sec:7.0f} {work}")
@@ -0,0 +1,162 @@
+import argparse
+import array
+import sys
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# The display driver talks to SPI and GPIO; stand them in so that the full render path
+# can run without a Pi. These must precede any SeedSigner imports.
+sys.modules['spidev'] = MagicMock()
+sys.modules['RPi'] = MagicMock()
+sys.modules['RPi.GPIO'] = MagicMock()
+
+from PIL import Image, ImageDraw
+
+from seedsigner.gui.renderer import Renderer
+from seedsigner.hardware import ST7789 as st7789_module
+
+"""
+Measures display pushes/sec through the real `Renderer` and `ST7789` driver (with the
+SPI bus stood in) against the original full-frame path: convert the whole canvas,
+byteswap, copy and send all 115KB on every push, synchronously.
+
+Each scenario mimics a common kind of screen update. The stand-in bus blocks for as
+long as the bytes would take to clock out at the Pi's 40MHz. Reports pushes/sec, the
+bytes sent per push and how long each `show_image` call blocks its caller (i.e. the
+display's share of UI input latency).
+
+Requires the pinned Pillow (10.0.x); newer releases dropped the "BGR;16" conversion.
+
+tldr:
+    pip3 install -e .
+    cd tools
+    python3 display_push_benchmark.py -h
+"""
+
+SPI_HZ = 40_000_000
+
+
+
+class SimulatedSpi:
+    def __init__(self):
+        self.bytes_written = 0
+
+    def writebytes(self, data):
+        self.bytes_written += len(data)
+
+    def writebytes2(self, data):
+        num_bytes = len(memoryview(data).cast("B"))
+        self.bytes_written += num_bytes
+        time.sleep(num_bytes * 8 / SPI_HZ)
+
+
+
+def legacy_show_image(disp: st7789_module.ST7789, image: Image.Image):
+    """ The original `ST7789.ShowImage` that every `Renderer.show_image` call made """
+    arr = array.array("H", image.convert("BGR;16").tobytes())
+    arr.byteswap()
+    pix = arr.tobytes()
+    disp.SetWindows(0, 0, disp.width, disp.height)
+    st7789_module.GPIO.output(disp._dc, st7789_module.GPIO.HIGH)
+    disp._spi.writebytes2(pix)
+
+
+
+def get_scenario(scenario: str):
+    """ Returns a callable that draws the update for frame `i` onto the canvas """
+    def draw_full(canvas: Image.Image, draw: ImageDraw.ImageDraw, i: int):
+        # Video-like content: every pixel changes
+        canvas.paste(noise_frames[i % len(noise_frames)])
+
+    def draw_button(canvas: Image.Image, draw: ImageDraw.ImageDraw, i: int):
+        # Button highlight moving between two buttons in a list
+        for n in range(2):
+            color = "orange" if n == i % 2 else "#2c2c2c"
+            draw.rounded_rectangle((16, 60 + n * 50, 224, 100 + n * 50), radius=8, fill=color)
+            draw.text((30, 70 + n * 50), f"Button {n}", fill="white")
+
+    def draw_border(canvas: Image.Image, draw: ImageDraw.ImageDraw, i: int):
+        # `WarningEdgesAnimation` pulsing border
+        shade = 60 + 15 * (i % 10)
+        draw.rectangle((0, 0, 240, 240), outline=(shade, 0, 0), width=6)
+
+    def draw_spinner(canvas: Image.Image, draw: ImageDraw.ImageDraw, i: int):
+        # `LoadingScreenAnimation` arc advancing around a circle
+        bounding_box = (84, 84, 156, 156)
+        position = (i * 15) % 360
+        draw.arc(bounding_box, start=position - 15, end=position, fill="orange", width=8)
+        draw.arc(bounding_box, start=position - 30, end=position - 15, fill="#2c2c2c", width=8)
+
+    def draw_idle(canvas: Image.Image, draw: ImageDraw.ImageDraw, i: int):
+        # Re-pushing an unchanged screen
+        pass
+
+    noise_frames = []
+    if scenario == "full":
+        noise_frames = [Image.effect_noise((240, 240), 64).convert("RGB") for _ in range(8)]
+
+    return {
+        "full": draw_full,
+        "button": draw_button,
+        "border": draw_border,
+        "spinner": draw_spinner,
+        "idle": draw_idle,
+    }[scenario]
+
+
+SCENARIOS = ["full", "button", "border", "spinner", "idle"]
+
+
+
+def run(scenario: str, num_frames: int, legacy: bool) -> tuple:
+    renderer = Renderer.get_instance()
+    spi = SimulatedSpi()
+    renderer.disp._spi = spi
+    draw_frame = get_scenario(scenario)
+
+    # Start from a known, fully displayed screen
+    renderer.draw.rectangle((0, 0, 240, 240), fill="black")
+    renderer.show_image(full_frame=True)
+    renderer.wait_for_flush()
+    spi.bytes_written = 0
+
+    caller_time = 0.0
+    start = time.perf_counter()
+    for i in range(num_frames):
+        draw_frame(renderer.canvas, renderer.draw, i)
+        call_start = time.perf_counter()
+        if legacy:
+            legacy_show_image(renderer.disp, renderer.canvas)
+        else:
+            # Video-like content (e.g. animated QRs) skips the search for changes
+            renderer.show_image(full_frame=scenario == "full")
+        caller_time += time.perf_counter() - call_start
+
+        # Measure the cost of every push rather than how many can be coalesced
+        renderer.wait_for_flush()
+    elapsed = time.perf_counter() - start
+
+    return num_frames / elapsed, spi.bytes_written / num_frames, 1000 * caller_time / num_frames
+
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SeedSigner display push micro-benchmark")
+    parser.add_argument('-s', '--scenarios', nargs='+', choices=SCENARIOS, default=SCENARIOS, help="Kinds of screen update to measure")
+    parser.add_argument('-n', '--num-frames', type=int, default=500, help="Pushes per scenario")
+    args = parser.parse_args()
+
+    Renderer.configure_instance()
+
+    # Keep the GPIO stand-in's overhead out of the measurements
+    st7789_module.GPIO = SimpleNamespace(output=lambda *args: None, HIGH=1, LOW=0)
+
+    print(f"{'scenario':>8}   {'before: push/s':>14} {'bytes':>7} {'caller ms':>9}   {'after: push/s':>13} {'bytes':>7} {'caller ms':>9}")
+    for scenario in args.scenarios:
+        before = run(scenario, args.num_frames, legacy=True)
+        after = run(scenario, args.num_frames, legacy=False)
+        print(f"{scenario:>8}   {before[0]:14.1f} {before[1]:7.0f} {before[2]:9.2f}   {after[0]:13.1f} {after[1]:7.0f} {after[2]:9.2f}")
+
+    flush_thread = Renderer.get_instance().flush_thread
+    print(f"\nflush thread: {flush_thread.frames_pushed} pushed, {flush_thread.frames_dropped} coalesced, {1000 * flush_thread.average_latency:.2f}ms avg latency")
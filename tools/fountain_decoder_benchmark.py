@@ -0,0 +1,57 @@
+import argparse
+import os
+import random
+import time
+
+from seedsigner.helpers.ur2.fountain_decoder import FountainDecoder
+from seedsigner.helpers.ur2.fountain_encoder import FountainEncoder
+
+"""
+Measures UR fountain decoding cost as the number of fragments (seq_len) grows.
+
+Each run encodes a random message into `seq_len` fragments and feeds the decoder the
+encoder's parts in order, randomly dropping some of them (missed camera frames),
+until the message is recovered.
+
+tldr:
+    pip3 install -e .
+    cd tools
+    python3 fountain_decoder_benchmark.py -h
+"""
+
+
+def benchmark(seq_len: int, fragment_len: int, loss: float):
+    message = os.urandom(seq_len * fragment_len)
+    encoder = FountainEncoder(message, fragment_len)
+    assert encoder.seq_len() == seq_len
+
+    decoder = FountainDecoder()
+    num_parts = 0
+    seq_num = 0
+    start = time.perf_counter()
+    while not decoder.is_complete():
+        seq_num += 1
+        part = encoder.part_at(seq_num)
+        if random.random() < loss:
+            continue
+        decoder.receive_part(part)
+        num_parts += 1
+    elapsed = time.perf_counter() - start
+
+    if decoder.result_message() != message:
+        print(f"error: seq_len {seq_len} did not decode to the original message")
+    print(f"{seq_len:>8} {num_parts:>8} {1000 * elapsed:10.1f} {1000 * elapsed / num_parts:10.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SeedSigner UR fountain decoder benchmark")
+    parser.add_argument('-s', '--seq-lens', type=str, default="10,50,100,250,500,1000", help="Comma-separated list of fragment counts to test")
+    parser.add_argument('-f', '--fragment-len', type=int, default=10, help="Bytes per fragment (LOW density UR is 10)")
+    parser.add_argument('-l', '--loss', type=float, default=0.3, help="Fraction of parts dropped before they reach the decoder")
+    parser.add_argument('-r', '--random-seed', type=int, default=0, help="Seed for choosing which parts are dropped")
+    args = parser.parse_args()
+
+    random.seed(args.random_seed)
+    print(f"{'seq_len':>8} {'parts':>8} {'total ms':>10} {'ms/part':>10}")
+    for seq_len in [int(seq_len) for seq_len in args.seq_lens.split(",")]:
+        benchmark(seq_len, args.fragment_len, args.loss)
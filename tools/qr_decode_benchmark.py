@@ -0,0 +1,110 @@
+import argparse
+import os
+import time
+
+from embit import bip32, bip39
+from embit.psbt import PSBT
+from embit.script import p2wpkh
+from embit.transaction import Transaction, TransactionInput, TransactionOutput
+
+from seedsigner.helpers.ur2.ur import UR
+from seedsigner.helpers.ur2.ur_encoder import UREncoder
+from seedsigner.models.decode_qr import DecodeQR
+from seedsigner.models.encode_qr import CompactSeedQrEncoder, SeedQrEncoder
+from seedsigner.models.qr_type import QRType
+from seedsigner.models.settings import SettingsConstants
+from urtypes.crypto import PSBT as UR_PSBT
+
+"""
+Measures per-frame `DecodeQR` latency for each QRType.
+
+For each format this times:
+* `classify`: `DecodeQR.detect_segment_type` on its own.
+* `1st frame`: `add_data` on a fresh `DecodeQR` (full classifier + decoder).
+* `locked`: `add_data` for the remaining frames of an animated QR, once the QRType
+    is known and the fast path applies.
+
+tldr:
+    pip3 install -e .
+    cd tools
+    python3 qr_decode_benchmark.py -h
+"""
+
+MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about".split()
+
+
+def generate_psbt(num_outputs: int) -> PSBT:
+    root = bip32.HDKey.from_seed(bip39.mnemonic_to_seed(" ".join(MNEMONIC)))
+    pubkey = root.derive("m/84h/0h/0h/0/0").key.get_public_key()
+    tx = Transaction(
+        vin=[TransactionInput(os.urandom(32), 0)],
+        vout=[TransactionOutput(1000 + i, p2wpkh(pubkey)) for i in range(num_outputs)],
+    )
+    return PSBT(tx)
+
+
+def generate_samples(num_outputs: int, fragment_size: int) -> dict[str, list]:
+    psbt = generate_psbt(num_outputs)
+    base64_psbt = psbt.to_string()
+
+    encoder = UREncoder(ur=UR("crypto-psbt", UR_PSBT(psbt.serialize()).to_cbor()), max_fragment_len=fragment_size)
+    ur_parts = [encoder.next_part().upper() for i in range(encoder.fountain_encoder.seq_len())]
+
+    specter_chunks = [base64_psbt[i:i + 4 * fragment_size] for i in range(0, len(base64_psbt), 4 * fragment_size)]
+    specter_parts = [f"p{i + 1}of{len(specter_chunks)} {chunk}" for i, chunk in enumerate(specter_chunks)]
+
+    return {
+        QRType.PSBT__UR2: ur_parts,
+        QRType.PSBT__SPECTER: specter_parts,
+        QRType.PSBT__BASE64: [base64_psbt],
+        QRType.SEED__SEEDQR: [SeedQrEncoder(mnemonic=MNEMONIC).next_part()],
+        QRType.SEED__COMPACTSEEDQR: [CompactSeedQrEncoder(mnemonic=MNEMONIC).next_part()],
+        QRType.SEED__MNEMONIC: [" ".join(MNEMONIC)],
+        QRType.SEED__FOUR_LETTER_MNEMONIC: [" ".join(word[:4] for word in MNEMONIC)],
+        QRType.SETTINGS: ["settings::v1 name=Benchmark"],
+        QRType.BITCOIN_ADDRESS: ["bc1qcr8te4kr609gcawutmrza0j4xv80jy8z306fyu"],
+        QRType.SIGN_MESSAGE: ["signmessage m/84h/0h/0h/0/0 ascii:benchmark"],
+    }
+
+
+def time_ms(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for i in range(repeat):
+        func()
+    return 1000 * (time.perf_counter() - start) / repeat
+
+
+def benchmark(qr_type: str, parts: list, repeat: int):
+    classify = sum(time_ms(lambda: DecodeQR.detect_segment_type(part, wordlist_language_code=SettingsConstants.WORDLIST_LANGUAGE__ENGLISH), repeat) for part in parts) / len(parts)
+    first_frame = time_ms(lambda: DecodeQR().add_data(parts[0]), repeat)
+
+    locked = None
+    if len(parts) > 1:
+        elapsed = 0
+        for i in range(repeat):
+            decoder = DecodeQR()
+            decoder.add_data(parts[0])
+            start = time.perf_counter()
+            for part in parts[1:]:
+                decoder.add_data(part)
+            elapsed += time.perf_counter() - start
+        locked = 1000 * elapsed / repeat / (len(parts) - 1)
+
+    detected = DecodeQR.detect_segment_type(parts[0], wordlist_language_code=SettingsConstants.WORDLIST_LANGUAGE__ENGLISH)
+    if detected != qr_type:
+        print(f"warning: {qr_type} sample detected as {detected}")
+
+    locked_str = f"{locked:8.3f}" if locked is not None else f"{'-':>8}"
+    print(f"{qr_type:>28} {len(parts):>6} {classify:10.3f} {first_frame:10.3f} {locked_str}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SeedSigner QR decode latency benchmark")
+    parser.add_argument('-o', '--num-outputs', type=int, default=20, help="Number of outputs in the (synthetic) PSBT")
+    parser.add_argument('-f', '--fragment-size', type=int, default=30, help="UR fragment size (LOW: 10, MEDIUM: 30, HIGH: 120)")
+    parser.add_argument('-r', '--repeat', type=int, default=20, help="Number of times to repeat each measurement")
+    args = parser.parse_args()
+
+    print(f"{'QRType':>28} {'frames':>6} {'classify':>10} {'1st frame':>10} {'locked':>8}   (ms/frame)")
+    for qr_type, parts in generate_samples(args.num_outputs, args.fragment_size).items():
+        benchmark(qr_type, parts, args.repeat)
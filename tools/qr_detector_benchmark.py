@@ -0,0 +1,87 @@
+import argparse
+import os
+import random
+
+from PIL import Image, ImageFilter
+
+from seedsigner.helpers import qr_detectors
+from seedsigner.helpers.qr import QR
+from seedsigner.helpers.ur2.ur import UR
+from seedsigner.helpers.ur2.ur_encoder import UREncoder
+from seedsigner.models.settings import Settings, SettingsConstants
+from urtypes.crypto import PSBT as UR_PSBT
+
+"""
+Benchmarks each locally installed QR detector engine (zbar, OpenCV, zxing-cpp) on a
+synthetic reference corpus of UR PSBT frames and reports frames/sec and success rate.
+
+The corpus approximates what the camera sees: the QR shown on another device's
+screen, scaled into a 480x480 frame, slightly rotated and out of focus.
+
+Install the optional engines with e.g. `pip3 install opencv-python-headless` or
+`pip3 install zxing-cpp`.
+
+With `--save`, the best engine is written to the persistent settings (which must be
+enabled) and used by SeedSigner from its next start.
+
+tldr:
+    pip3 install -e .
+    cd tools
+    python3 qr_detector_benchmark.py -h
+"""
+
+
+def generate_corpus(num_frames: int, fragment_size: int, blur: float, max_rotation: float) -> list:
+    random.seed(0)
+    ur = UR("crypto-psbt", UR_PSBT(os.urandom(2000)).to_cbor())
+    encoder = UREncoder(ur=ur, max_fragment_len=fragment_size)
+    qr = QR()
+
+    corpus = []
+    for i in range(num_frames):
+        part = encoder.next_part().upper()
+        image = qr.qrimage_io(part, width=240, height=240, border=2, background_color="bdbdbd").convert("L")
+
+        # Place the displayed QR somewhere in a 480x480 camera frame
+        size = random.randint(280, 440)
+        image = image.resize((size, size), Image.Resampling.BILINEAR)
+        image = image.rotate(random.uniform(-max_rotation, max_rotation), resample=Image.Resampling.BILINEAR, expand=True, fillcolor=64)
+        frame = Image.new("L", (480, 480), 64)
+        frame.paste(image, ((480 - image.width) // 2, (480 - image.height) // 2))
+        if blur:
+            frame = frame.filter(ImageFilter.GaussianBlur(blur))
+
+        corpus.append((frame, part.encode()))
+    return corpus
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SeedSigner QR detector engine benchmark")
+    parser.add_argument('-n', '--num-frames', type=int, default=50, help="Number of frames in the reference corpus")
+    parser.add_argument('-f', '--fragment-size', type=int, default=120, help="UR fragment size (LOW: 10, MEDIUM: 30, HIGH: 120)")
+    parser.add_argument('-b', '--blur', type=float, default=1.0, help="Gaussian blur radius applied to each frame")
+    parser.add_argument('-r', '--rotation', type=float, default=10.0, help="Max rotation (degrees) applied to each frame")
+    parser.add_argument('-s', '--save', action="store_true", help=f"Save the best engine to {Settings.SETTINGS_FILENAME}")
+    args = parser.parse_args()
+
+    available = qr_detectors.get_available_detectors()
+    if not available:
+        print("No QR detector engines are installed")
+        exit(1)
+
+    corpus = generate_corpus(args.num_frames, args.fragment_size, args.blur, args.rotation)
+    print(f"{len(corpus)} frames, {len(corpus[0][1])} chars/frame; engines: {', '.join(available)}\n")
+
+    results = qr_detectors.select_fastest_detector(corpus)
+    for result in results:
+        print(f"{result.name:>10}: {result.frames_per_second:7.1f} frames/sec, {100 * result.success_rate:5.1f}% decoded")
+    print(f"\nBest engine: {results[0].name}")
+
+    if args.save:
+        settings = Settings.get_instance()
+        if settings.get_value(SettingsConstants.SETTING__PERSISTENT_SETTINGS) != SettingsConstants.OPTION__ENABLED:
+            print(f"Persistent settings are disabled; not saved to {Settings.SETTINGS_FILENAME}")
+            exit(1)
+        settings.set_value(SettingsConstants.SETTING__QR_DETECTOR, results[0].name)
+        settings.save()
+        print(f"Saved to {Settings.SETTINGS_FILENAME}")
@@ -0,0 +1,61 @@
+import argparse
+
+import qrcode
+
+from seedsigner.helpers.qr import QRSymbolLayout
+from seedsigner.helpers.ur2.ur import UR
+from seedsigner.helpers.ur2.ur_encoder import UREncoder
+from seedsigner.models.encode_qr import UrPsbtQrEncoder
+from seedsigner.models.settings import SettingsConstants
+from urtypes.crypto import PSBT as UR_PSBT
+
+from qr_decode_benchmark import generate_psbt
+
+"""
+Compares frames-per-PSBT for the animated UR PSBT QR at each density: the old fixed
+fragment sizes versus fragments sized to fill each density's QR version (the larger of
+its minimum version and the one the old fragment size needed).
+
+For each PSBT size this prints the number of frames in one pass through the pure
+fragments (`seq_len`) and the range of QR versions those frames render at.
+
+tldr:
+    pip3 install -e .
+    cd tools
+    python3 qr_fragment_size_benchmark.py -h
+"""
+
+# The fixed fragment sizes `BaseFountainQrEncoder` used before
+LEGACY_FRAGMENT_SIZES = UrPsbtQrEncoder.LEGACY_FRAGMENT_LEN_BY_DENSITY
+
+
+def qr_version(part: str) -> int:
+    qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_L)
+    qr.add_data(part)
+    return QRSymbolLayout.fit_version(qr.data_list, qrcode.constants.ERROR_CORRECT_L)
+
+
+def describe(ur2_encode: UREncoder) -> str:
+    seq_len = ur2_encode.fountain_encoder.seq_len()
+    # Pure fragments plus one loop's worth of mixed parts, as displayed
+    versions = [qr_version(ur2_encode.part_at(seq_num).upper()) for seq_num in range(1, 2 * seq_len + 1)]
+    version_str = f"v{min(versions)}" if min(versions) == max(versions) else f"v{min(versions)}-{max(versions)}"
+    return f"{seq_len:>6} {version_str:>7}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SeedSigner animated QR fragment sizing comparison")
+    parser.add_argument('-o', '--num-outputs', type=int, nargs='+', default=[1, 2, 5, 10, 20, 50, 100], help="Number of outputs in each (synthetic) PSBT")
+    args = parser.parse_args()
+
+    print(f"{'outputs':>7} {'bytes':>6} {'density':>7}   {'before':>14}   {'after':>14}   {'saved':>5}")
+    for num_outputs in args.num_outputs:
+        psbt = generate_psbt(num_outputs)
+        ur = UR("crypto-psbt", UR_PSBT(psbt.serialize()).to_cbor())
+        for qr_density in [SettingsConstants.DENSITY__LOW, SettingsConstants.DENSITY__MEDIUM, SettingsConstants.DENSITY__HIGH]:
+            before = UREncoder(ur=ur, max_fragment_len=LEGACY_FRAGMENT_SIZES[qr_density])
+            after = UrPsbtQrEncoder(psbt=psbt, qr_density=qr_density).ur2_encode
+
+            before_len = before.fountain_encoder.seq_len()
+            after_len = after.fountain_encoder.seq_len()
+            print(f"{num_outputs:>7} {len(ur.cbor):>6} {qr_density:>7}   {describe(before)}   {describe(after)}   {100 * (before_len - after_len) / before_len:4.0f}%")
@@ -0,0 +1,90 @@
+import argparse
+import os
+import shutil
+import subprocess
+import time
+from binascii import b2a_base64
+
+from PIL import Image
+
+from seedsigner.helpers.qr import QR
+from seedsigner.helpers.ur2.ur import UR
+from seedsigner.helpers.ur2.ur_encoder import UREncoder
+from urtypes.crypto import PSBT as UR_PSBT
+
+"""
+Measures animated QR rendering throughput (frames/sec) for the QR display screen.
+
+Compares the legacy `qrencode` subprocess path against the in-process encoder in
+`QR.qrimage_io`. The subprocess numbers are only available where the `qrencode` CLI is
+installed (e.g. on the Pi itself).
+
+tldr:
+    pip3 install -e .
+    cd tools
+    python3 qr_render_benchmark.py -h
+"""
+
+
+def qrencode_subprocess_image(data, width=240, height=240, border=3, background_color="808080"):
+    """ The pre-optimization `QR.qrimage_io` implementation """
+    cmd = f"""qrencode -m {border} -s 3 -l L --foreground=000000 --background={background_color} -t PNG -o "/tmp/qrcode.png" "{str(data)}" """
+    subprocess.call(cmd, shell=True)
+    return Image.open("/tmp/qrcode.png").resize((width, height), Image.Resampling.NEAREST).convert("RGBA")
+
+
+def qrencode_subprocess_matrix(data) -> bytes:
+    """ Module matrix as rendered by the `qrencode` CLI; 1 = dark """
+    subprocess.call(f"""qrencode -m 0 -s 1 -l L -t PNG -o "/tmp/qrcode.png" "{str(data)}" """, shell=True)
+    image = Image.open("/tmp/qrcode.png").convert("L")
+    return bytes(1 if pixel < 128 else 0 for pixel in image.getdata())
+
+
+def generate_parts(psbt_size: int, fragment_size: int, num_parts: int) -> list[str]:
+    ur = UR("crypto-psbt", UR_PSBT(os.urandom(psbt_size)).to_cbor())
+    encoder = UREncoder(ur=ur, max_fragment_len=fragment_size)
+    return [encoder.next_part().upper() for i in range(num_parts)]
+
+
+def benchmark(label: str, render, parts: list[str]):
+    start = time.perf_counter()
+    for part in parts:
+        render(part, 240, 240, 2, background_color="bdbdbd")
+    elapsed = time.perf_counter() - start
+    print(f"{label:>14}: {len(parts) / elapsed:7.1f} frames/sec ({1000 * elapsed / len(parts):6.2f} ms/frame)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SeedSigner animated QR rendering benchmark")
+    parser.add_argument('-s', '--psbt-size', type=int, default=2000, help="Size of the (random) PSBT payload in bytes")
+    parser.add_argument('-f', '--fragment-size', type=int, default=30, help="UR fragment size (LOW: 10, MEDIUM: 30, HIGH: 120)")
+    parser.add_argument('-n', '--num-frames', type=int, default=100, help="Number of animated frames to render")
+    parser.add_argument('--verify', action="store_true", default=False, help="Confirm every frame matches the `qrencode` CLI's symbol module-for-module")
+    args = parser.parse_args()
+
+    parts = generate_parts(args.psbt_size, args.fragment_size, args.num_frames)
+    qr = QR()
+    has_qrencode = shutil.which("qrencode") is not None
+
+    print(f"{args.num_frames} frames, {len(parts[0])} chars/frame\n")
+    if has_qrencode:
+        benchmark("qrencode", qrencode_subprocess_image, parts)
+    else:
+        print("qrencode CLI not found; skipping the subprocess baseline")
+    benchmark("in-process", qr.qrimage_io, parts)
+
+    if args.verify:
+        if not has_qrencode:
+            print("\n--verify requires the qrencode CLI")
+            exit(1)
+        # Also check Specter-style base64 PSBT parts; they're mostly 8-bit, which is
+        # where the segmentation gets interesting.
+        base64_psbt = b2a_base64(os.urandom(args.psbt_size), newline=False).decode()
+        chunk_len = 4 * args.fragment_size
+        chunks = [base64_psbt[i:i + chunk_len] for i in range(0, len(base64_psbt), chunk_len)]
+        verify_parts = parts + [f"p{i + 1}of{len(chunks)} {chunk}" for i, chunk in enumerate(chunks)]
+
+        mismatches = sum(1 for part in verify_parts if qr.qrmatrix(part)[1] != qrencode_subprocess_matrix(part))
+        print(f"\n{len(verify_parts) - mismatches}/{len(verify_parts)} frames identical to qrencode")
+        if mismatches:
+            exit(1)
@@ -0,0 +1,314 @@
+import argparse
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# ScanScreen's module pulls in the display and GPIO drivers; stand them in so that the
+# decode path can run without a Pi. These must precede any SeedSigner imports.
+sys.modules['seedsigner.hardware.ST7789'] = MagicMock()
+sys.modules['RPi'] = MagicMock()
+sys.modules['RPi.GPIO'] = MagicMock()
+
+import numpy as np
+from embit.psbt import PSBT
+from PIL import Image, ImageFilter
+
+from seedsigner.gui.screens.scan_screens import ScanScreen
+from seedsigner.models.decode_qr import DecodeQR, DecodeQRStatus
+from seedsigner.models.encode_qr import BaseSimpleAnimatedQREncoder, SpecterXPubQrEncoder, UrPsbtQrEncoder, UrXpubQrEncoder
+from seedsigner.models.qr_decode_pool import QRDecodePool
+from seedsigner.models.seed import Seed
+from seedsigner.models.settings import SettingsConstants
+from seedsigner.models.threads import ThreadsafeCounter
+
+from qr_decode_benchmark import MNEMONIC, generate_psbt
+
+"""
+Replays recorded or synthetic camera frames through the real `ScanScreen` decode loop
+(and so `DecodeQR`, the `QRSearchLadder` and, optionally, the `QRDecodePool`) with a
+stand-in for the `Camera`. No Pi or camera needed.
+
+Frame sources:
+* a directory of PNGs (replayed in filename order)
+* a video file (requires `pip3 install opencv-python-headless`)
+* synthetic frames rendered from the `encode_qr` encoders (plus a Specter PSBT
+    one) with configurable blur, noise and frame drop. Use `--save` to keep them as a
+    PNG directory for later.
+
+Reports, per QRType: decode fps, per-frame latency percentiles, frames-to-complete
+and the miss rate (frames in which no QR was found).
+
+Scanning needs a QR detector engine installed (zbar via `pyzbar` by default).
+
+tldr:
+    pip3 install -e .
+    cd tools
+    python3 scan_replay.py -h
+"""
+
+FORMATS = ["ur-psbt", "ur-xpub", "specter-psbt"]
+
+
+
+@dataclass
+class SpecterPsbtQrEncoder(BaseSimpleAnimatedQREncoder):
+    """
+    SeedSigner never displays a PSBT in Specter's `pMofN` format, but Specter Desktop
+    does; split like `SpecterXPubQrEncoder`.
+    """
+    psbt: PSBT = None
+
+    QR_VERSION_BY_DENSITY = SpecterXPubQrEncoder.QR_VERSION_BY_DENSITY
+    qr_version = SpecterXPubQrEncoder.qr_version
+
+
+    def _create_parts(self):
+        self.parts = SpecterXPubQrEncoder.split_into_parts(self.psbt.to_string(), self.qr_version)
+
+
+
+class ReplayExhausted(Exception):
+    pass
+
+
+
+class ReplayCamera:
+    """
+    Stands in for `Camera` in video stream mode. Frames are handed out in order, as
+    fast as the decode loop asks for them or, if `framerate` is set, paced like the
+    real camera: frames that arrive while the decoder is busy are skipped.
+    """
+    def __init__(self, frames: list, framerate: float = None):
+        self.frames = frames
+        self.framerate = framerate
+        self._video_stream = True
+        self._start_time = None
+        self._handed_out_at = None
+
+        # Time from handing out each frame until the loop comes back for the next one
+        self.frame_latencies = []
+        self.last_frame_seq = 0
+
+
+    def read_next_video_frame(self, after_seq: int = 0, timeout: float = None, as_image=False, image_size: tuple[int, int] = None):
+        now = time.perf_counter()
+        if self._handed_out_at is not None:
+            self.frame_latencies.append(now - self._handed_out_at)
+            self._handed_out_at = None
+
+        if self._start_time is None:
+            self._start_time = now
+
+        if self.framerate:
+            # Wait for the camera to "capture" a frame newer than `after_seq`
+            wait = self._start_time + after_seq / self.framerate - now
+            if wait > 0:
+                if timeout is not None and wait > timeout:
+                    time.sleep(timeout)
+                    return (after_seq, None)
+                time.sleep(wait)
+            frame_seq = int((time.perf_counter() - self._start_time) * self.framerate) + 1
+        else:
+            frame_seq = after_seq + 1
+
+        if frame_seq > len(self.frames):
+            raise ReplayExhausted()
+
+        self.last_frame_seq = frame_seq
+        self._handed_out_at = time.perf_counter()
+        return (frame_seq, self.frames[frame_seq - 1])
+
+
+    def stop_video_stream_mode(self):
+        self._video_stream = None
+
+
+
+class RecordingDecodeQR(DecodeQR):
+    """ Keeps the status of each frame the scan loop hands to the decoder """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statuses = []
+
+
+    def add_search_result(self, result):
+        status = super().add_search_result(result)
+        self.statuses.append(status)
+        return status
+
+
+
+def to_luma(image: Image.Image) -> np.ndarray:
+    # The camera hands the decoder just the luma plane
+    return np.asarray(image.convert("L"))
+
+
+def load_frames(path: str) -> list[np.ndarray]:
+    if os.path.isdir(path):
+        filenames = sorted(filename for filename in os.listdir(path) if filename.lower().endswith(".png"))
+        return [to_luma(Image.open(os.path.join(path, filename))) for filename in filenames]
+
+    import cv2
+    capture = cv2.VideoCapture(path)
+    frames = []
+    while True:
+        success, frame = capture.read()
+        if not success:
+            break
+        frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
+    return frames
+
+
+def make_encoder(qr_format: str, qr_density: str, num_outputs: int):
+    if qr_format == "ur-psbt":
+        return UrPsbtQrEncoder(psbt=generate_psbt(num_outputs), qr_density=qr_density)
+
+    elif qr_format == "specter-psbt":
+        return SpecterPsbtQrEncoder(psbt=generate_psbt(num_outputs), qr_density=qr_density)
+
+    return UrXpubQrEncoder(
+        seed=Seed(MNEMONIC),
+        derivation="m/48h/0h/0h/2h",
+        network=SettingsConstants.MAINNET,
+        sig_type=SettingsConstants.MULTISIG,
+        qr_density=qr_density,
+    )
+
+
+def generate_frames(encoder, num_loops: int, blur: float, noise: float, drop_rate: float, max_rotation: float = 5.0) -> list[np.ndarray]:
+    """
+    Approximates what the camera sees while another device displays `encoder`'s
+    animation: the QR scaled into a 480x480 frame, slightly rotated, out of focus and
+    with sensor noise. `drop_rate` of the displayed frames are never captured.
+    """
+    num_frames = encoder.num_frames()
+    first_frame = random.randrange(num_frames)
+
+    frames = []
+    for frame_num in range(first_frame, first_frame + num_frames * num_loops):
+        if random.random() < drop_rate:
+            continue
+
+        image = encoder.part_to_image(encoder.part_at(frame_num), 240, 240, border=2, background_color="bdbdbd").convert("L")
+        size = random.randint(280, 440)
+        image = image.resize((size, size), Image.Resampling.BILINEAR)
+        image = image.rotate(random.uniform(-max_rotation, max_rotation), resample=Image.Resampling.BILINEAR, expand=True, fillcolor=64)
+        frame = Image.new("L", (480, 480), 64)
+        frame.paste(image, ((480 - image.width) // 2, (480 - image.height) // 2))
+        if blur:
+            frame = frame.filter(ImageFilter.GaussianBlur(blur))
+
+        frame = np.asarray(frame)
+        if noise:
+            frame = np.clip(frame + np.random.normal(0, noise, frame.shape), 0, 255).astype(np.uint8)
+        frames.append(frame)
+    return frames
+
+
+def save_frames(frames: list[np.ndarray], path: str):
+    os.makedirs(path, exist_ok=True)
+    for i, frame in enumerate(frames):
+        Image.fromarray(frame, "L").save(os.path.join(path, f"{i + 1:05d}.png"))
+
+
+def replay(frames: list[np.ndarray], framerate: float = None) -> dict:
+    """ Runs `frames` through the `ScanScreen` decode loop until complete or out of frames """
+    camera = ReplayCamera(frames, framerate=framerate)
+    decoder = RecordingDecodeQR()
+
+    # Just enough of a `ScanScreen` for `_run`; the live preview isn't started.
+    screen = ScanScreen.__new__(ScanScreen)
+    screen.decoder = decoder
+    screen.camera = camera
+    screen.frames_decode_status = ThreadsafeCounter()
+    screen.frames_decoded_counter = ThreadsafeCounter()
+    screen.threads = [SimpleNamespace(decoder_fps=None)]
+    screen.hw_inputs = MagicMock(**{"check_for_low.return_value": False})
+
+    start = time.perf_counter()
+    try:
+        screen._run()
+    except ReplayExhausted:
+        pass
+    elapsed = time.perf_counter() - start
+
+    return dict(
+        qr_type=decoder.qr_type,
+        is_complete=decoder.is_complete,
+        frames_to_complete=camera.last_frame_seq if decoder.is_complete else None,
+        num_decoded=len(decoder.statuses),
+        num_misses=decoder.statuses.count(DecodeQRStatus.FALSE),
+        elapsed=elapsed,
+        latencies=camera.frame_latencies,
+    )
+
+
+def percentile(values: list[float], pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def print_report(results: list[dict]):
+    print(f"{'QRType':>20} {'runs':>5} {'done':>5} {'frames':>7} {'fps':>7} {'p50':>7} {'p90':>7} {'p99':>7} {'miss':>6}")
+
+    by_qr_type = {}
+    for result in results:
+        by_qr_type.setdefault(str(result["qr_type"]), []).append(result)
+
+    for qr_type, runs in by_qr_type.items():
+        completed = [run["frames_to_complete"] for run in runs if run["is_complete"]]
+        num_decoded = sum(run["num_decoded"] for run in runs)
+        latencies = [1000 * latency for run in runs for latency in run["latencies"]] or [0]
+
+        frames_str = f"{sum(completed) / len(completed):7.1f}" if completed else f"{'-':>7}"
+        fps = num_decoded / sum(run["elapsed"] for run in runs)
+        miss_rate = 100 * sum(run["num_misses"] for run in runs) / max(1, num_decoded)
+        print(f"{qr_type:>20} {len(runs):>5} {len(completed):>5} {frames_str} {fps:7.1f} {percentile(latencies, 50):7.2f} {percentile(latencies, 90):7.2f} {percentile(latencies, 99):7.2f} {miss_rate:5.1f}%")
+    print("\nframes: mean camera frames to complete; p50/p90/p99: ms per frame")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SeedSigner offline scan replay benchmark")
+    parser.add_argument('sources', nargs='*', help="PNG directories or video files to replay; synthetic frames if omitted")
+    parser.add_argument('-q', '--formats', nargs='+', choices=FORMATS, default=FORMATS, help="Synthetic QR formats")
+    parser.add_argument('-d', '--density', choices=[SettingsConstants.DENSITY__LOW, SettingsConstants.DENSITY__MEDIUM, SettingsConstants.DENSITY__HIGH], default=SettingsConstants.DENSITY__MEDIUM, help="Synthetic QR density")
+    parser.add_argument('-o', '--num-outputs', type=int, default=10, help="Number of outputs in the synthetic PSBT")
+    parser.add_argument('-l', '--loops', type=int, default=3, help="Number of times the synthetic animation loops")
+    parser.add_argument('-b', '--blur', type=float, default=1.0, help="Gaussian blur radius applied to synthetic frames")
+    parser.add_argument('-n', '--noise', type=float, default=8.0, help="Std dev of the sensor noise added to synthetic frames")
+    parser.add_argument('-x', '--drop', type=float, default=0.1, help="Fraction of synthetic frames that are dropped")
+    parser.add_argument('-t', '--trials', type=int, default=3, help="Synthetic runs per format")
+    parser.add_argument('-s', '--save', help="Also write the synthetic frames as PNGs under this directory")
+    parser.add_argument('-f', '--framerate', type=float, help="Pace frames like the camera (e.g. 6) instead of as fast as they're decoded")
+    parser.add_argument('-w', '--workers', type=int, default=0, help="QRDecodePool worker processes (0: decode inline, as on the Pi Zero)")
+    parser.add_argument('-r', '--seed', type=int, default=0, help="Random seed for the synthetic frames")
+    args = parser.parse_args()
+
+    decode_pool = QRDecodePool.get_instance()
+    decode_pool.num_workers = args.workers
+    decode_pool.start_server()
+
+    results = []
+    if args.sources:
+        for source in args.sources:
+            frames = load_frames(source)
+            print(f"{source}: {len(frames)} frames")
+            results.append(replay(frames, framerate=args.framerate))
+    else:
+        random.seed(args.seed)
+        np.random.seed(args.seed)
+        for qr_format in args.formats:
+            encoder = make_encoder(qr_format, args.density, args.num_outputs)
+            print(f"{qr_format}: {encoder.num_frames()} frames per loop")
+            for trial in range(args.trials):
+                frames = generate_frames(encoder, args.loops, blur=args.blur, noise=args.noise, drop_rate=args.drop)
+                if args.save:
+                    save_frames(frames, os.path.join(args.save, f"{qr_format}-{trial + 1}"))
+                results.append(replay(frames, framerate=args.framerate))
+    print()
+
+    print_report(results)